@@ -1,37 +1,37 @@
+import importlib
+import sys
 import boto3
 
 import larry.core
 from larry.types import ClientError
-from larry import s3
-from larry import mturk
-from larry import sqs
-from larry import sts
-from larry import sfn
-from larry import sagemaker
-from larry import lmbda
-from larry import iam
-from larry import textract
-from larry import dynamo
 
 __version__ = "{VERSION}"
 
+# The service modules are only imported when first accessed (PEP 562) so that `import larry` doesn't pay for
+# loading modules and creating clients for services that are never used
+_SUBMODULES = ('s3', 'mturk', 'sqs', 'sts', 'sfn', 'sagemaker', 'lmbda', 'iam', 'textract', 'dynamo')
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
+
 
 def _propagate_session():
-    s3.set_session(boto_session=__session)
-    mturk.set_session(boto_session=__session)
-    sqs.set_session(boto_session=__session)
-    sfn.set_session(boto_session=__session)
-    sts.set_session(boto_session=__session)
-    sagemaker.set_session(boto_session=__session)
-    lmbda.set_session(boto_session=__session)
-    iam.set_session(boto_session=__session)
-    textract.set_session(boto_session=__session)
-    dynamo.set_session(boto_session=__session)
+    # Modules that haven't been loaded yet will pick up the package session on first use
+    for name in _SUBMODULES:
+        module = sys.modules.get(f'{__name__}.{name}')
+        if module is not None:
+            module.set_session(boto_session=__session)
 
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-_propagate_session()
+# A local instance of the boto3 session to use, created on first use
+__session = None
 
 
 def session():
@@ -60,5 +60,3 @@ def set_session(aws_access_key_id=None,
     global __session
     __session = boto_session if boto_session is not None else boto3.session.Session(**larry.core.copy_non_null_keys(locals()))
     _propagate_session()
-
-
@@ -5,13 +5,24 @@ import csv
 import itertools
 from collections.abc import Mapping
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-# Local DynamoDB resource object
-__resource = __session.resource('dynamodb')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local DynamoDB resource object, created on first use
+__resource = None
 
 
-def _get_resource(): return __resource
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_resource():
+    global __resource
+    if __resource is None:
+        __resource = _get_session().resource('dynamodb')
+    return __resource
 
 
 def set_session(aws_access_key_id=None,
@@ -33,7 +44,7 @@ def set_session(aws_access_key_id=None,
     global __session, __resource
     __session = boto_session if boto_session is not None else boto3.session.Session(
         **larry.core.copy_non_null_keys(locals()))
-    __resource = __session.resource('dynamodb')
+    __resource = None
 
 
 class Table(ResourceWrapper):
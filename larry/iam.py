@@ -6,22 +6,36 @@ from botocore.exceptions import ClientError
 from larry import sts
 
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-# Local IAM resource object
-__resource = __session.resource('iam')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local IAM resource object, created on first use
+__resource = None
 
 
 def __getattr__(name):
     if name == 'session':
-        return __session
+        return _get_session()
     elif name == 'client':
-        return __resource.meta.client
+        return _get_resource().meta.client
     elif name == 'resource':
-        return __resource
+        return _get_resource()
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_resource():
+    global __resource
+    if __resource is None:
+        __resource = _get_session().resource('iam')
+    return __resource
+
+
 def set_session(aws_access_key_id=None,
                 aws_secret_access_key=None,
                 aws_session_token=None,
@@ -40,7 +54,7 @@ def set_session(aws_access_key_id=None,
     """
     global __session, __resource
     __session = boto_session if boto_session is not None else boto3.session.Session(**larry.core.copy_non_null_keys(locals()))
-    __resource = __session.resource('iam')
+    __resource = None
 
 
 def __assume_role_service_policy(service):
@@ -68,7 +82,7 @@ def iter_roles(path_prefix=None):
         params['PathPrefix'] = path_prefix
     remaining_results = True
     while remaining_results:
-        response = __resource.meta.client.list_roles(**params)
+        response = _get_resource().meta.client.list_roles(**params)
         for rl in response.get('Roles', []):
             yield rl
         remaining_results = response.get('IsTruncated', False)
@@ -82,9 +96,9 @@ def policy(name_or_arn):
     :return: A boto3 Policy object
     """
     if name_or_arn.startswith('arn:aws:iam'):
-        return __resource.Policy(name_or_arn)
+        return _get_resource().Policy(name_or_arn)
     else:
-        return __resource.Policy('arn:aws:iam::{}:policy/{}'.format(sts.account_id(), name_or_arn))
+        return _get_resource().Policy('arn:aws:iam::{}:policy/{}'.format(sts.account_id(), name_or_arn))
 
 
 def get_policy_if_exists(name):
@@ -110,7 +124,7 @@ def role(name):
     :param name: A name associated with the role
     :return: A boto3 Role object
     """
-    return __resource.Role(name)
+    return _get_resource().Role(name)
 
 
 def get_role_if_exists(name):
@@ -138,7 +152,7 @@ def create_service_role(name, service, policies=None):
     :param policies: Policy or policies to attach to the role
     :return: ARN for the created role
     """
-    r = __resource.create_role(RoleName=name,
+    r = _get_resource().create_role(RoleName=name,
                                AssumeRolePolicyDocument=__assume_role_service_policy(service))
     if policies:
         if isinstance(policies, list):
@@ -195,7 +209,7 @@ def create_policy(name, document, path=None, description=None):
     })
     if isinstance(document, Mapping):
         params['PolicyDocument'] = json.dumps(document)
-    return __resource.create_policy(**params).arn
+    return _get_resource().create_policy(**params).arn
 
 
 def create_or_update_policy(name, document, path=None, description=None):
@@ -263,7 +277,7 @@ def detach_policies_from_role(name):
 
 
 def aws_policies():
-    return __resource.policies.filter(Scope="AWS")
+    return _get_resource().policies.filter(Scope="AWS")
 
 
 def aws_policy_defaults():
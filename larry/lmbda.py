@@ -18,9 +18,10 @@ import subprocess
 import sys
 import os
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-client = __session.client('lambda')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local client, created on first use
+__client = None
 
 INVOKE_TYPE_REQUEST_RESPONSE = 'RequestResponse'
 INVOKE_TYPE_DRY_RUN = 'DryRun'
@@ -68,13 +69,24 @@ LAMBDA_INSTALLED = {
 
 def __getattr__(name):
     if name == 'session':
-        return __session
+        return _get_session()
     elif name == 'client':
-        return client
+        return _get_client()
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-def __get_client(): return client
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_client():
+    global __client
+    if __client is None:
+        __client = _get_session().client('lambda')
+    return __client
 
 
 def set_session(aws_access_key_id=None,
@@ -93,10 +105,10 @@ def set_session(aws_access_key_id=None,
     :param boto_session: An existing session to use
     :return: None
     """
-    global __session, client
+    global __session, __client
     __session = boto_session if boto_session is not None else boto3.session.Session(
         **larry.core.copy_non_null_keys(locals()))
-    client = __session.client('lambda')
+    __client = None
 
 
 def get(name):
@@ -170,9 +182,9 @@ def create(name, package, handler, role, runtime=RUNTIME_PYTHON_3_8, timeout=Non
         params['MemorySize'] = memory_size
     if layers:
         params['Layers'] = layers
-    lmbda = Lambda.from_create(client.create_function(**params))
+    lmbda = Lambda.from_create(_get_client().create_function(**params))
     if await_active:
-        waiter = client.get_waiter('function_active')
+        waiter = _get_client().get_waiter('function_active')
         waiter.wait(FunctionName=name)
     return lmbda
 
@@ -395,9 +407,9 @@ def update_code(name, package, publish=True, dry_run=False, await_updated=False)
     else:
         params['ZipFile'] = package
 
-    lmbda = Lambda.from_create(client.update_function_code(**params))
+    lmbda = Lambda.from_create(_get_client().update_function_code(**params))
     if await_updated:
-        waiter = client.get_waiter('function_updated')
+        waiter = _get_client().get_waiter('function_updated')
         waiter.wait(FunctionName=name)
     return lmbda
 
@@ -429,9 +441,9 @@ def update_config(name, handler=None, role=None, runtime='python3.8', timeout=No
     })
     if not is_arn(role):
         config_params["Role"] = iam.role(role).arn
-    lmbda = Lambda.from_create(client.update_function_configuration(**config_params))
+    lmbda = Lambda.from_create(_get_client().update_function_configuration(**config_params))
     if await_updated:
-        waiter = client.get_waiter('function_updated')
+        waiter = _get_client().get_waiter('function_updated')
         waiter.wait(FunctionName=name)
     return lmbda
 
@@ -441,7 +453,7 @@ def delete(name):
     Delete the function with the provided name
     :param name: The name or ARN of the function
     """
-    client.delete_function(FunctionName=name)
+    _get_client().delete_function(FunctionName=name)
 
 
 def as_function(name, o_type=dict):
@@ -479,10 +491,10 @@ def invoke(name, payload=None, invoke_type=INVOKE_TYPE_REQUEST_RESPONSE, include
             params['Payload'] = payload
     if include_logs:
         params['LogType'] = 'Tail'
-        resp = client.invoke(**params)
+        resp = _get_client().invoke(**params)
         return resp['Payload'], base64.b64decode(resp['LogResult']).decode('utf-8').split('\n')
     else:
-        resp = client.invoke(**params)
+        resp = _get_client().invoke(**params)
         return resp['Payload']
 
 
@@ -588,7 +600,7 @@ class Lambda(UserDict):
 
     @classmethod
     def get(cls, name):
-        response = client.get_function(FunctionName=name)
+        response = _get_client().get_function(FunctionName=name)
         result = cls(response['Configuration'])
         if 'Code' in response:
             result['Code'] = response['Code']
@@ -20,14 +20,10 @@ from urllib.parse import urlencode
 
 # Indicate if we are working in production or sandbox
 __production = True
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-# Local client
-client = __session.client(
-    service_name='mturk',
-    region_name='us-east-1',
-    endpoint_url="https://mturk-requester.us-east-1.amazonaws.com"
-)
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local client, created on first use
+__client = None
 
 PRODUCTION = 'production'
 SANDBOX = 'sandbox'
@@ -58,10 +54,31 @@ def set_session(aws_access_key_id=None, aws_secret_access_key=None, aws__session
     :param boto_session: An existing session to use
     :return: None
     """
-    global __session, client
+    global __session, __client
     __session = boto_session if boto_session else boto3.session.Session(**larry.core.copy_non_null_keys(locals()))
     s3.set_session(boto_session=__session)
-    __create_client()
+    __client = None
+
+
+def __getattr__(name):
+    if name == 'session':
+        return _get_session()
+    elif name == 'client':
+        return _get_client()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_client():
+    if __client is None:
+        __create_client()
+    return __client
 
 
 def __create_client():
@@ -69,15 +86,15 @@ def __create_client():
     Helper function to build an MTurk client. The client will use the current environment in use by the library,
     production or sandbox.
     """
-    global client, __production, __session
+    global __client, __production
     endpoint = "https://mturk-requester.us-east-1.amazonaws.com" if __production \
         else "https://mturk-requester-sandbox.us-east-1.amazonaws.com"
-    client = __session.client(
+    __client = _get_session().client(
         service_name='mturk',
         region_name='us-east-1',
         endpoint_url=endpoint
     )
-    client.production = __production
+    __client.production = __production
 
 
 def use_production():
@@ -85,7 +102,7 @@ def use_production():
     Indicate that the library should use the production MTurk environment.
     :return: None
     """
-    global __production, client
+    global __production
     __production = True
     __create_client()
 
@@ -95,7 +112,7 @@ def use_sandbox():
     Indicate that the library should use the sandbox MTurk environment.
     :return: None
     """
-    global __production, client
+    global __production
     __production = False
     __create_client()
 
@@ -123,7 +140,7 @@ def set_environment(environment=PRODUCTION, hit_id=None, assignment_id=None):
         except ClientError as e:
             return e, None
 
-    global client, __production, __session
+    global __production
     existing_production = __production
     if hit_id:
 
@@ -195,7 +212,7 @@ def environment():
 # TODO Review how someone would use this to see if supporting iterables or other object types makes sense
 def accept_qualification_request(request_id, value=None):
     params = larry.core.map_parameters(locals(), {'request_id': 'QualificationRequestId', 'value': 'IntegerValue'})
-    client.accept_qualification_request(**params)
+    _get_client().accept_qualification_request(**params)
 
 
 def approve(assignment, feedback=None, override_rejection=None):
@@ -205,7 +222,7 @@ def approve(assignment, feedback=None, override_rejection=None):
             '_feedback': 'RequesterFeedback',
             '_override_rejection': 'OverrideRejection'
         })
-        client.approve_assignment(**params)
+        _get_client().approve_assignment(**params)
 
     if isinstance(assignment, str):
         _approve_assignment(assignment, feedback, override_rejection)
@@ -240,7 +257,7 @@ def assign_qualification(qualification, worker_id, value=None, send_notification
             'value': 'IntegerValue',
             'send_notification': 'SendNotification'
         })
-        client.associate_qualification_with_worker(QualificationTypeId=qualification_type_id, **params)
+        _get_client().associate_qualification_with_worker(QualificationTypeId=qualification_type_id, **params)
 
 
 associate_qualification_with_worker = assign_qualification
@@ -252,7 +269,7 @@ def add_assignments(hit_id, additional_assignments, request_token=None):
         'additional_assignments': 'NumberOfAdditionalAssignments',
         'request_token': 'UniqueRequestToken'
     })
-    client.create_additional_assignments_for_hit(**params)
+    _get_client().create_additional_assignments_for_hit(**params)
 
 
 create_additional_assignments_for_hit = add_assignments
@@ -326,10 +343,10 @@ def create_hit(title=None,
         params['Question'] = render_jinja_template_question(template_context, template_uri=question_template_uri)
 
     if hit_type_id:
-        return HIT(client.create_hit_with_hit_type(**params).get('HIT'),
+        return HIT(_get_client().create_hit_with_hit_type(**params).get('HIT'),
                    production=__production)
     else:
-        return HIT(client.create_hit(**params).get('HIT'),
+        return HIT(_get_client().create_hit(**params).get('HIT'),
                    production=__production)
 
 
@@ -352,7 +369,7 @@ def create_hit_type(title,
     })
     if reward_cents:
         params['Reward'] = str(reward_cents / 100)
-    return client.create_hit_type(**params).get('HITTypeId')
+    return _get_client().create_hit_type(**params).get('HITTypeId')
 
 
 def _get_assignment(assignment_id):
@@ -363,7 +380,7 @@ def _get_assignment(assignment_id):
     :param assignment_id: The assignment to retrieve
     :return: A tuple of assignment and hit dicts
     """
-    response = client.get_assignment(AssignmentId=assignment_id)
+    response = _get_client().get_assignment(AssignmentId=assignment_id)
     return response['Assignment'], response['HIT']
 
 
@@ -380,11 +397,11 @@ def get_assignment(assignment_id):
 
 
 def get_account_balance():
-    return float(client.get_account_balance()['AvailableBalance'])
+    return float(_get_client().get_account_balance()['AvailableBalance'])
 
 
 def _get_hit(hit_id):
-    return client.get_hit(HITId=hit_id)['HIT'], __production
+    return _get_client().get_hit(HITId=hit_id)['HIT'], __production
 
 
 def get_hit(hit_id):
@@ -419,10 +436,10 @@ def list_assignments_for_hit(hit_id, submitted=True, approved=True, rejected=Tru
     next_token = None
     while pages_to_get:
         if next_token:
-            response = client.list_assignments_for_hit(HITId=hit_id, NextToken=next_token,
+            response = _get_client().list_assignments_for_hit(HITId=hit_id, NextToken=next_token,
                                                        AssignmentStatuses=statuses)
         else:
-            response = client.list_assignments_for_hit(HITId=hit_id, AssignmentStatuses=statuses)
+            response = _get_client().list_assignments_for_hit(HITId=hit_id, AssignmentStatuses=statuses)
         if response.get('NextToken'):
             next_token = response['NextToken']
         else:
@@ -442,9 +459,9 @@ def list_hits():
     next_token = None
     while pages_to_get:
         if next_token:
-            response = client.list_hits(NextToken=next_token)
+            response = _get_client().list_hits(NextToken=next_token)
         else:
-            response = client.list_hits()
+            response = _get_client().list_hits()
         if response.get('NextToken'):
             next_token = response['NextToken']
         else:
@@ -467,7 +484,7 @@ def create_qualification_type(name, description, keywords=None, status='Active',
         'auto_granted': 'AutoGranted',
         'auto_granted_value': 'AutoGrantedValue'
     })
-    response = client.create_qualification_type(**params)
+    response = _get_client().create_qualification_type(**params)
     return response['QualificationType']['QualificationTypeId']
 
 
@@ -480,7 +497,7 @@ def assign_qualification(qualification_type_id, worker_id, value=None, send_noti
     })
     if value:
         params['IntegerValue'] = value
-    return client.associate_qualification_with_worker(**params)
+    return _get_client().associate_qualification_with_worker(**params)
 
 
 # TODO: Add methods for multiple applications
@@ -490,7 +507,7 @@ def remove_qualification(qualification_type_id, worker_id, reason=None):
         'worker_id': 'WorkerId',
         'reason': 'Reason'
     })
-    return client.disassociate_qualification_from_worker(**params)
+    return _get_client().disassociate_qualification_from_worker(**params)
 
 
 def preview_url(hit_type_id, prod=None):
@@ -527,7 +544,7 @@ def add_notification(hit_type_id, destination, event_types):
     :param destination: An SNS ARN or a SQS URL
     :param event_types: A list of event types to trigger messages on; valid types are:
     """
-    client.update_notification_settings(
+    _get_client().update_notification_settings(
         HITTypeId=hit_type_id,
         Notification={
             'Destination': destination,
@@ -540,7 +557,7 @@ def add_notification(hit_type_id, destination, event_types):
 
 
 def update_expiration(hit_id, expire_at):
-    client.update_expiration_for_hit(HITId=hit_id, ExpireAt=expire_at)
+    _get_client().update_expiration_for_hit(HITId=hit_id, ExpireAt=expire_at)
 
 
 def expire_hit(hit_id):
@@ -571,7 +588,7 @@ def list_workers_with_qualification_type(qualification_type_id,
     while pages_to_get:
         if next_token:
             params['NextToken'] = next_token
-        response = client.list_workers_with_qualification_type(**params)
+        response = _get_client().list_workers_with_qualification_type(**params)
         if response.get('NextToken'):
             next_token = response['NextToken']
         else:
@@ -605,7 +622,7 @@ def notify_workers(subject, message, worker_ids=None, qualification_id=None):
     worker_ids = list(worker_ids)
     failures = []
     for chunk in utils.list_chunker(worker_ids, 100):
-        response = client.notify_workers(Subject=subject, MessageText=message, WorkerIds=chunk)
+        response = _get_client().notify_workers(Subject=subject, MessageText=message, WorkerIds=chunk)
         if response:
             failures.extend(response.get('NotifyWorkersFailureStatuses', []))
     return failures if failures else None
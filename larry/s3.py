@@ -1,7 +1,10 @@
 import botocore.exceptions
+from botocore.config import Config
 import boto3
 from boto3.s3.transfer import TransferConfig
 import os
+import sys
+import threading
 import posixpath
 import re
 import uuid
@@ -9,10 +12,26 @@ import json
 import csv
 import pickle
 import mimetypes
+import codecs
+import io
 from io import StringIO, BytesIO
 import tempfile
-from collections.abc import Mapping
+from collections.abc import Mapping, Iterator
+from types import GeneratorType, ModuleType, MappingProxyType
 import warnings
+import fnmatch
+import copy as copy_module
+import functools
+from collections import OrderedDict
+import hashlib
+import zlib
+import shutil
+import sqlite3
+import heapq
+import bisect
+import atexit
+import time
+import datetime
 import larry.core
 from larry.utils.dispatch import larrydispatch
 from larry import utils
@@ -20,17 +39,50 @@ from larry import sts
 from larry import ClientError
 from larry.core import ResourceWrapper, attach_exception_handler, supported_kwargs
 from urllib import parse, request
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_STORED
 from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-# Local S3 resource object
-__resource = __session.resource('s3')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local S3 resource object, created on first use
+__resource = None
+__resource_lock = threading.Lock()
 
 URI_REGEX = re.compile("^[sS]3://([a-z0-9.-]{3,})/?(.*)")
 DEFAULT_ENCODING = "utf-8"
 DEFAULT_NEWLINE = "\n"
+# The shared client is sized to allow the bulk operations to run requests concurrently without discarding connections
+MAX_POOL_CONNECTIONS = 64
+DEFAULT_MAX_WORKERS = 32
+# The number of bytes to pull from the response body at a time when streaming an object
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Objects larger than a single part are retrieved as concurrent ranged requests
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+# S3 requires all but the last part of a multipart upload to be at least 5 MB
+MIN_PART_SIZE = 5 * 1024 * 1024
+# The largest part that can be copied with a single UploadPartCopy call
+MAX_COPY_PART_SIZE = 5 * 1024 * 1024 * 1024
+# Objects larger than this are copied with concurrent UploadPartCopy requests of this size
+DEFAULT_COPY_PART_SIZE = 128 * 1024 * 1024
+# Local directory for persistent listing indexes and caches
+DEFAULT_CACHE_DIR = os.environ.get('LARRY_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'larry'))
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024
+# The number of object snapshots retained for reuse
+MAX_SNAPSHOTS = 10000
+# The number of bytes initially retrieved to read the header of an image
+IMAGE_HEADER_SIZE = 16 * 1024
+# The number of rows in each row group of Parquet objects, each row group is uploaded as it is written
+DEFAULT_ROW_GROUP_SIZE = 1024 * 1024
+# Supported compression codecs by content encoding, with the key suffix and content type used for each
+COMPRESSION_CODECS = {
+    'gzip': ('.gz', 'application/gzip'),
+    'zstd': ('.zst', 'application/zstd'),
+    'bzip2': ('.bz2', 'application/x-bzip2'),
+    'xz': ('.xz', 'application/x-xz'),
+}
 
 ACL_PRIVATE = 'private'
 ACL_PUBLIC_READ = 'public-read'
@@ -57,7 +109,8 @@ __extension_types = {
     'sql': 'application/sql',
     'webp': 'image/webp',
     'ico': 'image/vnd.microsoft.icon',
-    'pkl': 'application/octet-stream'
+    'pkl': 'application/octet-stream',
+    'parquet': 'application/vnd.apache.parquet'
 }
 
 __content_type_to_pillow_format = {
@@ -74,15 +127,27 @@ __content_type_to_pillow_format = {
 
 def __getattr__(name):
     if name == 'resource':
-        return __resource
+        return _get_resource()
     elif name == 'session':
-        return __session
+        return _get_session()
     elif name == 'client':
-        return __resource.meta.client
+        return _get_resource().meta.client
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
 def _get_resource():
+    global __resource
+    if __resource is None:
+        with __resource_lock:
+            if __resource is None:
+                __resource = _get_session().resource('s3', config=Config(max_pool_connections=MAX_POOL_CONNECTIONS))
     return __resource
 
 
@@ -107,7 +172,7 @@ def set_session(aws_access_key_id=None,
     __session = boto_session if boto_session is not None else boto3.session.Session(
         **larry.core.copy_non_null_keys(locals()))
     sts.set_session(boto_session=__session)
-    __resource = __session.resource('s3')
+    __resource = None
 
 
 def normalize_location(*location, uri: str = None, bucket: str = None, key: str = None,
@@ -118,7 +183,7 @@ def normalize_location(*location, uri: str = None, bucket: str = None, key: str
         if len(location) > 2:
             raise TypeError('Too many location values')
         if len(location) == 1:
-            if isinstance(location[0], Object) or type(location[0]).__name__ == "s3.Object":
+            if isinstance(location[0], (Object, ObjectSummary)) or type(location[0]).__name__ == "s3.Object":
                 bucket = location[0].bucket_name
                 key = location[0].key
             elif isinstance(location[0], list) and location[0][0].startswith('s3:'):
@@ -168,6 +233,73 @@ def normalize_location(*location, uri: str = None, bucket: str = None, key: str
     return bucket, key, uri
 
 
+def _location_pair(location, bucket=None):
+    """
+    Resolves a single item passed to one of the bulk operations into a bucket and key. Items can be URIs,
+    (bucket, key) tuples, Object instances, or keys when a bucket is provided.
+    """
+    if isinstance(location, tuple):
+        b, k, _ = normalize_location(*location)
+    elif bucket is not None and isinstance(location, str) and not is_uri(location):
+        b, k, _ = normalize_location(bucket, location)
+    else:
+        b, k, _ = normalize_location(location)
+    return b, k
+
+
+def _map_locations(func, locations, bucket=None, max_workers=DEFAULT_MAX_WORKERS, ordered=False,
+                   return_exceptions=True):
+    """
+    Calls func(bucket, key) for each of the locations on a bounded thread pool and yields (location, result) tuples.
+    Only a limited number of locations are pulled from the iterable at a time so that generators such as the output
+    of list_objects can be consumed without materializing them.
+    """
+    iterator = iter(locations)
+    limit = max_workers * 2
+
+    def submit(executor, location):
+        b, k = _location_pair(location, bucket)
+        return executor.submit(func, b, k)
+
+    def result(location, future):
+        try:
+            return location, future.result()
+        except Exception as e:
+            if return_exceptions:
+                return location, e
+            raise
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if ordered:
+            pending = deque()
+            try:
+                for location in iterator:
+                    pending.append((location, submit(executor, location)))
+                    if len(pending) >= limit:
+                        yield result(*pending.popleft())
+                while pending:
+                    yield result(*pending.popleft())
+            finally:
+                for location, future in pending:
+                    future.cancel()
+        else:
+            pending = {}
+            try:
+                for location in iterator:
+                    pending[submit(executor, location)] = location
+                    if len(pending) >= limit:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield result(pending.pop(future), future)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield result(pending.pop(future), future)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
 class Object(ResourceWrapper):
     """
     Wraps the boto3 S3
@@ -190,6 +322,26 @@ class Object(ResourceWrapper):
         bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
         super().__init__(Bucket(bucket).Object(key=key))
 
+    def snapshot(self, max_age=None, tags=True, acl=True):
+        """
+        Returns an immutable record of the object's attributes, tags, and ACL, retrieved with concurrent HEAD,
+        GetObjectTagging, and GetObjectAcl requests. Snapshots are retained so that a snapshot of the same object
+        taken within `max_age` seconds is returned without sending any requests.
+
+        .. code-block:: python
+
+            import larry as lry
+            snapshot = lry.s3.Object('bucket_name', 'key').snapshot(max_age=60)
+            print(snapshot.content_length, snapshot.tags, snapshot.timestamp)
+
+        :param max_age: The age in seconds of a previous snapshot that can be reused, a new snapshot is always taken
+            if omitted
+        :param tags: If False, the tags of the object aren't retrieved
+        :param acl: If False, the ACL of the object isn't retrieved
+        :return: An ObjectSnapshot
+        """
+        return _snapshot(self.bucket_name, self.key, max_age=max_age, tags=tags, acl=acl)
+
     @property
     @attach_exception_handler
     def tags(self):
@@ -220,10 +372,12 @@ class Object(ResourceWrapper):
         Assigns the provided ACL to the object.
         """
         self.meta.client.put_object_acl(Bucket=self.bucket_name, Key=self.key, ACL=acl)
+        _forget_snapshots(self.bucket_name, [self.key])
 
     @attach_exception_handler
     def set_content_type(self, content_type):
         # TODO: Fix bug where this will wipe the ACL on the existing file
+        _forget_snapshots(self.bucket_name, [self.key])
         self.copy_from(CopySource={'Bucket': self.bucket_name, 'Key': self.key},
                        ContentType=content_type,
                        MetadataDirective='REPLACE',
@@ -255,6 +409,229 @@ class Object(ResourceWrapper):
         return f'Object(bucket="{self.bucket_name}", key="{self.key}")'
 
 
+class ObjectSummary:
+    """
+    A lightweight record of an object returned by listing a bucket, carrying the attributes included in the listing
+    without creating a boto3 resource for each object. Summaries can be passed anywhere a location is accepted and
+    converted to an Object when the full resource is needed.
+
+    .. code-block:: python
+
+        import larry as lry
+        for summary in lry.s3.list_objects('bucket_name', 'prefix/', detail=True):
+            print(summary.key, summary.size)
+
+    :param bucket_name: The S3 bucket
+    :param key: The key of the object
+    :param size: The size of the object in bytes
+    :param e_tag: The ETag of the object
+    :param last_modified: When the object was last modified
+    :param storage_class: The storage class of the object
+    """
+    __slots__ = ('bucket_name', 'key', 'size', 'e_tag', 'last_modified', 'storage_class')
+
+    def __init__(self, bucket_name, key, size=None, e_tag=None, last_modified=None, storage_class=None):
+        self.bucket_name = bucket_name
+        self.key = key
+        self.size = size
+        self.e_tag = e_tag
+        self.last_modified = last_modified
+        self.storage_class = storage_class
+
+    @classmethod
+    def from_listing(cls, bucket, content):
+        return cls(bucket, content['Key'], content.get('Size'), content.get('ETag'), content.get('LastModified'),
+                   content.get('StorageClass'))
+
+    def to_object(self):
+        """
+        Returns an Object resource for the summarized object.
+        """
+        return Object(bucket=self.bucket_name, key=self.key)
+
+    @property
+    def uri(self):
+        return join_uri(self.bucket_name, self.key)
+
+    def __eq__(self, other):
+        if not isinstance(other, ObjectSummary):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.bucket_name, self.key, self.e_tag))
+
+    def __repr__(self):
+        return f'ObjectSummary(bucket="{self.bucket_name}", key="{self.key}", size={self.size})'
+
+
+class ObjectSnapshot:
+    """
+    An immutable record of the attributes, tags, and ACL of an object at the time given by `timestamp`, created by
+    `Object.snapshot`. Objects that don't exist are recorded with `exists` set to False and the other values None.
+
+    :param bucket_name: The S3 bucket
+    :param key: The key of the object
+    :param exists: True if the object existed when the snapshot was taken
+    :param content_length: The size of the object in bytes
+    :param content_type: The content type of the object
+    :param content_encoding: The content encoding of the object
+    :param content_language: The content language of the object
+    :param e_tag: The ETag of the object
+    :param last_modified: When the object was last modified
+    :param metadata: The user metadata of the object
+    :param storage_class: The storage class of the object
+    :param server_side_encryption: The server-side encryption algorithm of the object
+    :param version_id: The version of the object
+    :param tags: A dict of the tags attached to the object, or None if they weren't retrieved
+    :param grants: The grants of the object's ACL, or None if it wasn't retrieved
+    :param owner: The owner of the object's ACL, or None if it wasn't retrieved
+    """
+    __slots__ = ('bucket_name', 'key', 'exists', 'content_length', 'content_type', 'content_encoding',
+                 'content_language', 'e_tag', 'last_modified', 'metadata', 'storage_class', 'server_side_encryption',
+                 'version_id', 'tags', 'grants', 'owner', 'timestamp', '_monotonic')
+
+    def __init__(self, bucket_name, key, exists=True, content_length=None, content_type=None, content_encoding=None,
+                 content_language=None, e_tag=None, last_modified=None, metadata=None, storage_class=None,
+                 server_side_encryption=None, version_id=None, tags=None, grants=None, owner=None):
+        values = dict(locals())
+        values.pop('self')
+        values['metadata'] = MappingProxyType(dict(metadata)) if metadata is not None else None
+        values['tags'] = MappingProxyType(dict(tags)) if tags is not None else None
+        values['grants'] = tuple(grants) if grants is not None else None
+        values['owner'] = MappingProxyType(dict(owner)) if owner is not None else None
+        values['timestamp'] = datetime.datetime.now(datetime.timezone.utc)
+        values['_monotonic'] = time.monotonic()
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_responses(cls, bucket, key, head, tagging=None, acl=None):
+        return cls(bucket, key,
+                   content_length=head.get('ContentLength'),
+                   content_type=head.get('ContentType'),
+                   content_encoding=head.get('ContentEncoding'),
+                   content_language=head.get('ContentLanguage'),
+                   e_tag=head.get('ETag'),
+                   last_modified=head.get('LastModified'),
+                   metadata=head.get('Metadata', {}),
+                   storage_class=head.get('StorageClass'),
+                   server_side_encryption=head.get('ServerSideEncryption'),
+                   version_id=head.get('VersionId'),
+                   tags={t['Key']: t['Value'] for t in tagging.get('TagSet', [])} if tagging is not None else None,
+                   grants=acl.get('Grants', []) if acl is not None else None,
+                   owner=acl.get('Owner') if acl is not None else None)
+
+    @property
+    def age(self):
+        """
+        The number of seconds since the snapshot was taken.
+        """
+        return time.monotonic() - self._monotonic
+
+    def replace(self, **changes):
+        """
+        Returns a new snapshot with the provided values replaced, timestamped at the time it's created.
+        """
+        values = {name: getattr(self, name) for name in self.__slots__ if name not in ('timestamp', '_monotonic')}
+        values.update(changes)
+        return ObjectSnapshot(**values)
+
+    def to_object(self):
+        """
+        Returns an Object resource for the object.
+        """
+        return Object(bucket=self.bucket_name, key=self.key)
+
+    @property
+    def uri(self):
+        return join_uri(self.bucket_name, self.key)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ObjectSnapshot is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('ObjectSnapshot is immutable')
+
+    def __repr__(self):
+        return f'ObjectSnapshot(bucket="{self.bucket_name}", key="{self.key}", exists={self.exists}, ' \
+               f'timestamp="{self.timestamp.isoformat()}")'
+
+
+# Snapshots of objects by bucket and key, in least to most recently taken order
+_snapshots = OrderedDict()
+_snapshots_lock = threading.Lock()
+_snapshot_executor = None
+_snapshot_executor_lock = threading.Lock()
+
+
+def _get_snapshot_executor():
+    global _snapshot_executor
+    if _snapshot_executor is None:
+        with _snapshot_executor_lock:
+            if _snapshot_executor is None:
+                _snapshot_executor = ThreadPoolExecutor(max_workers=MAX_POOL_CONNECTIONS)
+    return _snapshot_executor
+
+
+@attach_exception_handler
+def _take_snapshot(bucket, key, tags=True, acl=True):
+    """
+    Retrieves the attributes, tags, and ACL of an object with concurrent requests. The tags and ACL are retrieved
+    by a thread pool shared by all snapshots while the attributes are retrieved by the calling thread.
+    """
+    client = _get_resource().meta.client
+    executor = _get_snapshot_executor()
+    tagging = executor.submit(client.get_object_tagging, Bucket=bucket, Key=key) if tags else None
+    policy = executor.submit(client.get_object_acl, Bucket=bucket, Key=key) if acl else None
+    try:
+        head = client.head_object(Bucket=bucket, Key=key)
+    except botocore.exceptions.ClientError as e:
+        for future in [tagging, policy]:
+            if future is not None:
+                future.cancel()
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey'):
+            return ObjectSnapshot(bucket, key, exists=False)
+        raise e
+    return ObjectSnapshot.from_responses(bucket, key, head,
+                                         tagging.result() if tagging else None,
+                                         policy.result() if policy else None)
+
+
+def _snapshot(bucket, key, max_age=None, tags=True, acl=True):
+    """
+    Returns a snapshot of an object that was taken within max_age seconds and includes the tags and ACL if they're
+    requested, taking a new one if there isn't one.
+    """
+    if max_age is not None:
+        with _snapshots_lock:
+            snapshot = _snapshots.get((bucket, key))
+        if snapshot is not None and snapshot.age <= max_age and \
+                (not tags or not snapshot.exists or snapshot.tags is not None) and \
+                (not acl or not snapshot.exists or snapshot.grants is not None):
+            return snapshot
+    return _remember_snapshot(_take_snapshot(bucket, key, tags=tags, acl=acl))
+
+
+def _remember_snapshot(snapshot):
+    with _snapshots_lock:
+        _snapshots.pop((snapshot.bucket_name, snapshot.key), None)
+        _snapshots[(snapshot.bucket_name, snapshot.key)] = snapshot
+        while len(_snapshots) > MAX_SNAPSHOTS:
+            _snapshots.popitem(last=False)
+    return snapshot
+
+
+def _forget_snapshots(bucket, keys):
+    """
+    Discards the snapshots of objects that are being modified.
+    """
+    if _snapshots:
+        with _snapshots_lock:
+            for key in keys:
+                _snapshots.pop((bucket, key), None)
+
+
 class Bucket(ResourceWrapper):
     """
     Wraps the boto3 S3
@@ -392,12 +769,129 @@ def delete(*location, bucket=None, key=None, uri=None):
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
     if isinstance(key, list):
+        _forget_snapshots(bucket, key)
         Bucket(bucket=bucket).delete_objects(Delete={'Objects': [{'Key': k} for k in key], 'Quiet': True})
     else:
+        _forget_snapshots(bucket, [key])
         Object(bucket=bucket, key=key).delete()
 
 
-def size(*location, bucket=None, key=None, uri=None):
+# Error codes returned for keys in a DeleteObjects response that are retried
+_RETRYABLE_DELETE_CODES = ('SlowDown', 'InternalError', 'ServiceUnavailable')
+
+
+@attach_exception_handler
+def _delete_objects(bucket, keys):
+    return _get_resource().meta.client.delete_objects(Bucket=bucket, Delete={
+        'Objects': [{'Key': k} for k in keys],
+        'Quiet': True
+    })
+
+
+def _delete_chunk(bucket, keys, retries=3):
+    """
+    Deletes up to 1000 keys with a single DeleteObjects request, retrying any keys that are returned with a throttling
+    or internal error. Returns the number of keys deleted and the errors for any keys that couldn't be deleted.
+    """
+    _forget_snapshots(bucket, keys)
+    deleted = 0
+    errors = []
+    for attempt in range(retries + 1):
+        if attempt > 0:
+            time.sleep(0.1 * 2 ** attempt)
+        response = _delete_objects(bucket, keys)
+        failed = response.get('Errors', [])
+        deleted += len(keys) - len(failed)
+        retry = [e for e in failed if e.get('Code') in _RETRYABLE_DELETE_CODES]
+        errors.extend(e for e in failed if e.get('Code') not in _RETRYABLE_DELETE_CODES)
+        if not retry:
+            break
+        keys = [error['Key'] for error in retry]
+        if attempt == retries:
+            errors.extend(retry)
+    return deleted, [{'bucket': bucket, 'key': e['Key'], 'code': e.get('Code'), 'message': e.get('Message')}
+                     for e in errors]
+
+
+def delete_many(locations, bucket=None, max_workers=DEFAULT_MAX_WORKERS, retries=3):
+    """
+    Deletes a collection of objects using DeleteObjects requests of up to 1000 keys that are sent concurrently.
+    Keys that fail to delete because of throttling or an internal error are retried up to `retries` times, and any
+    keys that still fail are included in the summary rather than raising an error.
+
+    .. code-block:: python
+
+        import larry as lry
+        summary = lry.s3.delete_many(['s3://my-bucket/a.txt', 's3://my-bucket/b.txt'])
+        print(summary['deleted'], summary['errors'])
+
+    :param locations: An iterable of URIs, (bucket, key) tuples, Objects, or keys if a bucket is provided
+    :param bucket: The bucket of the objects if keys are provided
+    :param max_workers: The number of requests to send concurrently
+    :param retries: The number of times to retry keys that fail to delete because of throttling or an internal error
+    :return: A dict containing the number of objects deleted and a list of errors for any that couldn't be
+    """
+    summary = {'deleted': 0, 'errors': []}
+
+    def collect(future):
+        deleted, errors = future.result()
+        summary['deleted'] += deleted
+        summary['errors'].extend(errors)
+
+    # the keys are gathered into chunks by bucket and only a limited number of chunks are in flight at once so
+    # that generators such as the output of list_objects can be deleted without materializing them
+    chunks = {}
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit(b, keys):
+            while len(pending) >= max_workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    collect(future)
+            pending.add(executor.submit(_delete_chunk, b, keys, retries))
+
+        for location in locations:
+            b, k = _location_pair(location, bucket)
+            keys = chunks.setdefault(b, [])
+            keys.append(k)
+            if len(keys) == 1000:
+                submit(b, chunks.pop(b))
+        for b, keys in chunks.items():
+            submit(b, keys)
+        for future in pending:
+            collect(future)
+    return summary
+
+
+def delete_prefix(*location, bucket=None, prefix=None, uri=None, max_workers=DEFAULT_MAX_WORKERS, retries=3):
+    """
+    Deletes all of the objects that begin with a prefix, deleting each page of the listing in batches as it is
+    retrieved. See delete_many for details.
+
+    :param location: Positional values for bucket, prefix, and/or uri
+    :param bucket: The S3 bucket
+    :param prefix: The key prefix of the objects to delete
+    :param uri: An s3:// path containing the bucket and prefix
+    :param max_workers: The number of requests to send concurrently
+    :param retries: The number of times to retry keys that fail to delete because of throttling or an internal error
+    :return: A dict containing the number of objects deleted and a list of errors for any that couldn't be
+    """
+    bucket, prefix, uri = normalize_location(*location, bucket=bucket, key=prefix, uri=uri)
+    keys = (content['Key'] for content in _list_contents(bucket, prefix))
+    return delete_many(keys, bucket=bucket, max_workers=max_workers, retries=retries)
+
+
+def _existing_snapshot(bucket, key, max_age):
+    snapshot = _snapshot(bucket, key, max_age=max_age)
+    if not snapshot.exists:
+        # raises the same error as loading the object, unless it has been created since the snapshot was taken
+        _head_object(bucket, key)
+        snapshot = _snapshot(bucket, key)
+    return snapshot
+
+
+def size(*location, bucket=None, key=None, uri=None, max_age=None):
     """
     Returns the number of bytes (content_length) in an S3 object.
 
@@ -405,13 +899,17 @@ def size(*location, bucket=None, key=None, uri=None):
     :param bucket: The S3 bucket for object to retrieve
     :param key: The key of the object to be retrieved from the bucket
     :param uri: An s3:// path containing the bucket and key of the object
+    :param max_age: If provided, a snapshot of the object (see Object.snapshot) taken within this many seconds is
+        used rather than retrieving the attributes of the object
     :return: Size in bytes
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    if max_age is not None:
+        return _existing_snapshot(bucket, key, max_age).content_length
     return Object(bucket=bucket, key=key).content_length
 
 
-def get_content_type(*location, bucket=None, key=None, uri=None):
+def get_content_type(*location, bucket=None, key=None, uri=None, max_age=None):
     """
     Returns the content type assigned to the object
 
@@ -419,222 +917,1636 @@ def get_content_type(*location, bucket=None, key=None, uri=None):
     :param bucket: The S3 bucket for object to retrieve
     :param key: The key of the object to be retrieved from the bucket
     :param uri: An s3:// path containing the bucket and key of the object
+    :param max_age: If provided, a snapshot of the object (see Object.snapshot) taken within this many seconds is
+        used rather than retrieving the attributes of the object
     :return: A standard MIME type describing the format of the object data.
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    if max_age is not None:
+        return _existing_snapshot(bucket, key, max_age).content_type
     return Object(bucket=bucket, key=key).content_type
 
 
-def read(*location, bucket=None, key=None, uri=None, byte_count=None):
+def read(*location, bucket=None, key=None, uri=None, byte_count=None, part_size=None, max_concurrency=None,
+         decompress=False):
     """
-    Retrieves the contents of an S3 object
+    Retrieves the contents of an S3 object. Objects larger than the part size are split into byte ranges that are
+    retrieved concurrently into a single bytearray.
 
     :param location: Positional values for bucket, key, and/or uri
     :param bucket: The S3 bucket for object to retrieve
     :param key: The key of the object to be retrieved from the bucket
     :param uri: An s3:// path containing the bucket and key of the object
     :param byte_count: The max number of bytes to read from the object. All data is read if omitted.
-    :return: The bytes contained in the object
+    :param part_size: The number of bytes to retrieve in each ranged request, defaults to DEFAULT_PART_SIZE
+    :param max_concurrency: The number of ranges to retrieve concurrently, defaults to DEFAULT_MAX_CONCURRENCY
+    :param decompress: If True, objects compressed with one of the COMPRESSION_CODECS (as indicated by the content
+        encoding or the key suffix) are decompressed, and byte_count applies to the decompressed data
+    :return: The bytes contained in the object (a bytearray if the object was retrieved in parts)
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    return Object(bucket=bucket, key=key).get()['Body'].read(byte_count)
+    if byte_count is not None:
+        with _open_body(bucket, key, decompress=decompress) as body:
+            return body.read(byte_count)
+    if _read_cache is not None:
+        with _read_cache.get(bucket, key, opener=_open_binary) as fp:
+            data = fp.read()
+        content_encoding = _read_cache.content_encoding(bucket, key)
+    else:
+        data, response = _read_ranges(bucket, key,
+                                      part_size if part_size else DEFAULT_PART_SIZE,
+                                      max_concurrency if max_concurrency else DEFAULT_MAX_CONCURRENCY)
+        content_encoding = response.get('ContentEncoding')
+    codec = _codec(content_encoding, key) if decompress else None
+    return _decompress(codec, data) if codec else data
 
 
-@larrydispatch
-def read_as(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+def _read_ranges(bucket, key, part_size, max_concurrency, file=None, **kwargs):
     """
-    Reads in the s3 object defined by the bucket/key pair or uri and loads the
-    contents into an object of the specified type.
-
-    .. code-block:: python
-
-        import larry as lry
-        import numpy as np
-        np_array = lry.s3.read_as(np.ndarray, 'my-bucket', 'my-key')
-
-    :param type_: The data type to indicate how to read in the data
-    :param location: Positional values for bucket, key, and/or uri
-    :param bucket: The S3 bucket for object to retrieve
-    :param key: The key of the object to be retrieved from the bucket
-    :param uri: An s3:// path containing the bucket and key of the object
-    :param encoding: The charset to use when decoding the object bytes, utf-8 by default
-    :return: An object representation of the data in S3
+    Requests the first part of an object as a ranged GET and uses the Content-Range of the response to determine
+    the size. If the object is larger than a part, the remaining parts are retrieved concurrently and written
+    directly into a preallocated buffer, or into `file` at their offsets if a file is provided (in which case None
+    is returned in place of the contents). Additional arguments such as IfNoneMatch are passed to the first request.
+    Returns the contents along with the response to the first request.
     """
-    raise TypeError("Unsupported type")
-
-
-@read_as.register_module_name("numpy")
-@read_as.register_type_name("ndarray")
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='ASCII', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    kw = {k: v for k, v in kwargs.items() if k in ["mmap_mode", "allow_pickle", "fix_imports"]}
     try:
-        import numpy as np
-        with tempfile.TemporaryFile() as fp:
-            download(fp, bucket=bucket, key=key, uri=uri)
-            fp.seek(0)
-            return np.load(fp, encoding=encoding, **kw)
-    except ImportError as ex:
-        # Simply raise the ImportError to let the user know this requires Numpy to function
-        raise ex
-
+        response = _get_object(bucket, key, Range=f'bytes=0-{part_size - 1}', **kwargs)
+    except ClientError as e:
+        # Empty objects can't satisfy a range request
+        if e.code == 'InvalidRange':
+            response = _get_object(bucket, key, **kwargs)
+            return _read_body(response['Body'], file), response
+        raise e
+    content_range = response.get('ContentRange')
+    total = int(content_range.split('/')[-1]) if content_range else None
+    if total is None or total <= part_size:
+        return _read_body(response['Body'], file), response
+
+    buffer = None
+    if file is None:
+        buffer = bytearray(total)
+        view = memoryview(buffer)
+    else:
+        file.truncate(total)
+    file_lock = threading.Lock()
 
-@read_as.register_module_name("cv2")
-@read_as.register_callable_name("imread")
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    fp = None
-    try:
-        fp = tempfile.NamedTemporaryFile(delete=False)
-        download(fp, bucket=bucket, key=key, uri=uri)
-        fp.close()
-        if type_.__name__ in ['cv2', 'cv2.cv2']:
-            img = type_.imread(fp.name, **kwargs)
+    def store(position, chunk):
+        if file is None:
+            view[position:position + len(chunk)] = chunk
         else:
-            img = type_(fp.name, **kwargs)
-    finally:
-        if fp:
-            os.remove(fp.name)
-    return img
+            with file_lock:
+                file.seek(position)
+                file.write(chunk)
 
+    def read_part(start, body=None):
+        end = min(start + part_size, total)
+        if body is None:
+            # Requiring a matching ETag ensures all of the parts come from the same version of the object
+            body = _get_object(bucket, key, Range=f'bytes={start}-{end - 1}', IfMatch=response['ETag'])['Body']
+        position = start
+        for chunk in body.iter_chunks(DEFAULT_CHUNK_SIZE):
+            store(position, chunk)
+            position += len(chunk)
+        if position != end:
+            raise IOError(f'Expected {end - start} bytes from s3://{bucket}/{key} at {start}, '
+                          f'received {position - start}')
 
-@read_as.register_eq(json)
-@read_as.register_eq(dict)
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [executor.submit(read_part, 0, response['Body'])]
+        futures += [executor.submit(read_part, start) for start in range(part_size, total, part_size)]
+        for future in futures:
+            future.result()
+    return buffer, response
 
-    try:
-        return json.loads(objct.decode(encoding), object_hook=utils.JSONDecoder)
-    except json.JSONDecodeError as ex:
-        if kwargs.get("allow_single_quotes"):
-            # TODO: Use a more stable replace operation that will handle nested quotes
-            return json.loads(objct.decode(encoding).replace("'", '"'), object_hook=utils.JSONDecoder)
-        else:
-            raise ex
 
+def _read_body(body, file=None):
+    if file is None:
+        return body.read()
+    shutil.copyfileobj(body, file, DEFAULT_CHUNK_SIZE)
+    return None
 
-@read_as.register_eq(str)
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
-    return objct.decode(encoding)
 
+def _open_binary(path):
+    return io.open(path, 'rb')
 
-@read_as.register_module_name("PIL.Image")
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
-    return type_.open(BytesIO(objct))
 
+@attach_exception_handler
+def _get_object(bucket, key, **kwargs):
+    # Uses the shared client directly rather than an Object resource so that it's safe to call from worker threads
+    return _get_resource().meta.client.get_object(Bucket=bucket, Key=key, **kwargs)
 
-@read_as.register_eq([dict])
-@read_as.register_eq([json])
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
-    lines = objct.decode(encoding).split(kwargs.get("newline", DEFAULT_NEWLINE))
-    if kwargs.get("use_decoder"):
-        return [json.loads(line, object_hook=utils.JSONDecoder) for line in lines if len(line) > 0]
+
+def _open_body(bucket, key, decompress=False):
+    """
+    Returns a binary file-like object for reading the contents of an S3 object, from the read cache if enabled.
+    If decompress is True, compressed objects are decompressed as they are read.
+    """
+    if _read_cache is not None:
+        body = _read_cache.get(bucket, key, opener=_open_binary)
+        content_encoding = _read_cache.content_encoding(bucket, key)
     else:
-        return [json.loads(line) for line in lines if len(line) > 0]
+        response = _get_object(bucket, key)
+        body, content_encoding = response['Body'], response.get('ContentEncoding')
+    codec = _codec(content_encoding, key) if decompress else None
+    return _DecompressingReader(body, codec) if codec else body
 
 
-@read_as.register_eq([str])
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
-    lines = objct.decode(encoding).split(kwargs.get("newline", DEFAULT_NEWLINE))
-    return [line for line in lines if len(line) > 0]
+def _codec(content_encoding, key=None):
+    """
+    Returns the name of the compression codec indicated by a content encoding or, if there is no content encoding,
+    by the suffix of the key. None is returned for content that isn't compressed with a supported codec.
+    """
+    # aws-chunked only describes how the request body was transferred and isn't an encoding of the content
+    encodings = [e.strip().lower() for e in content_encoding.split(',')] if content_encoding else []
+    encodings = [e for e in encodings if e and e not in ('aws-chunked', 'identity')]
+    if encodings:
+        encoding = {'x-gzip': 'gzip', 'bz2': 'bzip2', 'zst': 'zstd'}.get(encodings[-1], encodings[-1])
+        return encoding if encoding in COMPRESSION_CODECS else None
+    if key:
+        suffix = os.path.splitext(key)[1].lower()
+        for codec, (codec_suffix, _) in COMPRESSION_CODECS.items():
+            if suffix == codec_suffix:
+                return codec
+    return None
+
+
+# The bytes that data compressed with each of the COMPRESSION_CODECS starts with
+_COMPRESSION_MAGIC = {
+    'gzip': b'\x1f\x8b',
+    'zstd': b'\x28\xb5\x2f\xfd',
+    'bzip2': b'BZh',
+    'xz': b'\xfd7zXZ\x00',
+}
 
 
-@read_as.register_eq(csv)
-@read_as.register_eq(csv.reader)
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
-    return csv.reader(StringIO(objct.decode(encoding)), **kwargs)
+def _is_compressed(codec, value):
+    """
+    Returns True if a bytes-like value or a seekable binary file starts with the magic bytes of the codec, which
+    indicates that it's already compressed (such as the contents of a .gz file) and shouldn't be compressed again.
+    """
+    magic = _COMPRESSION_MAGIC[codec]
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(memoryview(value).cast('B')[:len(magic)]) == magic
+    if hasattr(value, 'read') and hasattr(value, 'seekable') and value.seekable():
+        position = value.tell()
+        head = value.read(len(magic))
+        value.seek(position)
+        return head == magic
+    return False
 
 
-@read_as.register_eq(csv.DictReader)
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
-    return csv.DictReader(StringIO(objct.decode(encoding)), **kwargs)
+def _compressor(codec, level=None):
+    """
+    Returns a compression object for the codec with compress and flush methods.
+    """
+    if codec == 'gzip':
+        return zlib.compressobj(-1 if level is None else level, zlib.DEFLATED, 31)
+    elif codec == 'bzip2':
+        import bz2
+        return bz2.BZ2Compressor(9 if level is None else level)
+    elif codec == 'xz':
+        import lzma
+        return lzma.LZMACompressor(preset=level)
+    elif codec == 'zstd':
+        # Requires the zstandard package
+        import zstandard
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    raise ValueError(f'Unsupported compression codec: {codec}')
+
+
+def _decompressor(codec):
+    """
+    Returns a decompression object for a single stream (or member, or frame) of data compressed with the codec.
+    """
+    if codec == 'gzip':
+        return zlib.decompressobj(31)
+    elif codec == 'bzip2':
+        import bz2
+        return bz2.BZ2Decompressor()
+    elif codec == 'xz':
+        import lzma
+        return lzma.LZMADecompressor()
+    elif codec == 'zstd':
+        import zstandard
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise ValueError(f'Unsupported compression codec: {codec}')
+
+
+def _compress(codec, data, level=None, max_workers=None, block_size=DEFAULT_PART_SIZE):
+    """
+    Compresses a bytes-like value. If max_workers is provided, data larger than the block size is split into blocks
+    that are compressed concurrently and concatenated, which each of the codecs supports as a multi-stream value.
+    """
+    view = memoryview(data).cast('B')
+    if not max_workers or max_workers < 2 or len(view) <= block_size:
+        compressor = _compressor(codec, level)
+        return compressor.compress(view) + compressor.flush()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        blocks = executor.map(lambda start: _compress(codec, view[start:start + block_size], level),
+                              range(0, len(view), block_size))
+        return b''.join(blocks)
 
 
-@read_as.register_eq(pickle)
-def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
-    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    objct = read(bucket=bucket, key=key, uri=uri)
-    return pickle.loads(objct, **kwargs)
+def _compress_chunks(codec, chunks, level=None, max_workers=None, block_size=DEFAULT_PART_SIZE):
+    """
+    Compresses a stream of bytes values as it is consumed. If max_workers is provided, the values are gathered into
+    blocks that are compressed concurrently, with a limited number of blocks in flight, and yielded in order.
+    """
+    if not max_workers or max_workers < 2:
+        compressor = _compressor(codec, level)
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        block = bytearray()
+        for chunk in chunks:
+            block += chunk
+            if len(block) >= block_size:
+                pending.append(executor.submit(_compress, codec, block, level))
+                block = bytearray()
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+        if block or not pending:
+            pending.append(executor.submit(_compress, codec, block, level))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _decompress(codec, data):
+    """
+    Decompresses a bytes-like value, including values made up of multiple concatenated streams.
+    """
+    with _DecompressingReader(BytesIO(data), codec) as reader:
+        return reader.read()
 
 
-def _write(body, bucket=None, key=None, uri=None, acl=None, content_type=None, content_encoding=None,
-           content_language=None, content_length=None, metadata=None, sse=None, storage_class=None,
-           tags=None, encoding=None):
+class _DecompressingReader(io.RawIOBase):
     """
-    Write an object to the bucket/key pair or uri.
-    :return: The object written to S3
+    Decompresses the contents of a binary file-like object incrementally as it is read. Concatenated streams, such
+    as those written by a parallel compressor, are decompressed in sequence.
     """
-    params = larry.core.map_parameters(locals(), {
-        'acl': 'ACL',
-        'content_encoding': 'ContentEncoding',
-        'content_language': 'ContentLanguage',
-        'content_length': 'ContentLength',
-        'content_type': 'ContentType',
-        'metadata': 'Metadata',
-        'sse': 'ServerSideEncryption',
-        'storage_class': 'StorageClass',
-    })
-    if tags:
-        params['Tagging'] = parse.urlencode(tags) if isinstance(tags, Mapping) else tags
-    if isinstance(body, str):
-        if encoding is None:
-            encoding = DEFAULT_ENCODING
-        params["Body"] = body.encode(encoding)
-    else:
-        params["Body"] = body
-
-    obj = Object(bucket=bucket, key=key)
-    obj.put(**params)
-    return obj
 
+    def __init__(self, body, codec, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._body = body
+        self._codec = codec
+        self._chunk_size = chunk_size
+        self._decompressor = None
+        self._data = b''
+        self._position = 0
+        self._eof = False
 
-@larrydispatch
-def format_type_for_write(_type, value, key=None, content_type=None, **kwargs):
-    return value, __recommend_content_type(content_type, key)
+    def readable(self):
+        return True
 
+    def readinto(self, b):
+        while self._position >= len(self._data) and not self._eof:
+            self._data = self._decompress_chunk()
+            self._position = 0
+        size = min(len(b), len(self._data) - self._position)
+        b[:size] = self._data[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def _decompress_chunk(self):
+        chunk = self._body.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            if self._decompressor is not None and not self._decompressor.eof:
+                raise EOFError('Compressed data ended before the end-of-stream marker was reached')
+            return b''
+        output = []
+        while chunk:
+            if self._decompressor is None or self._decompressor.eof:
+                self._decompressor = _decompressor(self._codec)
+            output.append(self._decompressor.decompress(chunk))
+            chunk = self._decompressor.unused_data if self._decompressor.eof else b''
+        return b''.join(output)
+
+    def close(self):
+        if not self.closed:
+            self._body.close()
+        super().close()
+
+
+# The ReadCache used by read operations, if enabled
+_read_cache = None
+
+
+class ReadCache:
+    """
+    A read-through cache that stores the contents of S3 objects on the local disk so that repeated reads of the same
+    objects don't need to transfer them again. While the cache is enabled, `read`, `read_as`, `iter_lines`, `open`
+    (for reading), and `download` are served from the cache. Entries are revalidated with a conditional GET using the
+    ETag of the cached object, or trusted without a request for `ttl` seconds after they were last validated. The
+    least recently used entries are removed when the cache grows past `max_bytes`.
 
-@format_type_for_write.register_module_name("cv2")
-@format_type_for_write.register_callable_name("imwrite")
-def _(_type, value, key=None, content_type=None, **kwargs):
-    suffix = os.path.splitext(key)[1]
-    content_type = __recommend_content_type(content_type, key, "image/png")
-    handle, filepath = tempfile.mkstemp(suffix=suffix if suffix else '.png')
-    try:
-        if _type.__name__ in ['cv2', 'cv2.cv2']:
-            _type.imwrite(filepath, value, **kwargs)
-        else:
-            _type(filepath, value, **kwargs)
-        with open(filepath, 'rb') as fp:
-            result = fp.read()
-    finally:
-        os.close(handle)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-    return result, content_type
+    The cache can be enabled for a block of code by using it as a context manager, or globally with
+    `enable_cache`.
 
+    .. code-block:: python
 
-@format_type_for_write.register_eq(str)
-def _(_type, value, key=None, content_type=None, **kwargs):
-    return value, __recommend_content_type(content_type, key, "text/plain")
+        import larry as lry
+        with lry.s3.ReadCache(max_bytes=10 * 1024 ** 3, ttl=300) as cache:
+            template = lry.s3.read_as(str, 's3://my-bucket/template.html')
+        print(cache.hits, cache.misses, cache.bytes_saved)
+
+    :param path: The directory to store cached objects in, by default objects in DEFAULT_CACHE_DIR
+    :param max_bytes: The maximum size of the cached objects
+    :param ttl: The number of seconds to trust a cached object before revalidating it, None to always revalidate
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_CACHE_SIZE, ttl=None):
+        self.path = path if path else os.path.join(DEFAULT_CACHE_DIR, 'objects')
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._previous = None
+        os.makedirs(self.path, exist_ok=True)
+        # entries in least to most recently used order, loaded from the metadata of existing cache files
+        entries = []
+        for name in os.listdir(self.path):
+            if name.endswith('.json'):
+                try:
+                    with io.open(os.path.join(self.path, name)) as fp:
+                        entries.append(json.load(fp))
+                except (OSError, ValueError):
+                    pass
+        self._entries = {e['id']: e for e in sorted(entries, key=lambda e: e['used'])}
+        self.size = sum(e['size'] for e in self._entries.values())
+
+    def _file(self, entry_id, suffix=''):
+        return os.path.join(self.path, entry_id + suffix)
+
+    def get(self, bucket, key, opener=None):
+        """
+        Returns the path of a local file containing the current contents of the object, retrieving it if it isn't
+        cached or has changed. If an opener such as io.open is provided it's called with the path before the entry
+        can be evicted by another thread and its result is returned in place of the path.
+        """
+        entry_id = self._entry_id(bucket, key)
+        with self._lock:
+            entry = self._entries.pop(entry_id, None)
+            if entry is not None:
+                self._entries[entry_id] = entry
+        if entry is not None and not os.path.exists(self._file(entry_id)):
+            entry = None
+
+        now = time.time()
+        if entry is not None and self.ttl is not None and now - entry['validated'] < self.ttl:
+            result = self._hit(entry, now, opener)
+            if result is not None:
+                return result
+            entry = None
+
+        params = {'IfNoneMatch': entry['etag']} if entry is not None else {}
+        temp = self._file(entry_id, f'.{uuid.uuid4().hex}.tmp')
+        try:
+            with io.open(temp, 'wb') as fp:
+                _, response = _read_ranges(bucket, key, DEFAULT_PART_SIZE, DEFAULT_MAX_CONCURRENCY, file=fp,
+                                           **params)
+            size = os.path.getsize(temp)
+            os.replace(temp, self._file(entry_id))
+        except ClientError as e:
+            if entry is not None and e.code == '304':
+                entry['validated'] = now
+                result = self._hit(entry, now, opener)
+                if result is not None:
+                    return result
+                # evicted while it was being revalidated
+                return self.get(bucket, key, opener)
+            raise e
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+        entry = {'id': entry_id, 'bucket': bucket, 'key': key, 'etag': response['ETag'], 'size': size,
+                 'content_encoding': response.get('ContentEncoding'), 'validated': now, 'used': now}
+        self._save(entry)
+        with self._lock:
+            self.misses += 1
+            previous = self._entries.pop(entry_id, None)
+            self.size += entry['size'] - (previous['size'] if previous else 0)
+            self._entries[entry_id] = entry
+            self._evict(entry_id)
+            return self._open(entry_id, opener)
+
+    @staticmethod
+    def _entry_id(bucket, key):
+        return hashlib.sha256(f'{bucket}/{key}'.encode('utf-8')).hexdigest()
+
+    def content_encoding(self, bucket, key):
+        """
+        Returns the content encoding of a cached object.
+        """
+        entry = self._entries.get(self._entry_id(bucket, key))
+        return entry.get('content_encoding') if entry else None
+
+    def _hit(self, entry, now, opener):
+        # returns None if the entry was evicted by another thread
+        entry['used'] = now
+        self._save(entry)
+        with self._lock:
+            if entry['id'] not in self._entries:
+                return None
+            self.hits += 1
+            self.bytes_saved += entry['size']
+            return self._open(entry['id'], opener)
+
+    def _open(self, entry_id, opener):
+        # called with the lock held so that the entry can't be evicted before the file has been opened
+        path = self._file(entry_id)
+        return opener(path) if opener else path
+
+    def _save(self, entry):
+        with io.open(self._file(entry['id'], '.json'), 'w') as fp:
+            json.dump(entry, fp)
+
+    def _evict(self, keep):
+        # called with the lock held, removes the least recently used entries other than the one just added
+        for entry_id in list(self._entries):
+            if self.size <= self.max_bytes:
+                break
+            if entry_id != keep:
+                self.size -= self._entries[entry_id]['size']
+                self._remove(entry_id)
+
+    def _remove(self, entry_id):
+        del self._entries[entry_id]
+        for suffix in ['', '.json']:
+            try:
+                os.remove(self._file(entry_id, suffix))
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Removes all of the objects from the cache.
+        """
+        with self._lock:
+            for entry_id in list(self._entries):
+                self._remove(entry_id)
+            self.size = 0
+
+    def __enter__(self):
+        global _read_cache
+        self._previous, _read_cache = _read_cache, self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _read_cache
+        _read_cache, self._previous = self._previous, None
+
+    def __repr__(self):
+        return f'ReadCache("{self.path}", hits={self.hits}, misses={self.misses}, bytes_saved={self.bytes_saved})'
+
+
+def enable_cache(path=None, max_bytes=DEFAULT_CACHE_SIZE, ttl=None):
+    """
+    Enables a disk-backed read-through cache for all reads. See ReadCache for details.
+
+    :param path: The directory to store cached objects in, by default objects in DEFAULT_CACHE_DIR
+    :param max_bytes: The maximum size of the cached objects
+    :param ttl: The number of seconds to trust a cached object before revalidating it, None to always revalidate
+    :return: The ReadCache
+    """
+    global _read_cache
+    _read_cache = ReadCache(path=path, max_bytes=max_bytes, ttl=ttl)
+    return _read_cache
+
+
+def disable_cache():
+    """
+    Disables the read cache enabled with `enable_cache`. The cached files are left in place.
+    """
+    global _read_cache
+    _read_cache = None
+
+
+# The ResultCache used by read_as, if enabled
+_result_cache = None
+
+
+class ResultCache:
+    """
+    An in-process cache of the values returned by `read_as`, so that objects that are read repeatedly aren't
+    retrieved and decoded each time. Values are keyed by the type, the bucket and key, any additional arguments,
+    and the ETag of the object, which is checked with a HEAD request on each read so that changes are picked up.
+    The memory used by the cache is estimated from the size of the objects, and the least recently used values are
+    removed when it passes `max_bytes`. Streaming results such as iterators and csv readers aren't cached.
+
+    Because the same value is returned for each read, `copy` can be set to return a deep copy of mutable values.
+
+    .. code-block:: python
+
+        import larry as lry
+        with lry.s3.ResultCache(max_bytes=512 * 1024 ** 2) as cache:
+            for item in items:
+                html = lry.mturk.render_jinja_template(item, template_uri='s3://my-bucket/template.html')
+        print(cache.hits, cache.misses)
+
+    :param max_bytes: The maximum combined size of the objects whose values are cached
+    :param copy: True to return a deep copy of the cached value on each read
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, copy=False):
+        self.max_bytes = max_bytes
+        self.copy = copy
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._previous = None
+
+    def get(self, cache_key, e_tag):
+        """
+        Returns a tuple of (True, value) if a value for the key and ETag is cached, otherwise (False, None).
+        """
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or entry[0] != e_tag:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+        return True, copy_module.deepcopy(entry[1]) if self.copy else entry[1]
+
+    def put(self, cache_key, e_tag, value, size):
+        """
+        Adds a value to the cache, removing the least recently used values if the cache is too large.
+        """
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self.size -= previous[2]
+            self._entries[cache_key] = (e_tag, copy_module.deepcopy(value) if self.copy else value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self):
+        """
+        Removes all of the values from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __enter__(self):
+        global _result_cache
+        self._previous, _result_cache = _result_cache, self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _result_cache
+        _result_cache, self._previous = self._previous, None
+
+    def __repr__(self):
+        return f'ResultCache(entries={len(self._entries)}, size={self.size}, hits={self.hits}, misses={self.misses})'
+
+
+def _result_cache_key(type_, bucket, key, kwargs):
+    try:
+        type_key = tuple(type_) if isinstance(type_, list) else type_
+        cache_key = (type_key, bucket, key, frozenset(kwargs.items()))
+        hash(cache_key)
+        return cache_key
+    except TypeError:
+        return None
+
+
+# read_as types that return streaming results, which are never cached
+_STREAMING_TYPES = (csv, csv.reader, csv.DictReader)
+
+# the types and arguments found to return streaming results
+_streaming_type_keys = set()
+
+
+def _is_streaming(value):
+    return isinstance(value, (Iterator, io.IOBase)) or type(value).__name__ in ('reader', 'DictReader')
+
+
+def _memoized(func):
+    """
+    Wraps read_as so that its results are served from the ResultCache when one is enabled. Types that return
+    streaming results are read without checking the ETag of the object.
+    """
+    @functools.wraps(func)
+    def wrapper(type_, *location, bucket=None, key=None, uri=None, **kwargs):
+        cache = _result_cache
+        if cache is None:
+            return func(type_, *location, bucket=bucket, key=key, uri=uri, **kwargs)
+        bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+        cache_key = _result_cache_key(type_, bucket, key, kwargs)
+        # lazy images are backed by a reader of the object that the caller closes, so they can't be shared
+        if (cache_key is None or kwargs.get('lazy') or isinstance(type_, Iterator) or
+                any(type_ is t for t in _STREAMING_TYPES) or (cache_key[0], cache_key[3]) in _streaming_type_keys):
+            return func(type_, bucket=bucket, key=key, **kwargs)
+        head = _head_object(bucket, key)
+        found, value = cache.get(cache_key, head['ETag'])
+        if found:
+            return value
+        value = func(type_, bucket=bucket, key=key, **kwargs)
+        if _is_streaming(value):
+            _streaming_type_keys.add((cache_key[0], cache_key[3]))
+        else:
+            cache.put(cache_key, head['ETag'], value, head['ContentLength'])
+        return value
+    return wrapper
+
+
+@attach_exception_handler
+def _head_object(bucket, key):
+    return _get_resource().meta.client.head_object(Bucket=bucket, Key=key)
+
+
+def enable_result_cache(max_bytes=256 * 1024 * 1024, copy=False):
+    """
+    Enables an in-process cache of `read_as` results for all reads. See ResultCache for details.
+
+    :param max_bytes: The maximum combined size of the objects whose values are cached
+    :param copy: True to return a deep copy of the cached value on each read
+    :return: The ResultCache
+    """
+    global _result_cache
+    _result_cache = ResultCache(max_bytes=max_bytes, copy=copy)
+    return _result_cache
+
+
+def disable_result_cache():
+    """
+    Disables the result cache enabled with `enable_result_cache`.
+    """
+    global _result_cache
+    _result_cache = None
+
+
+@_memoized
+@larrydispatch
+def read_as(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    """
+    Reads in the s3 object defined by the bucket/key pair or uri and loads the
+    contents into an object of the specified type.
+
+    .. code-block:: python
+
+        import larry as lry
+        import numpy as np
+        np_array = lry.s3.read_as(np.ndarray, 'my-bucket', 'my-key')
+
+    Images read as PIL.Image with `lazy=True` retrieve only the header of the object until the image data is loaded.
+    The image holds an ObjectReader of the object, so the caller owns the image and must close it. Lazy images
+    aren't memoized by the ResultCache.
+
+    :param type_: The data type to indicate how to read in the data
+    :param location: Positional values for bucket, key, and/or uri
+    :param bucket: The S3 bucket for object to retrieve
+    :param key: The key of the object to be retrieved from the bucket
+    :param uri: An s3:// path containing the bucket and key of the object
+    :param encoding: The charset to use when decoding the object bytes, utf-8 by default
+    :return: An object representation of the data in S3
+    """
+    raise TypeError("Unsupported type")
+
+
+# ReadCache used to hold the files that back memory-mapped arrays, created on first use
+_array_cache = None
+
+
+def _array_file(bucket, key, opener):
+    """
+    Opens a persistent local copy of an object that can be memory-mapped, using the read cache if one is enabled
+    and otherwise a cache in the arrays directory of DEFAULT_CACHE_DIR.
+    """
+    global _array_cache
+    if _read_cache is not None:
+        return _read_cache.get(bucket, key, opener=opener)
+    if _array_cache is None:
+        _array_cache = ReadCache(path=os.path.join(DEFAULT_CACHE_DIR, 'arrays'))
+    return _array_cache.get(bucket, key, opener=opener)
+
+
+def _load_npy(np, buffer, **kwargs):
+    """
+    Loads an array from the contents of a .npy file without copying the data, by parsing the header from the buffer
+    and wrapping the remainder with np.frombuffer. The data is only copied if the buffer is immutable. Arrays
+    containing objects and other formats such as .npz are loaded with np.load.
+    """
+    view = memoryview(buffer)
+    if bytes(view[:6]) != np.lib.format.MAGIC_PREFIX:
+        return np.load(BytesIO(buffer), **kwargs)
+    version = (view[6], view[7])
+    length_size = 2 if version == (1, 0) else 4
+    offset = 8 + length_size + int.from_bytes(view[8:8 + length_size], 'little')
+    header = BytesIO(view[:offset])
+    np.lib.format.read_magic(header)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+    if dtype.hasobject:
+        return np.load(BytesIO(buffer), **kwargs)
+    count = 1
+    for dimension in shape:
+        count *= dimension
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    if not array.flags.writeable:
+        # immutable buffers such as bytes produce read-only arrays, so the data is copied to keep them writable
+        array = array.copy()
+    return array.reshape(shape, order='F' if fortran_order else 'C')
+
+
+@read_as.register_module_name("numpy")
+@read_as.register_type_name("ndarray")
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='ASCII', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    kw = {k: v for k, v in kwargs.items() if k in ["allow_pickle", "fix_imports"]}
+    try:
+        import numpy as np
+        if kwargs.get("mmap_mode"):
+            return _array_file(bucket, key, lambda path: np.load(path, mmap_mode=kwargs["mmap_mode"],
+                                                                 encoding=encoding, **kw))
+        return _load_npy(np, read(bucket, key, decompress=True), encoding=encoding, **kw)
+    except ImportError as ex:
+        # Simply raise the ImportError to let the user know this requires Numpy to function
+        raise ex
+
+
+def _cv2_module(value):
+    """
+    Returns the cv2 module if the value is the module or one of its functions, otherwise None.
+    """
+    if getattr(value, '__name__', None) in ['cv2', 'cv2.cv2']:
+        return value
+    if getattr(value, '__module__', None) in ['cv2', 'cv2.cv2']:
+        import cv2
+        return cv2
+    # the functions of some cv2 builds don't record their module
+    cv2 = sys.modules.get('cv2')
+    if cv2 is not None and any(value is getattr(cv2, name, None) for name in ['imread', 'imwrite']):
+        return cv2
+    return None
+
+
+@read_as.register_module_name("cv2")
+@read_as.register_callable_name("imread")
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    cv2 = _cv2_module(type_)
+    if cv2 is not None:
+        # decode directly from the retrieved bytes, imdecode releases the GIL so this can run on worker threads
+        import numpy as np
+        return cv2.imdecode(np.frombuffer(read(bucket, key, decompress=True), dtype=np.uint8),
+                            kwargs.get('flags', cv2.IMREAD_COLOR))
+
+    # other imread callables are passed the path of a local copy
+    fp = None
+    try:
+        fp = tempfile.NamedTemporaryFile(delete=False)
+        download(fp, bucket=bucket, key=key, uri=uri)
+        fp.close()
+        img = type_(fp.name, **kwargs)
+    finally:
+        if fp:
+            os.remove(fp.name)
+    return img
+
+
+@read_as.register_eq(json)
+@read_as.register_eq(dict)
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    objct = read(bucket=bucket, key=key, uri=uri, decompress=True)
+
+    try:
+        return json.loads(objct.decode(encoding), object_hook=utils.JSONDecoder)
+    except json.JSONDecodeError as ex:
+        if kwargs.get("allow_single_quotes"):
+            # TODO: Use a more stable replace operation that will handle nested quotes
+            return json.loads(objct.decode(encoding).replace("'", '"'), object_hook=utils.JSONDecoder)
+        else:
+            raise ex
+
+
+@read_as.register_eq(str)
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    objct = read(bucket=bucket, key=key, uri=uri, decompress=True)
+    return objct.decode(encoding)
+
+
+@read_as.register_module_name("PIL.Image")
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    if kwargs.get('lazy'):
+        # Only the header is retrieved until the image data is loaded, closing the image closes the reader
+        return type_.open(ObjectReader(bucket=bucket, key=key, block_size=IMAGE_HEADER_SIZE))
+    objct = read(bucket=bucket, key=key, uri=uri, decompress=True)
+    return type_.open(BytesIO(objct))
+
+
+def image_info(*location, bucket=None, key=None, uri=None):
+    """
+    Retrieves the format, mode, and dimensions of an image without downloading it. The header is parsed by PIL from
+    a ranged request for the first IMAGE_HEADER_SIZE bytes of the object, with larger ranges retrieved only if the
+    header extends past them.
+
+    .. code-block:: python
+
+        import larry as lry
+        info = lry.s3.image_info('s3://my-bucket/image.jpg')
+        print(info['width'], info['height'], info['content_length'])
+
+    :param location: Positional values for bucket, key, and/or uri
+    :param bucket: The S3 bucket for object to retrieve
+    :param key: The key of the object to be retrieved from the bucket
+    :param uri: An s3:// path containing the bucket and key of the object
+    :return: A dict containing the format, mode, width, height, and content_length (in bytes) of the image
+    """
+    from PIL import Image
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    with ObjectReader(bucket=bucket, key=key, block_size=IMAGE_HEADER_SIZE) as fp:
+        with Image.open(fp) as image:
+            return {
+                'format': image.format,
+                'mode': image.mode,
+                'width': image.width,
+                'height': image.height,
+                'content_length': fp.size
+            }
+
+
+def _parse_lines(item_type, lines, use_decoder=False, **kwargs):
+    if item_type in [dict, json]:
+        object_hook = utils.JSONDecoder if use_decoder else None
+        for line in lines:
+            yield json.loads(line, object_hook=object_hook)
+    elif item_type == str:
+        yield from lines
+    else:
+        raise TypeError("Unsupported type")
+
+
+@read_as.register_eq([dict])
+@read_as.register_eq([json])
+@read_as.register_eq([str])
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    lines = iter_lines(bucket=bucket, key=key, encoding=encoding, **supported_kwargs(iter_lines, **kwargs))
+    return list(_parse_lines(type_[0], lines, **kwargs))
+
+
+@read_as.register_class_name("list_iterator")
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    # Called as read_as(iter([dict]), ...), the type of the records is the value in the iterator
+    item_type = next(type_, str)
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    lines = iter_lines(bucket=bucket, key=key, encoding=encoding, **supported_kwargs(iter_lines, **kwargs))
+    return _parse_lines(item_type, lines, **kwargs)
+
+
+def iter_lines(*location, bucket=None, key=None, uri=None, encoding='utf-8', newline=DEFAULT_NEWLINE,
+               chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Streams the contents of an S3 object and yields it one line at a time. The object is read in chunks so memory
+    use stays constant regardless of the size of the object, and compressed objects are decompressed as they are
+    read. Empty lines are skipped.
+
+    .. code-block:: python
+
+        import larry as lry
+        for line in lry.s3.iter_lines('s3://my-bucket/output.manifest'):
+            print(line)
+
+    :param location: Positional values for bucket, key, and/or uri
+    :param bucket: The S3 bucket for object to retrieve
+    :param key: The key of the object to be retrieved from the bucket
+    :param uri: An s3:// path containing the bucket and key of the object
+    :param encoding: The charset to use when decoding the object bytes, utf-8 by default
+    :param newline: The character(s) that separate lines
+    :param chunk_size: The number of bytes to read from the object at a time
+    :return: A generator of str values
+    """
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    body = _open_body(bucket, key, decompress=True)
+    # The incremental decoder holds back any multi-byte sequence that is split across chunks
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ''
+    try:
+        for chunk in iter(lambda: body.read(chunk_size), b''):
+            text = decoder.decode(chunk)
+            # Only the tail of the buffer can combine with the new text to form a newline
+            if newline not in buffer[len(buffer) - len(newline) + 1:] + text:
+                buffer += text
+                continue
+            lines = (buffer + text).split(newline)
+            buffer = lines.pop()
+            for line in lines:
+                if len(line) > 0:
+                    yield line
+        buffer += decoder.decode(b'', final=True)
+        if len(buffer) > 0:
+            yield buffer
+    finally:
+        body.close()
+
+
+class _BodyReader(io.RawIOBase):
+    """
+    Adapts a botocore StreamingBody to the io stack so that it can be buffered and decoded incrementally.
+    """
+
+    def __init__(self, body):
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._body.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._body.close()
+        super().close()
+
+
+def _open_reader(bucket, key, encoding=None, newline=None, buffer_size=DEFAULT_CHUNK_SIZE, decompress=True):
+    """
+    Opens a file-like object that streams the contents of an S3 object, decompressing compressed objects unless
+    decompress is False. A text stream is returned if an encoding is provided, otherwise a binary stream.
+    """
+    body = _open_body(bucket, key, decompress=decompress)
+    stream = io.BufferedReader(body if isinstance(body, io.RawIOBase) else _BodyReader(body), buffer_size)
+    if encoding is None:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+
+
+@read_as.register_eq(csv)
+@read_as.register_eq(csv.reader)
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    return csv.reader(_open_reader(bucket, key, encoding=encoding, newline=''), **kwargs)
+
+
+@read_as.register_eq(csv.DictReader)
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    return csv.DictReader(_open_reader(bucket, key, encoding=encoding, newline=''), **kwargs)
+
+
+@read_as.register_eq(pickle)
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    objct = read(bucket=bucket, key=key, uri=uri, decompress=True)
+    return pickle.loads(objct, **kwargs)
+
+
+def _read_parquet(bucket, key, columns=None, row_groups=None, use_threads=True, **kwargs):
+    """
+    Reads a Parquet object into a pyarrow Table through an ObjectReader, so that only the footer and the column
+    chunks of the requested columns and row groups are retrieved.
+    """
+    import pyarrow.parquet as pq
+    with ObjectReader(bucket=bucket, key=key) as fp:
+        parquet_file = pq.ParquetFile(fp)
+        if row_groups is not None:
+            return parquet_file.read_row_groups(row_groups, columns=columns, use_threads=use_threads)
+        return parquet_file.read(columns=columns, use_threads=use_threads)
+
+
+@read_as.register_module_name("pyarrow")
+@read_as.register_module_name("pyarrow.parquet")
+@read_as.register_type_name("Table")
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    if not isinstance(type_, ModuleType) and not type_.__module__.startswith('pyarrow'):
+        raise TypeError("Unsupported type")
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    return _read_parquet(bucket, key, **kwargs)
+
+
+@read_as.register_module_name("pandas")
+@read_as.register_type_name("DataFrame")
+def _(type_, *location, bucket=None, key=None, uri=None, encoding='utf-8', **kwargs):
+    if not isinstance(type_, ModuleType) and not type_.__module__.startswith('pandas'):
+        raise TypeError("Unsupported type")
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    return _read_parquet(bucket, key, **kwargs).to_pandas()
+
+
+def read_many(locations, bucket=None, byte_count=None, max_workers=DEFAULT_MAX_WORKERS, ordered=False,
+              return_exceptions=True):
+    """
+    Retrieves the contents of many S3 objects concurrently. Requests are run on a bounded thread pool that shares
+    the module's client.
+
+    .. code-block:: python
+
+        import larry as lry
+        for uri, data in lry.s3.read_many(['s3://my-bucket/a.json', 's3://my-bucket/b.json']):
+            print(uri, len(data))
+
+    :param locations: An iterable of S3 URIs, (bucket, key) tuples, Objects (such as the output of list_objects),
+        or keys if a bucket is provided
+    :param bucket: The S3 bucket to use for any values that are keys rather than full locations
+    :param byte_count: The max number of bytes to read from each object. All data is read if omitted.
+    :param max_workers: The number of objects to retrieve concurrently
+    :param ordered: If True, results are returned in the same order as the locations, otherwise they are returned
+        as they complete
+    :param return_exceptions: If True, an exception raised while reading an object is returned in place of the value
+        rather than ending the batch
+    :return: A generator of (location, bytes) tuples
+    """
+    return _map_locations(lambda b, k: read(bucket=b, key=k, byte_count=byte_count), locations,
+                          bucket=bucket, max_workers=max_workers, ordered=ordered,
+                          return_exceptions=return_exceptions)
+
+
+def read_as_many(type_, locations, bucket=None, max_workers=DEFAULT_MAX_WORKERS, ordered=False,
+                 return_exceptions=True, **kwargs):
+    """
+    Reads in many S3 objects concurrently and loads the contents of each into an object of the specified type
+    using the same handlers as `read_as`. Decoding is done in the worker threads.
+
+    .. code-block:: python
+
+        import larry as lry
+        for obj, value in lry.s3.read_as_many(dict, lry.s3.list_objects('my-bucket', 'annotations/')):
+            print(obj.key, value)
+
+        # images are decoded with cv2.imdecode on the worker threads
+        import cv2
+        images = dict(lry.s3.read_as_many(cv2, lry.s3.list_objects('my-bucket', 'images/'), ordered=True))
+
+    :param type_: The data type to indicate how to read in the data
+    :param locations: An iterable of S3 URIs, (bucket, key) tuples, Objects (such as the output of list_objects),
+        or keys if a bucket is provided
+    :param bucket: The S3 bucket to use for any values that are keys rather than full locations
+    :param max_workers: The number of objects to retrieve concurrently
+    :param ordered: If True, results are returned in the same order as the locations, otherwise they are returned
+        as they complete
+    :param return_exceptions: If True, an exception raised while reading an object is returned in place of the value
+        rather than ending the batch
+    :return: A generator of (location, value) tuples
+    """
+    return _map_locations(lambda b, k: read_as(type_, bucket=b, key=k, **kwargs), locations,
+                          bucket=bucket, max_workers=max_workers, ordered=ordered,
+                          return_exceptions=return_exceptions)
+
+
+def image_info_many(locations, bucket=None, max_workers=DEFAULT_MAX_WORKERS, ordered=False, return_exceptions=True):
+    """
+    Retrieves the format, mode, and dimensions of many images concurrently using `image_info`.
+
+    .. code-block:: python
+
+        import larry as lry
+        uris = [item['source-ref'] for item in lry.s3.read_as([dict], 's3://my-bucket/output.manifest')]
+        oversized = [uri for uri, info in lry.s3.image_info_many(uris) if info['width'] * info['height'] > 10 ** 8]
+
+    :param locations: An iterable of S3 URIs, (bucket, key) tuples, Objects (such as the output of list_objects),
+        or keys if a bucket is provided
+    :param bucket: The S3 bucket to use for any values that are keys rather than full locations
+    :param max_workers: The number of images to inspect concurrently
+    :param ordered: If True, results are returned in the same order as the locations, otherwise they are returned
+        as they complete
+    :param return_exceptions: If True, an exception raised while reading an image is returned in place of the info
+        rather than ending the batch
+    :return: A generator of (location, info) tuples
+    """
+    return _map_locations(lambda b, k: image_info(bucket=b, key=k), locations, bucket=bucket,
+                          max_workers=max_workers, ordered=ordered, return_exceptions=return_exceptions)
+
+
+def _write_params(acl=None, content_type=None, content_encoding=None, content_language=None, content_length=None,
+                  metadata=None, sse=None, storage_class=None, tags=None):
+    """
+    Maps the write options to the parameters used by the S3 put and create multipart upload calls.
+    """
+    params = larry.core.map_parameters(locals(), {
+        'acl': 'ACL',
+        'content_encoding': 'ContentEncoding',
+        'content_language': 'ContentLanguage',
+        'content_length': 'ContentLength',
+        'content_type': 'ContentType',
+        'metadata': 'Metadata',
+        'sse': 'ServerSideEncryption',
+        'storage_class': 'StorageClass',
+    })
+    if tags:
+        params['Tagging'] = parse.urlencode(tags) if isinstance(tags, Mapping) else tags
+    return params
+
+
+def _write(body, bucket=None, key=None, uri=None, acl=None, content_type=None, content_encoding=None,
+           content_language=None, content_length=None, metadata=None, sse=None, storage_class=None,
+           tags=None, encoding=None, part_size=None, max_concurrency=None, compression=None,
+           compression_level=None, compression_workers=None):
+    """
+    Write an object to the bucket/key pair or uri. Iterators of str or bytes values are streamed to S3 through a
+    multipart upload as they are produced, and the number of records (values) and bytes written are recorded on the
+    returned object as `records_written` and `bytes_written`. If a compression codec is provided the body is
+    compressed as it is written.
+    :return: The object written to S3
+    """
+    if encoding is None:
+        encoding = DEFAULT_ENCODING
+    if compression is not None and hasattr(body, 'read'):
+        reader = body
+        body = iter(lambda: reader.read(DEFAULT_CHUNK_SIZE), reader.read(0))
+    if isinstance(body, Iterator) and not hasattr(body, 'read'):
+        records = 0
+
+        def encoded():
+            nonlocal records
+            for value in body:
+                yield value.encode(encoding) if isinstance(value, str) else value
+                records += 1
+
+        chunks = encoded()
+        if compression is not None:
+            chunks = _compress_chunks(compression, chunks, level=compression_level, max_workers=compression_workers,
+                                      block_size=part_size if part_size else DEFAULT_PART_SIZE)
+        with ObjectWriter(bucket=bucket, key=key, acl=acl, content_type=content_type,
+                          content_encoding=content_encoding, content_language=content_language, metadata=metadata,
+                          sse=sse, storage_class=storage_class, tags=tags, part_size=part_size,
+                          max_concurrency=max_concurrency) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        obj = Object(bucket=bucket, key=key)
+        obj.records_written = body.records if isinstance(body, _Chunks) else records
+        obj.bytes_written = writer.bytes_written
+        return obj
+
+    if isinstance(body, str):
+        body = body.encode(encoding)
+    if compression is not None:
+        body = _compress(compression, b'' if body is None else body, level=compression_level,
+                         max_workers=compression_workers, block_size=part_size if part_size else DEFAULT_PART_SIZE)
+        content_length = None
+    params = _write_params(acl=acl, content_type=content_type, content_encoding=content_encoding,
+                           content_language=content_language, content_length=content_length, metadata=metadata,
+                           sse=sse, storage_class=storage_class, tags=tags)
+    params["Body"] = body
+
+    _forget_snapshots(bucket, [key])
+    obj = Object(bucket=bucket, key=key)
+    obj.put(**params)
+    return obj
+
+
+class ObjectReader(io.RawIOBase):
+    """
+    A seekable, read-only file-like object for an S3 object that retrieves only the byte ranges that are read,
+    which allows libraries such as pyarrow or PIL to read parts of a large object without transferring all of it.
+    Reads smaller than the block size retrieve a full block to serve subsequent small reads, the block size doubles
+    (up to the part size) while the object is read sequentially, and reads larger than the part size are retrieved
+    as concurrent ranged requests. The size and ETag of the object are taken from the first response and all later
+    requests require the ETag to match.
+
+    .. code-block:: python
+
+        import larry as lry
+        with lry.s3.ObjectReader('s3://my-bucket/archive.zip') as fp:
+            names = zipfile.ZipFile(fp).namelist()
+            print(names, fp.bytes_requested)
+
+    :param location: Positional values for bucket, key, and/or uri
+    :param bucket: The S3 bucket for the object
+    :param key: The key of the object
+    :param uri: An s3:// path containing the bucket and key of the object
+    :param block_size: The minimum number of bytes to request at a time
+    :param part_size: The number of bytes in each ranged request for large reads, defaults to DEFAULT_PART_SIZE
+    :param max_concurrency: The number of ranges to retrieve concurrently, defaults to DEFAULT_MAX_CONCURRENCY
+    """
+
+    def __init__(self, *location, bucket=None, key=None, uri=None, block_size=64 * 1024, part_size=None,
+                 max_concurrency=None):
+        super().__init__()
+        self.bucket, self.key, _ = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+        self.e_tag = None
+        self.bytes_requested = 0
+        self._size = None
+        self._block_size = block_size
+        self._part_size = part_size if part_size else DEFAULT_PART_SIZE
+        self._max_concurrency = max_concurrency if max_concurrency else DEFAULT_MAX_CONCURRENCY
+        self._read_ahead = block_size
+        self._position = 0
+        self._block = b''
+        self._block_start = 0
+        self._end = None
+
+    @property
+    def size(self):
+        """
+        The size of the object in bytes, retrieved with a HEAD request if it isn't known from a previous read.
+        """
+        if self._size is None:
+            response = _head_object(self.bucket, self.key)
+            self._size = response['ContentLength']
+            self.e_tag = response['ETag']
+        return self._size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f'invalid whence ({whence})')
+        if position < 0:
+            raise ValueError(f'negative seek position {position}')
+        self._position = position
+        return position
+
+    def readinto(self, b):
+        view = memoryview(b).cast('B')
+        if self._size is None:
+            self._read_first(max(len(view), self._block_size))
+        size = min(len(view), self._size - self._position)
+        if size <= 0:
+            return 0
+        view = view[:size]
+        copied = 0
+        offset = self._position - self._block_start
+        if 0 <= offset < len(self._block):
+            copied = min(size, len(self._block) - offset)
+            view[:copied] = self._block[offset:offset + copied]
+        if copied < size:
+            start = self._position + copied
+            remaining = size - copied
+            # Sequential reads retrieve progressively larger blocks, up to the part size
+            self._read_ahead = min(self._read_ahead * 2, self._part_size) if start == self._end else self._block_size
+            length = min(max(remaining, self._read_ahead), self._size - start)
+            if length == remaining:
+                self._read_range(view[copied:], start)
+            else:
+                block = bytearray(length)
+                self._read_range(memoryview(block), start)
+                self._block, self._block_start = block, start
+                view[copied:] = block[:remaining]
+            self._end = start + length
+        self._position += size
+        return size
+
+    def readall(self):
+        data = bytearray(max(self.size - self._position, 0))
+        self.readinto(data)
+        return bytes(data)
+
+    def _read_first(self, length):
+        """
+        Retrieves the first block that is read and takes the size and ETag of the object from the response.
+        """
+        try:
+            response = _get_object(self.bucket, self.key,
+                                   Range=f'bytes={self._position}-{self._position + length - 1}')
+        except ClientError as e:
+            # The position is past the end of the object, or the object is empty
+            if e.code == 'InvalidRange':
+                return self.size
+            raise e
+        self._size = int(response['ContentRange'].split('/')[-1])
+        self.e_tag = response['ETag']
+        self._block = response['Body'].read()
+        self._block_start = self._position
+        self._end = self._position + len(self._block)
+        self.bytes_requested += len(self._block)
+
+    def _read_range(self, view, start):
+        def read_part(offset):
+            end = min(offset + self._part_size, len(view))
+            body = _get_object(self.bucket, self.key, Range=f'bytes={start + offset}-{start + end - 1}',
+                               IfMatch=self.e_tag)['Body']
+            position = offset
+            for chunk in body.iter_chunks(DEFAULT_CHUNK_SIZE):
+                view[position:position + len(chunk)] = chunk
+                position += len(chunk)
+            if position != end:
+                raise IOError(f'Expected {end - offset} bytes from s3://{self.bucket}/{self.key} at '
+                              f'{start + offset}, received {position - offset}')
+
+        offsets = range(0, len(view), self._part_size)
+        if len(offsets) == 1:
+            read_part(0)
+        else:
+            with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+                for future in [executor.submit(read_part, offset) for offset in offsets]:
+                    future.result()
+        self.bytes_requested += len(view)
+
+    def __repr__(self):
+        return f'ObjectReader(bucket="{self.bucket}", key="{self.key}")'
+
+
+class ObjectWriter(io.BufferedIOBase):
+    """
+    A writable file-like object that uploads its contents to S3. Data is buffered in memory and sent as the parts
+    of a multipart upload as the buffer fills, so the full body is never held in memory. The upload is completed
+    when the writer is closed, or aborted if the `with` block exits with an exception. Content that fits within a
+    single part is written with a single put instead.
+
+    .. code-block:: python
+
+        import larry as lry
+        with lry.s3.ObjectWriter('s3://my-bucket/output.bin') as fp:
+            for chunk in chunks:
+                fp.write(chunk)
+
+    :param location: Positional values for bucket, key, and/or uri
+    :param bucket: The S3 bucket for the object
+    :param key: The key of the object
+    :param uri: An s3:// path containing the bucket and key of the object
+    :param acl: The canned ACL to apply to the object
+    :param content_type: Content type to apply to the object
+    :param content_encoding: Specifies what content encodings have been applied to the object
+    :param content_language: The language the content is in.
+    :param metadata: A map of metadata to store with the object in S3.
+    :param sse: The server-side encryption algorithm used when storing this object in Amazon S3.
+    :param storage_class: The S3 storage class to store the object in.
+    :param tags: The tag-set for the object. Can be either a dict or url encoded key/value string.
+    :param part_size: The number of bytes to buffer before sending a part, defaults to DEFAULT_PART_SIZE
+    :param max_concurrency: The number of parts that can be uploading at once, defaults to DEFAULT_MAX_CONCURRENCY
+    :param compression: The name of one of the COMPRESSION_CODECS to compress the written data with
+    :param compression_level: The compression level to use, the codec's default if omitted
+    :param skip_compressed: True to write the data as is, rather than compressing it, if it starts with the magic
+        bytes of the compression codec
+    """
+
+    def __init__(self, *location, bucket=None, key=None, uri=None, acl=None, content_type=None,
+                 content_encoding=None, content_language=None, metadata=None, sse=None, storage_class=None,
+                 tags=None, part_size=None, max_concurrency=None, compression=None, compression_level=None,
+                 skip_compressed=False):
+        super().__init__()
+        self.bucket, self.key, _ = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+        self._params = _write_params(acl=acl, content_type=content_type, content_encoding=content_encoding,
+                                     content_language=content_language, metadata=metadata, sse=sse,
+                                     storage_class=storage_class, tags=tags)
+        self._part_size = max(part_size if part_size else DEFAULT_PART_SIZE, MIN_PART_SIZE)
+        self._max_concurrency = max_concurrency if max_concurrency else DEFAULT_MAX_CONCURRENCY
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._executor = None
+        self._parts = []
+        self._compressor = _compressor(compression, compression_level) if compression else None
+        self._compression = compression
+        self._unchecked = bytearray() if compression and skip_compressed else None
+        self.bytes_written = 0
+
+    def writable(self):
+        return True
+
+    @attach_exception_handler
+    def write(self, b):
+        if self.closed:
+            raise ValueError('write to closed file')
+        size = memoryview(b).nbytes
+        self.bytes_written += size
+        if self._unchecked is not None:
+            # the data is held until there's enough of it to tell whether it's already compressed
+            self._unchecked += b
+            if len(self._unchecked) < len(_COMPRESSION_MAGIC[self._compression]):
+                return size
+            b, self._unchecked = self._unchecked, None
+            if _is_compressed(self._compression, b):
+                self._compressor = None
+        self._buffer += self._compressor.compress(b) if self._compressor is not None else b
+        if len(self._buffer) >= self._part_size:
+            self._upload_part()
+        return size
+
+    def _upload_part(self):
+        client = _get_resource().meta.client
+        if self._upload_id is None:
+            self._upload_id = client.create_multipart_upload(Bucket=self.bucket, Key=self.key,
+                                                             **self._params)['UploadId']
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+        # Surface any failed parts and wait for a slot so that memory use stays bounded
+        in_flight = []
+        for part in self._parts:
+            if part.done():
+                part.result()
+            else:
+                in_flight.append(part)
+        if len(in_flight) >= self._max_concurrency:
+            wait(in_flight, return_when=FIRST_COMPLETED)
+        data, self._buffer = self._buffer, bytearray()
+        part_number = len(self._parts) + 1
+
+        def upload():
+            response = client.upload_part(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id,
+                                          PartNumber=part_number, Body=data)
+            return {'PartNumber': part_number, 'ETag': response['ETag']}
+        self._parts.append(self._executor.submit(upload))
+
+    @attach_exception_handler
+    def close(self):
+        """
+        Writes any remaining data and completes the upload.
+        """
+        if self.closed:
+            return
+        try:
+            client = _get_resource().meta.client
+            _forget_snapshots(self.bucket, [self.key])
+            if self._unchecked is not None:
+                self._buffer += self._compressor.compress(self._unchecked)
+                self._unchecked = None
+            if self._compressor is not None:
+                self._buffer += self._compressor.flush()
+                self._compressor = None
+            if self._upload_id is None:
+                client.put_object(Bucket=self.bucket, Key=self.key, Body=self._buffer, **self._params)
+            else:
+                if len(self._buffer) > 0:
+                    self._upload_part()
+                parts = [part.result() for part in self._parts]
+                client.complete_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id,
+                                                 MultipartUpload={'Parts': parts})
+        except Exception as e:
+            self.abort()
+            raise e
+        self._shutdown()
+        super().close()
+
+    @attach_exception_handler
+    def abort(self):
+        """
+        Discards the buffered data and aborts the multipart upload if one has been started.
+        """
+        if self.closed:
+            return
+        self._buffer = bytearray()
+        self._shutdown()
+        try:
+            if self._upload_id is not None:
+                _get_resource().meta.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key,
+                                                                   UploadId=self._upload_id)
+        finally:
+            super().close()
+
+    def _shutdown(self):
+        if self._executor is not None:
+            for part in self._parts:
+                part.cancel()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __repr__(self):
+        return f'ObjectWriter(bucket="{self.bucket}", key="{self.key}")'
+
+
+class _TextObjectWriter(io.TextIOWrapper):
+    """
+    Text layer over an ObjectWriter that aborts the upload if the `with` block exits with an exception.
+    """
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.buffer.abort()
+
+
+_OPEN_MODES = ('r', 'rb', 'w', 'wb')
+
+
+def open(*location, mode=None, bucket=None, key=None, uri=None, encoding=None, newline=None, acl=None,
+         content_type=None, content_encoding=None, content_language=None, metadata=None, sse=None,
+         storage_class=None, tags=None, part_size=None, max_concurrency=None, compression_level=None):
+    """
+    Opens an S3 object as a file-like object. Reads stream the contents of the object and writes are uploaded
+    in parts as they are buffered using an ObjectWriter. The mode can be passed as the last positional value.
+    Objects with a content encoding or key suffix of one of the COMPRESSION_CODECS are decompressed as they are
+    read and compressed as they are written, unless the data written in a binary mode already starts with the magic
+    bytes of the codec (such as the contents of a .gz file), in which case it's written as is.
+
+    .. code-block:: python
+
+        import larry as lry
+        with lry.s3.open('s3://my-bucket/output.txt', 'w') as fp:
+            for line in lines:
+                fp.write(line + '\n')
+
+    :param location: Positional values for bucket, key, and/or uri
+    :param mode: One of 'r', 'rb', 'w', or 'wb', defaults to 'rb'
+    :param bucket: The S3 bucket for the object
+    :param key: The key of the object
+    :param uri: An s3:// path containing the bucket and key of the object
+    :param encoding: The charset to use for text modes, utf-8 by default
+    :param newline: Controls line endings in text modes, as in the builtin open
+    :param acl: The canned ACL to apply to the object
+    :param content_type: Content type to apply to the object, if not present a suggested type will be applied
+    :param content_encoding: Specifies what content encodings have been applied to the object
+    :param content_language: The language the content is in.
+    :param metadata: A map of metadata to store with the object in S3.
+    :param sse: The server-side encryption algorithm used when storing this object in Amazon S3.
+    :param storage_class: The S3 storage class to store the object in.
+    :param tags: The tag-set for the object. Can be either a dict or url encoded key/value string.
+    :param part_size: The number of bytes in each uploaded part
+    :param max_concurrency: The number of parts that can be uploading at once
+    :param compression_level: The compression level to use when writing compressed objects
+    :return: A file-like object
+    """
+    if mode is None:
+        mode = 'rb'
+        if len(location) > 1 and location[-1] in _OPEN_MODES and \
+                (len(location) == 3 or not isinstance(location[0], str) or is_uri(location[0])):
+            *location, mode = location
+    if mode not in _OPEN_MODES:
+        raise ValueError(f"invalid mode: '{mode}'")
+    bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    if encoding is None and 'b' not in mode:
+        encoding = DEFAULT_ENCODING
+
+    if mode.startswith('r'):
+        return _open_reader(bucket, key, encoding=encoding, newline=newline)
+    compression = _codec(content_encoding, key)
+    if compression and content_type is None and not content_encoding:
+        content_type = COMPRESSION_CODECS[compression][1]
+    writer = ObjectWriter(bucket=bucket, key=key, acl=acl, content_type=_recommend_content_type(content_type, key),
+                          content_encoding=content_encoding, content_language=content_language, metadata=metadata,
+                          sse=sse, storage_class=storage_class, tags=tags, part_size=part_size,
+                          max_concurrency=max_concurrency, compression=compression,
+                          compression_level=compression_level, skip_compressed='b' in mode)
+    if 'b' in mode:
+        return writer
+    return _TextObjectWriter(writer, encoding=encoding, newline=newline)
+
+
+@larrydispatch
+def format_type_for_write(_type, value, key=None, content_type=None, **kwargs):
+    return value, _recommend_content_type(content_type, key)
+
+
+@format_type_for_write.register_module_name("cv2")
+@format_type_for_write.register_callable_name("imwrite")
+def _(_type, value, key=None, content_type=None, **kwargs):
+    suffix = os.path.splitext(key)[1]
+    content_type = _recommend_content_type(content_type, key, "image/png")
+    cv2 = _cv2_module(_type)
+    if cv2 is not None:
+        extension = suffix if suffix else '.png'
+        success, buffer = cv2.imencode(extension, value, kwargs.get('params', []))
+        if not success:
+            raise ValueError(f'Unable to encode the image as {extension}')
+        return buffer.tobytes(), content_type
+
+    # other imwrite callables write to the path of a local file
+    handle, filepath = tempfile.mkstemp(suffix=suffix if suffix else '.png')
+    try:
+        _type(filepath, value, **kwargs)
+        with io.open(filepath, 'rb') as fp:
+            result = fp.read()
+    finally:
+        os.close(handle)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+    return result, content_type
+
+
+@format_type_for_write.register_eq(str)
+def _(_type, value, key=None, content_type=None, **kwargs):
+    return value, _recommend_content_type(content_type, key, "text/plain")
 
 
 @format_type_for_write.register_eq(int)
 @format_type_for_write.register_eq(float)
 def _(_type, value, key=None, content_type=None, **kwargs):
-    return str(value), __recommend_content_type(content_type, key, "text/plain")
+    return str(value), _recommend_content_type(content_type, key, "text/plain")
 
 
 @format_type_for_write.register_eq(dict)
@@ -642,45 +2554,52 @@ def _(_type, value, key=None, content_type=None, **kwargs):
 def _(_type, value, key=None, content_type=None, **kwargs):
     kw = supported_kwargs(json.dumps, **kwargs)
     return (json.dumps(value, cls=kwargs.get("cls", utils.JSONEncoder), **kw),
-            __recommend_content_type(content_type, key, "application/json"))
+            _recommend_content_type(content_type, key, "application/json"))
+
+
+# The list formatters return generators so that the rows are serialized as they are uploaded
 
 
 @format_type_for_write.register_eq([str])
 def _(_type, value, key=None, content_type=None, **kwargs):
-    buff = StringIO()
-    for row in value:
-        buff.write(row + kwargs.get("newline", DEFAULT_NEWLINE))
-    return buff.getvalue(), __recommend_content_type(content_type, key, "text/plain")
+    newline = kwargs.get("newline", DEFAULT_NEWLINE)
+    return (row + newline for row in value), _recommend_content_type(content_type, key, "text/plain")
 
 
 @format_type_for_write.register_eq([dict])
 @format_type_for_write.register_eq([json])
 def _(_type, value, key=None, content_type=None, **kwargs):
     kw = supported_kwargs(json.dumps, **kwargs)
+    cls = kwargs.get("cls", utils.JSONEncoder)
+    newline = kwargs.get("newline", DEFAULT_NEWLINE)
+    return ((json.dumps(row, cls=cls, **kw) + newline for row in value),
+            _recommend_content_type(content_type, key, "text/plain"))
+
+
+def _csv_rows(value, **kwargs):
     buff = StringIO()
+    writer = csv.writer(buff, **kwargs)
     for row in value:
-        buff.write(json.dumps(row, cls=kwargs.get("cls", utils.JSONEncoder), **kw) + kwargs.get("newline", DEFAULT_NEWLINE))
-    return buff.getvalue(), __recommend_content_type(content_type, key, "text/plain")
+        writer.writerow(row)
+        yield buff.getvalue()
+        buff.seek(0)
+        buff.truncate()
 
 
 @format_type_for_write.register_eq(csv)
 @format_type_for_write.register_eq(csv.writer)
 def _(_type, value, key=None, content_type=None, **kwargs):
-    buff = StringIO()
-    writer = csv.writer(buff, **kwargs)
-    for row in value:
-        writer.writerow(row)
-    return buff.getvalue(), __recommend_content_type(content_type, key, "text/plain")
+    return _csv_rows(value, **kwargs), _recommend_content_type(content_type, key, "text/plain")
 
 
 @format_type_for_write.register_eq(pickle)
 def _(_type, value, key=None, content_type=None, **kwargs):
-    return pickle.dumps(value, **kwargs), __recommend_content_type(content_type, key, "application/octet-stream")
+    return pickle.dumps(value, **kwargs), _recommend_content_type(content_type, key, "application/octet-stream")
 
 
 def __get_pillow_format(value, content_type, key, **kwargs):
     mimetype = value.get_format_mimetype() if hasattr(value, "get_format_mimetype") else None
-    content_type = __recommend_content_type(content_type, key, mimetype)
+    content_type = _recommend_content_type(content_type, key, mimetype)
     fmt = kwargs.get("format", value.format)
     if fmt is None:
         fmt = __content_type_to_pillow_format.get(content_type, "PNG")
@@ -696,28 +2615,145 @@ def _(_type, value, key=None, content_type=None, **kwargs):
     return objct.getvalue(), content_type
 
 
-@format_type_for_write.register_type_name("ndarray")
-@format_type_for_write.register_class_name("ndarray")
+class _Chunks(Iterator):
+    """
+    An iterator of the chunks of a serialized value along with the number of records in the value, for formats whose
+    chunks don't correspond to records.
+    """
+
+    def __init__(self, chunks, records):
+        self._chunks = iter(chunks)
+        self.records = records
+
+    def __next__(self):
+        return next(self._chunks)
+
+
+def _npy_chunks(np, value, chunk_size=DEFAULT_PART_SIZE, **kwargs):
+    """
+    Generates the contents of a .npy file for an array, yielding the header followed by views of the array data so
+    that the data isn't copied. Arrays that aren't contiguous or contain objects are written with write_array.
+    """
+    value = np.asanyarray(value)
+    if value.dtype.hasobject or not (value.flags.c_contiguous or value.flags.f_contiguous):
+        buff = BytesIO()
+        np.lib.format.write_array(buff, value, **kwargs)
+        yield buff.getbuffer()
+        return
+    header = BytesIO()
+    header_data = np.lib.format.header_data_from_array_1_0(value)
+    try:
+        np.lib.format.write_array_header_1_0(header, header_data)
+    except ValueError:
+        header = BytesIO()
+        np.lib.format.write_array_header_2_0(header, header_data)
+    yield header.getvalue()
+    data = (value if value.flags.c_contiguous else value.T).reshape(-1).view(np.uint8)
+    for start in range(0, len(data), chunk_size):
+        yield memoryview(data[start:start + chunk_size])
+
+
+@format_type_for_write.register_type_name("ndarray")
+@format_type_for_write.register_class_name("ndarray")
+def _(_type, value, key=None, content_type=None, **kwargs):
+    kw = {k: v for k, v in kwargs.items() if k in ["allow_pickle"]}
+    try:
+        import numpy as np
+        return _Chunks(_npy_chunks(np, value, **kw), np.size(value)), None
+    except ImportError as ex:
+        # Simply raise the ImportError to let the user know this requires Numpy to function
+        raise ex
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    A writable file-like object that holds the data written to it until it is taken, used to convert the output of
+    writers that require a file into a stream of bytes values.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        data = bytes(b)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def take(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _parquet_chunks(table, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+    """
+    Writes a pyarrow Table as Parquet one row group at a time and yields the bytes of each row group as it is
+    written, followed by the footer.
+    """
+    import pyarrow.parquet as pq
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, table.schema)
+    try:
+        for offset in range(0, table.num_rows, row_group_size):
+            writer.write_table(table.slice(offset, row_group_size))
+            yield sink.take()
+    finally:
+        writer.close()
+    yield sink.take()
+
+
+@format_type_for_write.register_module_name("pyarrow")
+@format_type_for_write.register_module_name("pyarrow.parquet")
+@format_type_for_write.register_module_name("pandas")
+@format_type_for_write.register_type_name("Table")
+@format_type_for_write.register_type_name("DataFrame")
+@format_type_for_write.register_class_name("Table")
 def _(_type, value, key=None, content_type=None, **kwargs):
-    kw = {k: v for k, v in kwargs.items() if k in ["allow_pickle", "fix_imports"]}
-    try:
-        import numpy as np
-        with tempfile.TemporaryFile() as fp:
-            np.save(fp, value, **kw)
-            fp.seek(0)
-            return fp.read(), None
-    except ImportError as ex:
-        # Simply raise the ImportError to let the user know this requires Numpy to function
-        raise ex
+    import pyarrow as pa
+    if type(value).__module__.startswith('pandas'):
+        value = pa.Table.from_pandas(value)
+    elif not isinstance(value, pa.Table):
+        value = pa.table(value)
+    kw = {k: v for k, v in kwargs.items() if k in ["row_group_size"]}
+    return (_Chunks(_parquet_chunks(value, **kw), value.num_rows),
+            _recommend_content_type(content_type, key, 'application/vnd.apache.parquet'))
 
 
 def write_as(value, _type, *location, bucket=None, key=None, uri=None, acl=None, content_type=None,
              content_encoding=None, content_language=None, content_length=None, metadata=None, sse=None,
-             storage_class=None, tags=None, encoding=None, **kwargs):
+             storage_class=None, tags=None, encoding=None, part_size=None, max_concurrency=None,
+             compression=None, compression_level=None, compression_workers=None, **kwargs):
     """
     Write an object to the bucket/key pair (or uri), converting the python
     object to an appropriate format to write to file.
 
+    List types such as [dict], [str], or csv accept any iterable, including generators, and are serialized one
+    record at a time as the object is uploaded in parts. Memory use stays constant regardless of the number of
+    records, and the count of records and bytes written are available on the returned object.
+
+    If the content encoding or the suffix of the key is one of the COMPRESSION_CODECS (gzip/.gz, zstd/.zst,
+    bzip2/.bz2, or xz/.xz) the content is compressed as it is written, and it will be decompressed when read with
+    `read_as`, `iter_lines`, or `open`. Bytes values and binary files that already start with the magic bytes of the
+    codec, such as the contents of a .gz file, are written as is unless `compression` is provided.
+
+    .. code-block:: python
+
+        import larry as lry
+        obj = lry.s3.write_as(lry.dynamo.scan_iter('my-table'), [dict], 's3://my-bucket/table.jsonl')
+        print(obj.records_written, obj.bytes_written)
+
+        # compressed with gzip using four threads
+        lry.s3.write_as(records, [dict], 's3://my-bucket/table.jsonl.gz', compression_workers=4)
+
     :param value: Object to write to S3
     :param _type: The data type to write the value using
     :param location: Positional values for bucket, key, and/or uri
@@ -735,17 +2771,38 @@ def write_as(value, _type, *location, bucket=None, key=None, uri=None, acl=None,
     :param storage_class: The S3 storage class to store the object in.
     :param tags: The tag-set for the object. Can be either a dict or url encoded key/value string.
     :param encoding: The byte encoding to use for str values.
+    :param part_size: The number of bytes in each uploaded part when the value is streamed
+    :param max_concurrency: The number of parts that can be uploading at once when the value is streamed
+    :param compression: The name of one of the COMPRESSION_CODECS to compress the value with, by default the codec
+        is determined by the content encoding or the key suffix
+    :param compression_level: The compression level to use for compressed objects, the codec's default if omitted
+    :param compression_workers: The number of threads to compress blocks of part_size bytes with concurrently, by
+        default the content is compressed as a single stream
+    :param kwargs: row_group_size, the number of rows in each row group when writing a Parquet Table or DataFrame
     :return: The URI of the object written to S3
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    value, content_type = format_type_for_write(_type, value, key, content_type)
+    options = {k: v for k, v in kwargs.items() if k in ['row_group_size']}
+    inferred = compression is None
+    if inferred:
+        compression = _codec(content_encoding, key)
+    if compression and content_type is None and not content_encoding:
+        # Without a content encoding the object is a compressed file rather than compressed content of another type
+        content_type = COMPRESSION_CODECS[compression][1]
+        value, _ = format_type_for_write(_type, value, key, None, **options)
+    else:
+        value, content_type = format_type_for_write(_type, value, key, content_type, **options)
+    if inferred and compression and _is_compressed(compression, value):
+        compression = None
     return _write(value, bucket=bucket, key=key, uri=uri, acl=acl, content_type=content_type,
                   content_encoding=content_encoding, content_language=content_language,
                   content_length=content_length, metadata=metadata, sse=sse, storage_class=storage_class,
-                  tags=tags, encoding=encoding)
+                  tags=tags, encoding=encoding, part_size=part_size, max_concurrency=max_concurrency,
+                  compression=compression, compression_level=compression_level,
+                  compression_workers=compression_workers)
 
 
-def __recommend_content_type(content_type, key, default=None):
+def _recommend_content_type(content_type, key, default=None):
     if content_type is None:
         if key:
             suffix = os.path.splitext(key)[1]
@@ -841,23 +2898,20 @@ def _(value, *location, bucket=None, key=None, uri=None, acl=None, content_type=
 
 
 @write.register(list)
-# TODO: Replace with iter solution?
+@write.register(GeneratorType)
 def _(value, *location, bucket=None, key=None, uri=None, acl=None, content_type=None,
       content_encoding=None, content_language=None, content_length=None, metadata=None, sse=None,
       storage_class=None, tags=None, encoding=None, **kwargs):
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    content_type = __recommend_content_type(content_type, key, "text/plain")
-    buff = StringIO()
-    for row in value:
-        if isinstance(row, Mapping):
-            v, ct = format_type_for_write(dict, row, **kwargs)
-        else:
-            v, ct = format_type_for_write(str, row, **kwargs)
-        buff.write(v + kwargs.get("newline", DEFAULT_NEWLINE))
-    return _write(buff.getvalue(), bucket=bucket, key=key, uri=uri, acl=acl, content_type=content_type,
+    content_type = _recommend_content_type(content_type, key, "text/plain")
+    newline = kwargs.get("newline", DEFAULT_NEWLINE)
+    rows = (format_type_for_write(dict if isinstance(row, Mapping) else str, row, **kwargs)[0] + newline
+            for row in value)
+    return _write(rows, bucket=bucket, key=key, uri=uri, acl=acl, content_type=content_type,
                   content_encoding=content_encoding, content_language=content_language,
                   content_length=content_length, metadata=metadata, sse=sse, storage_class=storage_class,
-                  tags=tags, encoding=encoding)
+                  tags=tags, encoding=encoding, part_size=kwargs.get('part_size'),
+                  max_concurrency=kwargs.get('max_concurrency'))
 
 
 @write.register_class_name("PngImageFile")
@@ -879,6 +2933,7 @@ def _(value, *location, bucket=None, key=None, uri=None, acl=None, content_type=
                   metadata=metadata, sse=sse, storage_class=storage_class, tags=tags)
 
 
+@write.register_class_name("Table")
 @write.register_class_name("ndarray")
 def _(value, *location, bucket=None, key=None, uri=None, acl=None, content_type=None,
       content_encoding=None, content_language=None, content_length=None, metadata=None, sse=None,
@@ -889,38 +2944,22 @@ def _(value, *location, bucket=None, key=None, uri=None, acl=None, content_type=
                     storage_class=storage_class, tags=tags, **kwargs)
 
 
-def __append(content, bucket=None, key=None, prefix=None, suffix=None, encoding=None):
+def _append_content(content, bucket=None, key=None, prefix=None, suffix=None, encoding=None, max_age=None):
     """
-    Reads in an existing object, adds additional content, and then writes it back out with the same attributes
-    and ACLs.
+    Adds additional content to the end of an existing object, retaining its attributes, tags, and ACLs. Objects
+    that meet the minimum part size are rebuilt server-side with a multipart upload that copies the existing body
+    and uploads only the new content; smaller objects are read and rewritten. Both the copy or read and the final
+    write are conditioned on the ETag of the object so that a concurrent modification of its body raises an error
+    rather than being lost. Objects compressed with one of the COMPRESSION_CODECS (as indicated by the content
+    encoding or the key suffix) have the content added as a new compressed stream, compressing it unless it already
+    starts with the magic bytes of the codec.
+
+    The attributes, tags, and ACL come from a snapshot of the object, reusing one taken within max_age seconds if
+    provided, and the snapshot is updated after the append so that successive appends don't need to retrieve them
+    again. If a reused snapshot is out of date the append is retried once with a new snapshot. Changes to the tags,
+    ACL, or metadata that leave the body unchanged also leave the ETag unchanged, so an append with a reused
+    snapshot replaces any such changes made since the snapshot was taken.
     """
-    # load the object and build the parameters that will be used to rewrite it
-    objct = Object(bucket, key)
-    values = {
-        'content_encoding': objct.content_encoding,
-        'content_language': objct.content_language,
-        'content_type': objct.content_type,
-        'metadata': objct.metadata,
-        'sse': objct.server_side_encryption,
-        'storage_class': objct.storage_class
-    }
-    params = larry.core.map_parameters(values, {
-        'content_encoding': 'ContentEncoding',
-        'content_language': 'ContentLanguage',
-        'content_length': 'ContentLength',
-        'content_type': 'ContentType',
-        'metadata': 'Metadata',
-        'sse': 'ServerSideEncryption',
-        'storage_class': 'StorageClass',
-    })
-    if objct.tags:
-        params['Tagging'] = parse.urlencode(objct.tags)
-
-    # get the current ACL
-    acl = objct.Acl()
-    grants = acl.grants
-    owner = acl.owner
-
     if prefix:
         content = prefix + content
     if suffix:
@@ -931,22 +2970,91 @@ def __append(content, bucket=None, key=None, prefix=None, suffix=None, encoding=
             encoding = DEFAULT_ENCODING
         content = content.encode(encoding)
 
-    body = objct.get()['Body'].read() + content
-    objct.put(Body=body, **params)
-    objct.Acl().put(AccessControlPolicy={
-        'Grants': grants,
-        'Owner': owner
+    try:
+        snapshot = _append_snapshot(content, bucket, key, max_age)
+    except ClientError as e:
+        if max_age is None or e.code not in ('PreconditionFailed', '412'):
+            raise e
+        snapshot = _append_snapshot(content, bucket, key, None)
+    _remember_snapshot(snapshot)
+
+
+def _append_snapshot(content, bucket, key, max_age):
+    """
+    Appends the content to the object using its snapshot and returns a snapshot of the updated object.
+    """
+    snapshot = _existing_snapshot(bucket, key, max_age)
+    codec = _codec(snapshot.content_encoding, key)
+    if codec and not _is_compressed(codec, content):
+        # the content is added as a new compressed stream, which is decompressed after the existing ones when read
+        content = _compress(codec, content)
+    params = _write_params(content_encoding=snapshot.content_encoding,
+                           content_language=snapshot.content_language,
+                           content_type=snapshot.content_type,
+                           metadata=dict(snapshot.metadata),
+                           sse=snapshot.server_side_encryption,
+                           storage_class=snapshot.storage_class,
+                           tags=dict(snapshot.tags))
+    _forget_snapshots(bucket, [key])
+    if snapshot.content_length < MIN_PART_SIZE:
+        body = _get_object(bucket, key, IfMatch=snapshot.e_tag)['Body'].read() + content
+        e_tag = _put_object(bucket, key, Body=body, IfMatch=snapshot.e_tag, **params)['ETag']
+    else:
+        e_tag = _append_parts(snapshot, content, params)
+    _put_object_acl(bucket, key, AccessControlPolicy={
+        'Grants': list(snapshot.grants),
+        'Owner': dict(snapshot.owner)
     })
+    return snapshot.replace(content_length=snapshot.content_length + len(content), e_tag=e_tag,
+                            last_modified=None, version_id=None)
+
+
+@attach_exception_handler
+def _put_object(bucket, key, **kwargs):
+    return _get_resource().meta.client.put_object(Bucket=bucket, Key=key, **kwargs)
+
+
+@attach_exception_handler
+def _put_object_acl(bucket, key, **kwargs):
+    return _get_resource().meta.client.put_object_acl(Bucket=bucket, Key=key, **kwargs)
+
+
+@attach_exception_handler
+def _append_parts(snapshot, content, params):
+    client = _get_resource().meta.client
+    bucket, key, size = snapshot.bucket_name, snapshot.key, snapshot.content_length
+    upload_id = client.create_multipart_upload(Bucket=bucket, Key=key, **params)['UploadId']
+    try:
+        # split the existing body into evenly sized copy parts so that none fall below the minimum part size
+        count = -(-size // MAX_COPY_PART_SIZE)
+        copy_size = -(-size // count)
+        parts = []
+        for start in range(0, size, copy_size):
+            response = client.upload_part_copy(
+                Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=len(parts) + 1,
+                CopySource={'Bucket': bucket, 'Key': key}, CopySourceIfMatch=snapshot.e_tag,
+                CopySourceRange=f'bytes={start}-{min(start + copy_size, size) - 1}')
+            parts.append({'PartNumber': len(parts) + 1, 'ETag': response['CopyPartResult']['ETag']})
+        if len(content) > 0:
+            response = client.upload_part(Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=len(parts) + 1,
+                                          Body=content)
+            parts.append({'PartNumber': len(parts) + 1, 'ETag': response['ETag']})
+        return client.complete_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id, IfMatch=snapshot.e_tag,
+                                                MultipartUpload={'Parts': parts})['ETag']
+    except Exception as e:
+        client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        raise e
 
 
 def append_as(value, _type, *location, bucket=None, key=None, uri=None, prefix=None, suffix=None, encoding=DEFAULT_ENCODING,
-              **kwargs):
+              max_age=None, **kwargs):
     """
     Append content to the end of an s3 object. Assumes that the data should be treated as text in most cases.
 
-    Note that this is not efficient as it requires a read/write for each call and isn't thread safe. It is only
-    intended as a helper for simple operations such as capturing infrequent events and should not be used in a
-    multithreading or multi-user environment.
+    Objects of 5 MB or more are extended server-side so that each call only uploads the new content; smaller
+    objects are read and rewritten. Appends aren't atomic, but both the read or copy of the existing content and the
+    final write are conditioned on its ETag, so if the body is modified by another writer during the call a
+    ClientError is raised rather than losing that change. For frequent appends consider batching the content first.
 
     :param value: Data to write
     :param _type: The data type to write the value using
@@ -957,20 +3065,27 @@ def append_as(value, _type, *location, bucket=None, key=None, uri=None, prefix=N
     :param prefix: Value to prepend to the value
     :param suffix: Value to attach to the end of the value such as "\n"
     :param encoding: Encoding to use when writing str to bytes
+    :param max_age: If provided, a snapshot of the object (see Object.snapshot) taken within this many seconds is
+        used for the attributes, tags, and ACL of the object rather than retrieving them. Only changes to the body
+        of the object are detected, so tags, ACL, or metadata changed since the snapshot are overwritten.
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
     value, content_type = format_type_for_write(_type, value, key, None)
-    __append(value, bucket=bucket, key=key, prefix=prefix, suffix=suffix, encoding=encoding)
+    if isinstance(value, Iterator):
+        value = ''.join(value)
+    _append_content(value, bucket=bucket, key=key, prefix=prefix, suffix=suffix, encoding=encoding, max_age=max_age)
 
 
 @larrydispatch
-def append(value, *location, bucket=None, key=None, uri=None, prefix=None, suffix=None, encoding=DEFAULT_ENCODING, **kwargs):
+def append(value, *location, bucket=None, key=None, uri=None, prefix=None, suffix=None, encoding=DEFAULT_ENCODING,
+           max_age=None, **kwargs):
     """
     Append content to the end of an s3 object. Assumes that the data should be treated as text in most cases.
 
-    Note that this is not efficient as it requires a read/write for each call and isn't thread safe. It is only
-    intended as a helper for simple operations such as capturing infrequent events and should not be used in a
-    multithreading or multi-user environment.
+    Objects of 5 MB or more are extended server-side so that each call only uploads the new content; smaller
+    objects are read and rewritten. Appends aren't atomic, but both the read or copy of the existing content and the
+    final write are conditioned on its ETag, so if the body is modified by another writer during the call a
+    ClientError is raised rather than losing that change. For frequent appends consider batching the content first.
 
     :param value: Data to write
     :param location: Positional values for bucket, key, and/or uri
@@ -980,9 +3095,12 @@ def append(value, *location, bucket=None, key=None, uri=None, prefix=None, suffi
     :param prefix: Value to prepend to the value
     :param suffix: Value to attach to the end of the value such as "\n"
     :param encoding: Encoding to use when writing str to bytes
+    :param max_age: If provided, a snapshot of the object (see Object.snapshot) taken within this many seconds is
+        used for the attributes, tags, and ACL of the object rather than retrieving them. Only changes to the body
+        of the object are detected, so tags, ACL, or metadata changed since the snapshot are overwritten.
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    __append(value, bucket=bucket, key=key, prefix=prefix, suffix=suffix)
+    _append_content(value, bucket=bucket, key=key, prefix=prefix, suffix=suffix, max_age=max_age)
 
 
 @append.register(str)
@@ -1013,6 +3131,209 @@ def _(value, *location, bucket=None, key=None, uri=None, prefix=None, suffix=Non
               encoding=encoding, **kwargs)
 
 
+def _rolling_key(key, label):
+    """
+    Adds a label to a key ahead of its extension, keeping any compression suffix with the extension so that
+    `events.jsonl.gz` becomes `events-<label>.jsonl.gz`.
+    """
+    codec = _codec(None, key)
+    suffix = key[len(key) - len(COMPRESSION_CODECS[codec][0]):] if codec else ''
+    base, extension = posixpath.splitext(key[:len(key) - len(suffix)])
+    return f'{base}-{label}{extension}{suffix}'
+
+
+class Appender:
+    """
+    Collects values in memory and adds them to S3 in batches, for use in place of calling `append` for each of a
+    high volume of values such as logged events. Each value is formatted using the same rules as `append` (dicts are
+    written as JSON) and terminated with a newline. The buffered values are flushed when any of the record count,
+    byte size, or age thresholds are reached, by a background thread if the age threshold passes without any new
+    values, and when the appender is closed or the interpreter exits.
+
+    By default each flush is appended to the target object. If `rolling` is set to 'sequence' or 'time', each flush
+    is instead written to a new segment object with the sequence number or UTC timestamp added to the key
+    (`events.jsonl` becomes `events-000000.jsonl` or `events-20200101T000000000000Z.jsonl`). Sequence numbers
+    continue after the highest segment that already exists so that a restarted process doesn't overwrite them.
+
+    Keys ending in the suffix of one of the COMPRESSION_CODECS (such as `events.jsonl.gz`) are compressed, with each
+    flush appended as a new compressed stream or written as a compressed segment (`events-000000.jsonl.gz`).
+
+    The appender is expected to be the only writer of the target object. The attributes, tags, and ACL of the
+    object are retrieved once and reused for each flush, so changes made to them by others are overwritten.
+
+    .. code-block:: python
+
+        import larry as lry
+        with lry.s3.Appender('s3://my-bucket/events.jsonl', max_age=30) as appender:
+            for event in events:
+                appender.append(event)
+
+    :param location: Positional values for bucket, key, and/or uri
+    :param bucket: The S3 bucket of the object to add values to
+    :param key: The key of the object to add values to, or the base key of the rolling segments
+    :param uri: An s3:// path containing the bucket and key of the object
+    :param _type: The data type to format the values using, if not provided dicts are written as JSON and other
+        values as str
+    :param max_records: Flush after this many values have been buffered
+    :param max_bytes: Flush after this many bytes have been buffered
+    :param max_age: Flush when the oldest buffered value is this many seconds old
+    :param rolling: None to append to a single object, or 'sequence' or 'time' to write rolling segments
+    :param encoding: The byte encoding to use for str values
+    :param newline: The value to terminate each record with
+    :param kwargs: Additional arguments to pass to the formatter
+    """
+
+    def __init__(self, *location, bucket=None, key=None, uri=None, _type=None, max_records=1000,
+                 max_bytes=DEFAULT_PART_SIZE, max_age=60, rolling=None, encoding=DEFAULT_ENCODING,
+                 newline=DEFAULT_NEWLINE, **kwargs):
+        if rolling not in (None, 'sequence', 'time'):
+            raise ValueError("rolling must be one of None, 'sequence', or 'time'")
+        self.bucket, self.key, _ = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+        self._type = _type
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.rolling = rolling
+        self.encoding = encoding
+        self.newline = newline
+        self._kwargs = kwargs
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_started = None
+        self._sequence = None
+        self._error = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self.records_flushed = 0
+        self.bytes_flushed = 0
+        self._thread = None
+        if max_age:
+            self._thread = threading.Thread(target=self._run, name=f'larry-appender-{self.key}', daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _format(self, value):
+        if self._type is not None:
+            value = format_type_for_write(self._type, value, **self._kwargs)[0]
+        else:
+            _type = dict if isinstance(value, Mapping) else type(value)
+            value = format_type_for_write(_type, value, **self._kwargs)[0]
+        if isinstance(value, Iterator):
+            value = ''.join(value)
+        if not isinstance(value, (str, bytes, bytearray)):
+            value = str(value)
+        if isinstance(value, str):
+            value = value.encode(self.encoding)
+        return value + self.newline.encode(self.encoding)
+
+    def append(self, value):
+        """
+        Adds a value to the buffer, flushing if the record count or byte size threshold has been reached.
+        """
+        if self._closed.is_set():
+            raise ValueError('append to closed Appender')
+        self._raise_error()
+        data = self._format(value)
+        with self._lock:
+            if not self._buffer:
+                self._buffer_started = time.monotonic()
+            self._buffer.append(data)
+            self._buffer_bytes += len(data)
+            full = len(self._buffer) >= self.max_records or self._buffer_bytes >= self.max_bytes
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes any buffered values to S3.
+
+        :return: The key of the object written to, or None if there was nothing to flush
+        """
+        self._raise_error()
+        with self._flush_lock:
+            with self._lock:
+                if not self._buffer:
+                    return None
+                records, content = len(self._buffer), b''.join(self._buffer)
+                self._buffer = []
+                self._buffer_bytes = 0
+                self._buffer_started = None
+            key = self._write(content)
+            self.records_flushed += records
+            self.bytes_flushed += len(content)
+            return key
+
+    def _write(self, content):
+        compression = _codec(None, self.key)
+        content_type = COMPRESSION_CODECS[compression][1] if compression else None
+        if self.rolling is None:
+            try:
+                # the appender is expected to be the only writer so the snapshot from the previous flush is reused
+                _append_content(content, bucket=self.bucket, key=self.key, max_age=float('inf'))
+            except ClientError as e:
+                if e.code not in ('404', 'NoSuchKey'):
+                    raise e
+                _write(content, bucket=self.bucket, key=self.key, compression=compression,
+                       content_type=_recommend_content_type(content_type, self.key, 'text/plain'))
+            return self.key
+        if self.rolling == 'sequence':
+            if self._sequence is None:
+                self._sequence = self._next_sequence()
+            key = _rolling_key(self.key, f'{self._sequence:06d}')
+            self._sequence += 1
+        else:
+            key = _rolling_key(self.key, f'{datetime.datetime.utcnow():%Y%m%dT%H%M%S%fZ}')
+        _write(content, bucket=self.bucket, key=key, compression=compression,
+               content_type=_recommend_content_type(content_type, key, 'text/plain'))
+        return key
+
+    def _next_sequence(self):
+        # resume after the highest existing segment so that a restarted appender doesn't overwrite earlier segments
+        head, tail = _rolling_key(self.key, '\0').split('\0')
+        pattern = re.compile(re.escape(head) + r'(\d{6,})' + re.escape(tail) + '$')
+        sequences = [int(match.group(1)) for match in
+                     (pattern.match(content['Key']) for content in _list_contents(self.bucket, head)) if match]
+        return max(sequences) + 1 if sequences else 0
+
+    def _run(self):
+        # Wake up periodically to flush values that have been buffered for longer than max_age
+        interval = min(self.max_age, 1)
+        while not self._closed.wait(interval):
+            started = self._buffer_started
+            if started is not None and time.monotonic() - started >= self.max_age:
+                try:
+                    self.flush()
+                except Exception as e:
+                    self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """
+        Stops the background flush thread and writes any remaining values to S3.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        atexit.unregister(self.close)
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'Appender(bucket="{self.bucket}", key="{self.key}")'
+
+
 def move(old_bucket=None, old_key=None, old_uri=None, new_bucket=None, new_key=None, new_uri=None):
     """
     Creates a copy of an S3 object in a new location and deletes the object from the existing location.
@@ -1034,6 +3355,8 @@ def move(old_bucket=None, old_key=None, old_uri=None, new_bucket=None, new_key=N
         'Bucket': old_bucket,
         'Key': old_key
     }
+    _forget_snapshots(new_bucket, [new_key])
+    _forget_snapshots(old_bucket, [old_key])
     _get_resource().meta.client.copy(copy_source, new_bucket, new_key)
     _get_resource().meta.client.delete_object(Bucket=old_bucket, Key=old_key)
 
@@ -1055,10 +3378,253 @@ def copy(src_bucket=None, src_key=None, src_uri=None, new_bucket=None, new_key=N
         (src_bucket, src_key) = split_uri(src_uri)
     if new_uri:
         (new_bucket, new_key) = split_uri(new_uri)
+    _forget_snapshots(new_bucket, [new_key])
     _get_resource().meta.client.copy({'Bucket': src_bucket, 'Key': src_key}, new_bucket, new_key)
 
 
-def exists(*location, bucket=None, key=None, uri=None):
+@attach_exception_handler
+def _copy_object(src_bucket, src_key, new_bucket, new_key, size=None, e_tag=None, part_size=DEFAULT_COPY_PART_SIZE,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """
+    Copies an object server-side, using a single CopyObject request for objects up to the part size and concurrent
+    UploadPartCopy requests for larger objects. The copy is conditioned on the ETag of the source so that a change
+    to the source during the copy raises an error. Returns the number of bytes copied.
+    """
+    client = _get_resource().meta.client
+    _forget_snapshots(new_bucket, [new_key])
+    part_size = min(part_size, MAX_COPY_PART_SIZE)
+    if size is None or e_tag is None or size > part_size:
+        head = client.head_object(Bucket=src_bucket, Key=src_key)
+        size, e_tag = head['ContentLength'], head['ETag']
+    source = {'Bucket': src_bucket, 'Key': src_key}
+    if size <= part_size:
+        client.copy_object(Bucket=new_bucket, Key=new_key, CopySource=source, CopySourceIfMatch=e_tag)
+        return size
+
+    # multipart copies don't carry over the attributes of the source so they're applied to the new upload
+    params = larry.core.copy_non_null_keys({
+        'CacheControl': head.get('CacheControl'),
+        'ContentDisposition': head.get('ContentDisposition'),
+        'ContentEncoding': head.get('ContentEncoding'),
+        'ContentLanguage': head.get('ContentLanguage'),
+        'ContentType': head.get('ContentType'),
+        'Metadata': head.get('Metadata'),
+        'StorageClass': head.get('StorageClass'),
+    })
+    tags = client.get_object_tagging(Bucket=src_bucket, Key=src_key).get('TagSet', [])
+    if tags:
+        params['Tagging'] = parse.urlencode({tag['Key']: tag['Value'] for tag in tags})
+    # uploads are limited to 10,000 parts
+    part_size = max(part_size, -(-size // 10000))
+    upload_id = client.create_multipart_upload(Bucket=new_bucket, Key=new_key, **params)['UploadId']
+
+    def copy_part(part_number, start):
+        response = client.upload_part_copy(Bucket=new_bucket, Key=new_key, UploadId=upload_id,
+                                           PartNumber=part_number, CopySource=source, CopySourceIfMatch=e_tag,
+                                           CopySourceRange=f'bytes={start}-{min(start + part_size, size) - 1}')
+        return {'PartNumber': part_number, 'ETag': response['CopyPartResult']['ETag']}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            starts = range(0, size, part_size)
+            parts = list(executor.map(copy_part, range(1, len(starts) + 1), starts))
+        client.complete_multipart_upload(Bucket=new_bucket, Key=new_key, UploadId=upload_id,
+                                         MultipartUpload={'Parts': parts})
+    except Exception as e:
+        client.abort_multipart_upload(Bucket=new_bucket, Key=new_key, UploadId=upload_id)
+        raise e
+    return size
+
+
+def _load_checkpoint(checkpoint):
+    completed = {}
+    if checkpoint and os.path.exists(checkpoint):
+        with io.open(checkpoint) as fp:
+            for line in fp:
+                if line.strip():
+                    entry = json.loads(line)
+                    completed[(entry['bucket'], entry['key'], entry['new_bucket'], entry['new_key'])] = entry.get('etag')
+    return completed
+
+
+def _transfer_objects(items, delete_source=False, checkpoint=None, max_workers=DEFAULT_MAX_WORKERS,
+                      part_size=DEFAULT_COPY_PART_SIZE, retries=3):
+    """
+    Copies objects concurrently from (src_bucket, src_key, new_bucket, new_key, size, e_tag) tuples and returns a
+    summary. Each completed copy is appended to the checkpoint file, if provided, and copies that are already in the
+    checkpoint with the same ETag are skipped. When `delete_source` is True the sources are deleted in batches using
+    DeleteObjects once their copies have completed.
+    """
+    completed = _load_checkpoint(checkpoint)
+    summary = {'copied': 0, 'skipped': 0, 'bytes': 0, 'errors': []}
+    if delete_source:
+        summary['deleted'] = 0
+    deletes = {}
+    pending = {}
+    checkpoint_fp = io.open(checkpoint, 'a') if checkpoint else None
+
+    def collect(future):
+        kind, item = pending.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            summary['errors'].append({'bucket': item[0], 'key': item[1], 'code': getattr(e, 'code', None),
+                                      'message': str(e)})
+            return
+        if kind == 'delete':
+            summary['deleted'] += result[0]
+            summary['errors'].extend(result[1])
+            return
+        summary['copied'] += 1
+        summary['bytes'] += result
+        if checkpoint_fp:
+            checkpoint_fp.write(json.dumps({'bucket': item[0], 'key': item[1], 'new_bucket': item[2],
+                                            'new_key': item[3], 'etag': item[5]}) + '\n')
+            checkpoint_fp.flush()
+        confirmed(item)
+
+    def confirmed(item):
+        if delete_source:
+            keys = deletes.setdefault(item[0], [])
+            keys.append(item[1])
+            if len(keys) == 1000:
+                submit('delete', (item[0], None), _delete_chunk, item[0], deletes.pop(item[0]), retries)
+
+    def submit(kind, item, func, *args):
+        while len(pending) >= max_workers * 2:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(future)
+        pending[executor.submit(func, *args)] = (kind, item)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for item in items:
+                src_bucket, src_key, new_bucket, new_key, size, e_tag = item
+                previous = completed.get((src_bucket, src_key, new_bucket, new_key), False)
+                if previous is not False and (e_tag is None or previous is None or previous == e_tag):
+                    summary['skipped'] += 1
+                    confirmed(item)
+                    continue
+                submit('copy', item, _copy_object, src_bucket, src_key, new_bucket, new_key, size, e_tag,
+                       part_size)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+            for bucket, keys in deletes.items():
+                submit('delete', (bucket, None), _delete_chunk, bucket, keys, retries)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+    finally:
+        if checkpoint_fp:
+            checkpoint_fp.close()
+    return summary
+
+
+def _prefix_items(src_bucket, src_prefix, new_bucket, new_prefix, max_workers):
+    src_prefix = src_prefix or ''
+    new_prefix = new_prefix or ''
+    for content in _list_sharded(src_bucket, src_prefix, max_workers=max_workers, ordered=False):
+        yield (src_bucket, content['Key'], new_bucket, new_prefix + content['Key'][len(src_prefix):],
+               content['Size'], content['ETag'])
+
+
+def _pair_items(pairs):
+    for src, new in pairs:
+        yield _location_pair(src) + _location_pair(new) + (None, None)
+
+
+def copy_prefix(src_bucket=None, src_prefix=None, src_uri=None, new_bucket=None, new_prefix=None, new_uri=None,
+                checkpoint=None, max_workers=DEFAULT_MAX_WORKERS, part_size=DEFAULT_COPY_PART_SIZE):
+    """
+    Copies all of the objects that begin with a prefix to a new prefix, replacing the source prefix in each key.
+    The source is listed concurrently and the objects are copied server-side, with objects larger than the part
+    size copied in concurrent parts. If a checkpoint file is provided, completed copies are recorded in it and
+    skipped when the copy is run again, allowing an interrupted copy to be resumed.
+
+    .. code-block:: python
+
+        import larry as lry
+        summary = lry.s3.copy_prefix(src_uri='s3://my-bucket/data/', new_uri='s3://archive-bucket/data/',
+                                     checkpoint='copy-data.jsonl')
+
+    :param src_bucket: Source bucket
+    :param src_prefix: Source key prefix
+    :param src_uri: An s3:// path containing the bucket and prefix of the source objects
+    :param new_bucket: Target bucket
+    :param new_prefix: Target key prefix
+    :param new_uri: An s3:// path containing the bucket and prefix to copy the objects to
+    :param checkpoint: The path of a local file to record progress in
+    :param max_workers: The number of objects to copy concurrently
+    :param part_size: Objects larger than this are copied in parts of this size
+    :return: A dict containing the number of objects copied and skipped, the bytes copied, and any errors
+    """
+    if src_uri:
+        (src_bucket, src_prefix) = split_uri(src_uri)
+    if new_uri:
+        (new_bucket, new_prefix) = split_uri(new_uri)
+    return _transfer_objects(_prefix_items(src_bucket, src_prefix, new_bucket, new_prefix, max_workers),
+                             checkpoint=checkpoint, max_workers=max_workers, part_size=part_size)
+
+
+def move_prefix(src_bucket=None, src_prefix=None, src_uri=None, new_bucket=None, new_prefix=None, new_uri=None,
+                checkpoint=None, max_workers=DEFAULT_MAX_WORKERS, part_size=DEFAULT_COPY_PART_SIZE):
+    """
+    Moves all of the objects that begin with a prefix to a new prefix. The objects are copied as in `copy_prefix`
+    and the sources are deleted in batches once their copies have completed.
+
+    :param src_bucket: Source bucket
+    :param src_prefix: Source key prefix
+    :param src_uri: An s3:// path containing the bucket and prefix of the source objects
+    :param new_bucket: Target bucket
+    :param new_prefix: Target key prefix
+    :param new_uri: An s3:// path containing the bucket and prefix to move the objects to
+    :param checkpoint: The path of a local file to record progress in
+    :param max_workers: The number of objects to copy concurrently
+    :param part_size: Objects larger than this are copied in parts of this size
+    :return: A dict containing the number of objects copied, skipped, and deleted, the bytes copied, and any errors
+    """
+    if src_uri:
+        (src_bucket, src_prefix) = split_uri(src_uri)
+    if new_uri:
+        (new_bucket, new_prefix) = split_uri(new_uri)
+    return _transfer_objects(_prefix_items(src_bucket, src_prefix, new_bucket, new_prefix, max_workers),
+                             delete_source=True, checkpoint=checkpoint, max_workers=max_workers,
+                             part_size=part_size)
+
+
+def copy_many(pairs, checkpoint=None, max_workers=DEFAULT_MAX_WORKERS, part_size=DEFAULT_COPY_PART_SIZE):
+    """
+    Copies objects concurrently from a collection of (source, target) pairs. See copy_prefix for details.
+
+    :param pairs: An iterable of (source, target) tuples, each a URI, (bucket, key) tuple, or Object
+    :param checkpoint: The path of a local file to record progress in
+    :param max_workers: The number of objects to copy concurrently
+    :param part_size: Objects larger than this are copied in parts of this size
+    :return: A dict containing the number of objects copied and skipped, the bytes copied, and any errors
+    """
+    return _transfer_objects(_pair_items(pairs), checkpoint=checkpoint, max_workers=max_workers,
+                             part_size=part_size)
+
+
+def move_many(pairs, checkpoint=None, max_workers=DEFAULT_MAX_WORKERS, part_size=DEFAULT_COPY_PART_SIZE):
+    """
+    Moves objects concurrently from a collection of (source, target) pairs. See move_prefix for details.
+
+    :param pairs: An iterable of (source, target) tuples, each a URI, (bucket, key) tuple, or Object
+    :param checkpoint: The path of a local file to record progress in
+    :param max_workers: The number of objects to copy concurrently
+    :param part_size: Objects larger than this are copied in parts of this size
+    :return: A dict containing the number of objects copied, skipped, and deleted, the bytes copied, and any errors
+    """
+    return _transfer_objects(_pair_items(pairs), delete_source=True, checkpoint=checkpoint,
+                             max_workers=max_workers, part_size=part_size)
+
+
+def exists(*location, bucket=None, key=None, uri=None, max_age=None):
     """
     Checks to see if an object with the given bucket/key (or uri) exists.
 
@@ -1066,33 +3632,448 @@ def exists(*location, bucket=None, key=None, uri=None):
     :param bucket: The S3 bucket for the object
     :param key: The key of the object
     :param uri: An s3:// path containing the bucket and key of the object
+    :param max_age: If provided, a snapshot of the object (see Object.snapshot) taken within this many seconds is
+        used rather than checking the object
     :return: True if the key exists, if not, False
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    if max_age is not None:
+        return _snapshot(bucket, key, max_age=max_age).exists
     return Object(bucket=bucket, key=key).exists
 
 
-def list_objects(*location, bucket=None, prefix=None, uri=None, include_empty_objects=False):
+# The number of pages each shard of an ordered listing retrieves ahead of the merge
+SHARD_PREFETCH_PAGES = 2
+
+
+def _list_page(bucket, prefix, start_after=None, end=None, delimiter=None, token=None, max_keys=None):
+    """
+    Retrieves a single page of a listing, returning the contents, common prefixes, and the continuation token for
+    the next page (or None if the listing is complete). Contents past `end` are dropped and end the listing.
+    """
+    params = {'Bucket': bucket, 'Prefix': prefix}
+    if token:
+        params['ContinuationToken'] = token
+    elif start_after:
+        params['StartAfter'] = start_after
+    if delimiter:
+        params['Delimiter'] = delimiter
+    if max_keys:
+        params['MaxKeys'] = max_keys
+    response = _get_resource().meta.client.list_objects_v2(**params)
+    contents = response.get('Contents', [])
+    token = response.get('NextContinuationToken') if response.get('IsTruncated') else None
+    if end is not None and contents and contents[-1]['Key'] > end:
+        contents = [content for content in contents if content['Key'] <= end]
+        token = None
+    return contents, [p['Prefix'] for p in response.get('CommonPrefixes', [])], token
+
+
+def _first_key_after(bucket, prefix, start_after):
+    contents, _, _ = _list_page(bucket, prefix, start_after=start_after, max_keys=1)
+    return contents[0]['Key'] if contents else None
+
+
+def _shard_boundaries(bucket, prefix, start, alphabet, executor, max_shards, max_depth=4):
+    """
+    Chooses boundaries that split the key space following `start` into at most `max_shards` non-empty ranges. The
+    candidate boundaries extend the prefix one character at a time using the characters seen in the keys so far,
+    and the first key following each candidate is sampled with a single-key listing to find out which of the ranges
+    between them contain keys. Ranges are split another level deeper until there are enough of them.
+    """
+    alphabet = set(alphabet)
+    samples = {}
+    boundaries = []
+    stems = [prefix]
+    for depth in range(len(prefix) + 1, len(prefix) + max_depth + 1):
+        candidates = sorted({stem + c for stem in stems for c in alphabet if stem + c > start} - set(samples))
+        if not candidates:
+            break
+        # the key following start is sampled too so that an empty range before the first boundary is merged
+        futures = [(boundary, executor.submit(_first_key_after, bucket, prefix, boundary))
+                   for boundary in ([] if samples else [start]) + _spread(candidates, max_shards * 4)]
+        for boundary, future in futures:
+            samples[boundary] = future.result()
+            if samples[boundary]:
+                alphabet.update(samples[boundary][len(prefix):])
+
+        # keep the boundaries that start a range containing keys, merging the empty ranges into their neighbours
+        boundaries = []
+        for boundary in sorted(samples):
+            key = samples[boundary]
+            if key is None:
+                break
+            if not boundaries or samples[boundaries[-1]] != key:
+                boundaries.append(boundary)
+        boundaries = boundaries[1:]
+        if len(boundaries) + 1 >= max_shards:
+            break
+        stems = [stem for stem in [start[:depth]] + boundaries if len(stem) == depth]
+    return _spread(boundaries, max_shards - 1)
+
+
+def _spread(values, count):
+    """
+    Returns `count` evenly spaced values from a sorted list, or all of them if there are no more than `count`.
+    """
+    if len(values) <= count:
+        return values
+    return [values[i * len(values) // count] for i in range(count)]
+
+
+def _list_shards(bucket, prefix, executor, max_shards):
+    """
+    Splits a listing into shards that can be listed independently. Returns the contents already retrieved while
+    finding the shards along with a list of (prefix, start_after, end) shards covering the rest of the listing.
+    Sub-prefixes found with a delimiter are used when the first page of the delimited listing is complete and holds
+    a usable number of them, otherwise the key space after the first page of the listing is split into ranges at
+    boundaries chosen by sampling the keys (see _shard_boundaries).
+    """
+    contents, prefixes, token = _list_page(bucket, prefix, delimiter='/')
+    if token is None and 1 < len(prefixes) <= max_shards:
+        return contents, [(p, None, None) for p in prefixes]
+
+    contents, _, token = _list_page(bucket, prefix)
+    if token is None:
+        return contents, []
+    last = contents[-1]['Key']
+    alphabet = {c for content in contents for c in content['Key'][len(prefix):]}
+    boundaries = _shard_boundaries(bucket, prefix, last, alphabet, executor, max_shards)
+    starts = [last] + boundaries
+    ends = boundaries + [None]
+    return contents, [(prefix, start, end) for start, end in zip(starts, ends)]
+
+
+class _ShardPages:
+    """
+    Retrieves the pages of a shard of a listing in the background, keeping up to `depth` pages retrieved or in
+    flight ahead of the consumer. Pages are requested as soon as the previous page arrives, so the shards of an
+    ordered listing keep fetching while the merge consumes the other shards.
+    """
+
+    def __init__(self, executor, fetch, shard, depth=SHARD_PREFETCH_PAGES):
+        self._executor = executor
+        self._fetch = fetch
+        self._shard = shard
+        self._depth = depth
+        self._pages = deque()
+        self._condition = threading.Condition()
+        self._buffered = 0
+        self._token = None
+        self._in_flight = False
+        self._closed = False
+        with self._condition:
+            self._request(None)
+
+    def _request(self, token):
+        # called with the condition held
+        self._in_flight = True
+        self._buffered += 1
+        self._executor.submit(self._fetch, self._shard, token).add_done_callback(self._received)
+
+    def _received(self, future):
+        with self._condition:
+            self._in_flight = False
+            try:
+                page, _, self._token = future.result()
+            except BaseException as e:
+                self._token = None
+                self._pages.append(e)
+            else:
+                self._pages.append(page)
+                if self._token and self._buffered < self._depth and not self._closed:
+                    self._request(self._token)
+            self._condition.notify()
+
+    def __iter__(self):
+        while True:
+            with self._condition:
+                while not self._pages:
+                    self._condition.wait()
+                page = self._pages.popleft()
+                self._buffered -= 1
+                if self._token and not self._in_flight and not self._closed:
+                    self._request(self._token)
+                finished = not self._pages and not self._in_flight and not self._token
+            if isinstance(page, BaseException):
+                raise page
+            yield from page
+            if finished:
+                return
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+
+
+def _list_sharded(bucket, prefix, max_workers=DEFAULT_MAX_WORKERS, ordered=False):
+    """
+    Lists the objects under a prefix by listing shards of the key space concurrently, yielding the listing contents
+    either as they arrive or in lexicographic order using a heap merge of the shards. The first page of every shard
+    is requested up front; the shards of an ordered listing then retrieve up to SHARD_PREFETCH_PAGES pages ahead of
+    the merge, while each shard of an unordered listing has one page in flight at a time.
+    """
+    prefix = prefix or ''
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents, shards = _list_shards(bucket, prefix, executor, max_shards=max_workers)
+        if not shards:
+            yield from contents
+            return
+
+        def fetch(shard, token=None):
+            return _list_page(bucket, shard[0], start_after=shard[1], end=shard[2], token=token)
+
+        if ordered:
+            pages = [_ShardPages(executor, fetch, shard) for shard in shards]
+            try:
+                yield from heapq.merge(iter(contents), *pages, key=lambda content: content['Key'])
+            finally:
+                for shard_pages in pages:
+                    shard_pages.close()
+        else:
+            yield from contents
+            pending = {executor.submit(fetch, shard): shard for shard in shards}
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        shard = pending.pop(future)
+                        page, _, token = future.result()
+                        if token:
+                            pending[executor.submit(fetch, shard, token)] = shard
+                        yield from page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+def list_objects(*location, bucket=None, prefix=None, uri=None, include_empty_objects=False, detail=False,
+                 max_workers=None, ordered=True, index=None):
     """
     Returns a iterable of the keys in the bucket that begin with the provided prefix.
 
+    Large listings can be split into shards that are listed concurrently by providing `max_workers`. The shards are
+    found using the sub-prefixes of the prefix, or by splitting the key space following the first page of results
+    at boundaries chosen by sampling the keys. Sharded results are merged into lexicographic order, with each shard
+    retrieving its pages ahead of the merge, unless `ordered` is False, in which case they are returned as they
+    arrive.
+
+    .. code-block:: python
+
+        import larry as lry
+        for obj in lry.s3.list_objects('bucket_name', 'prefix/', detail=True, max_workers=32, ordered=False):
+            print(obj.key, obj.size)
+
     :param location: Positional values for bucket, key, and/or uri
     :param bucket: The S3 bucket to query
     :param prefix: The key prefix to use in searching the bucket
     :param uri: An s3:// path containing the bucket and prefix
     :param include_empty_objects: True if you want to include keys associated with objects of size=0
-    :return: A generator of s3 Objects
+    :param detail: True to return ObjectSummary records containing the size, ETag, last modified date, and storage
+        class from the listing rather than Object resources
+    :param max_workers: The number of threads to use to list shards concurrently, if not provided the listing is
+        retrieved one page at a time
+    :param ordered: When listing shards concurrently, True to return the results in lexicographic order
+    :param index: A ListingIndex (or path to one) to record the listed objects in
+    :return: A generator of s3 Objects or ObjectSummary records
     """
     bucket, prefix, uri = normalize_location(*location, bucket=bucket, key=prefix, uri=uri)
+    if max_workers:
+        contents = _list_sharded(bucket, prefix, max_workers=max_workers, ordered=ordered)
+    else:
+        contents = _list_contents(bucket, prefix)
+    opened = None
+    if index is not None:
+        opened = _listing_index(index)
+        contents = _index_contents(opened, bucket, prefix, contents)
+    try:
+        for objct in contents:
+            if objct['Size'] > 0 or include_empty_objects:
+                if detail:
+                    yield ObjectSummary.from_listing(bucket, objct)
+                else:
+                    yield Object(bucket=bucket, key=objct['Key'])
+    finally:
+        if opened is not None and opened is not index:
+            opened.close()
+
+
+def _list_contents(bucket, prefix, start_after=None):
     paginator = _get_resource().meta.client.get_paginator('list_objects_v2')
     operation_parameters = {'Bucket': bucket}
     if prefix:
         operation_parameters['Prefix'] = prefix
-    page_iterator = paginator.paginate(**operation_parameters)
-    for page in page_iterator:
-        for objct in page.get('Contents', []):
+    if start_after:
+        operation_parameters['StartAfter'] = start_after
+    for page in paginator.paginate(**operation_parameters):
+        yield from page.get('Contents', [])
+
+
+class ListingIndex:
+    """
+    A persistent local index of the objects found by listing S3 prefixes, stored in an SQLite database. The index
+    records the key, size, ETag, and last modified date of each object along with the last key seen for each
+    listed prefix, allowing `list_new_objects` to retrieve only what has changed since the previous listing.
+
+    .. code-block:: python
+
+        import larry as lry
+        index = lry.s3.ListingIndex()
+        for obj in lry.s3.list_new_objects('s3://my-bucket/uploads/', since=index, append_only=True):
+            process(obj)
+
+    :param path: The path of the SQLite database, by default listings.db in DEFAULT_CACHE_DIR
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(DEFAULT_CACHE_DIR, 'listings.db')
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS objects (bucket TEXT, key TEXT, size INTEGER, '
+                                     'etag TEXT, last_modified TEXT, PRIMARY KEY (bucket, key))')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS listings (bucket TEXT, prefix TEXT, '
+                                     'last_key TEXT, PRIMARY KEY (bucket, prefix))')
+
+    def last_key(self, bucket, prefix):
+        """
+        Returns the last key recorded for a complete listing of the prefix, or None if it hasn't been listed.
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT last_key FROM listings WHERE bucket = ? AND prefix = ?',
+                                           (bucket, prefix or '')).fetchone()
+        return row[0] if row else None
+
+    def etags(self, bucket, keys):
+        """
+        Returns a dict of the ETags recorded for the keys that are in the index.
+        """
+        result = {}
+        keys = list(keys)
+        with self._lock:
+            # batched to stay under the SQLite variable limit
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                rows = self._connection.execute(
+                    f'SELECT key, etag FROM objects WHERE bucket = ? AND key IN ({",".join("?" * len(batch))})',
+                    [bucket] + batch)
+                result.update(rows)
+        return result
+
+    def record(self, bucket, contents, prefix=None, last_key=None):
+        """
+        Adds or updates the listing contents in the index, and the last key seen for the prefix if provided.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?)',
+                [(bucket, c['Key'], c.get('Size'), c.get('ETag'),
+                  c['LastModified'].isoformat() if c.get('LastModified') else None) for c in contents])
+            if last_key is not None:
+                self._connection.execute('INSERT OR REPLACE INTO listings VALUES (?, ?, ?)',
+                                         (bucket, prefix or '', last_key))
+
+    def clear(self, bucket, prefix=None):
+        """
+        Removes the objects and listing state recorded for a prefix.
+        """
+        prefix = prefix or ''
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM objects WHERE bucket = ? AND substr(key, 1, ?) = ?',
+                                     (bucket, len(prefix), prefix))
+            self._connection.execute('DELETE FROM listings WHERE bucket = ? AND substr(prefix, 1, ?) = ?',
+                                     (bucket, len(prefix), prefix))
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'ListingIndex("{self.path}")'
+
+
+def _listing_index(index):
+    return index if isinstance(index, ListingIndex) else ListingIndex(index)
+
+
+def _index_contents(index, bucket, prefix, contents, changed_only=False, batch_size=1000):
+    """
+    Records listing contents in the index in batches as they pass through, and the last key of the listing for the
+    prefix once it's exhausted. If `changed_only` is True, only contents that aren't in the index or have a
+    different ETag are recorded and passed through.
+    """
+    last_key = index.last_key(bucket, prefix)
+    iterator = iter(contents)
+    while True:
+        batch = [content for _, content in zip(range(batch_size), iterator)]
+        if not batch:
+            break
+        last_key = max([content['Key'] for content in batch] + ([last_key] if last_key else []))
+        if changed_only:
+            etags = index.etags(bucket, [content['Key'] for content in batch])
+            batch = [content for content in batch if etags.get(content['Key']) != content.get('ETag')]
+        # recorded after the batch has been consumed so that an interrupted listing returns it again next time
+        yield from batch
+        index.record(bucket, batch)
+    index.record(bucket, [], prefix=prefix, last_key=last_key)
+
+
+def list_new_objects(*location, bucket=None, prefix=None, uri=None, since=None, append_only=False,
+                     include_empty_objects=False, detail=False, max_workers=None):
+    """
+    Returns the objects under a prefix that are new or have changed since the prefix was last listed into the index,
+    and records them in the index.
+
+    When `append_only` is True the key layout is assumed to only ever add keys after the existing ones (such as keys
+    that begin with a timestamp or sequence) and the listing resumes after the last key seen, so that only the new
+    pages are retrieved. Otherwise the full prefix is listed and objects are returned if their ETag differs from the
+    one in the index.
+
+    :param location: Positional values for bucket, key, and/or uri
+    :param bucket: The S3 bucket to query
+    :param prefix: The key prefix to use in searching the bucket
+    :param uri: An s3:// path containing the bucket and prefix
+    :param since: The ListingIndex (or path to one) holding the previous listing, by default the ListingIndex in
+        DEFAULT_CACHE_DIR
+    :param append_only: True to resume the listing after the last key seen rather than comparing ETags
+    :param include_empty_objects: True if you want to include keys associated with objects of size=0
+    :param detail: True to return ObjectSummary records rather than Object resources
+    :param max_workers: The number of threads to use to list shards concurrently when comparing ETags
+    :return: A generator of s3 Objects or ObjectSummary records
+    """
+    bucket, prefix, uri = normalize_location(*location, bucket=bucket, key=prefix, uri=uri)
+    index = _listing_index(since)
+    try:
+        if append_only:
+            contents = _list_contents(bucket, prefix, start_after=index.last_key(bucket, prefix))
+        elif max_workers:
+            contents = _list_sharded(bucket, prefix, max_workers=max_workers, ordered=False)
+        else:
+            contents = _list_contents(bucket, prefix)
+
+        for objct in _index_contents(index, bucket, prefix, contents, changed_only=not append_only):
             if objct['Size'] > 0 or include_empty_objects:
-                yield Object(bucket=bucket, key=objct['Key'])
+                if detail:
+                    yield ObjectSummary.from_listing(bucket, objct)
+                else:
+                    yield Object(bucket=bucket, key=objct['Key'])
+    finally:
+        # indexes opened here from a path are closed once the listing is finished or abandoned
+        if index is not since:
+            index.close()
 
 
 def list_buckets():
@@ -1105,34 +4086,127 @@ def list_buckets():
         yield Bucket(bucket['Name'])
 
 
-def _find_largest_common_prefix(values):
+def _split_prefix_group(prefix, keys):
     """
-    Searches through a list of values to find the longest possible common prefix amongst them. Useful for optimizing
-    more costly searches. Supports lists of strings or tuples. If tuples are used, the first value is assumed to be
-    the value to search on.
-
-    :param values: List of values (strings or tuples containing a string in the first position)
-    :return: String prefix common to all values
+    Splits a sorted list of keys sharing a prefix into groups by the next path segment (or character if there are
+    no more delimiters) following the prefix. Each group is returned with the longest prefix common to its keys.
     """
-    if isinstance(values[0], tuple):
-        prefix, *_ = values[0]
-    else:
-        prefix = values[0]
+    groups = []
+    segment, members = None, []
+    for key in keys:
+        rest = key[len(prefix):]
+        next_segment = rest[:rest.find('/') + 1] if '/' in rest else rest[:1]
+        if next_segment != segment and members:
+            groups.append((posixpath.commonprefix([members[0], members[-1]]), members))
+            members = []
+        segment = next_segment
+        members.append(key)
+    if members:
+        groups.append((posixpath.commonprefix([members[0], members[-1]]), members))
+    return groups
+
+
+def _merge_prefix_groups(groups, count):
+    """
+    Merges adjacent groups of sorted keys into `count` groups of roughly equal size.
+    """
+    total = sum(len(members) for _, members in groups)
+    merged = []
+    members = []
+    for i, (_, group_members) in enumerate(groups):
+        members.extend(group_members)
+        remaining = len(groups) - i - 1
+        if remaining > 0 and (len(members) * count >= total * (len(merged) + 1) or
+                              remaining == count - len(merged) - 1) and len(merged) < count - 1:
+            merged.append((posixpath.commonprefix([members[0], members[-1]]), members))
+            members = []
+    if members:
+        merged.append((posixpath.commonprefix([members[0], members[-1]]), members))
+    return merged
+
+
+def _group_prefixes(keys, max_groups):
+    """
+    Groups a set of keys into at most `max_groups` contiguous ranges of the sorted keys, walking the prefix tree of
+    the keys and repeatedly splitting the largest group. When a group has more branches than can be added, adjacent
+    branches are merged into ranges. Narrower prefixes and ranges reduce the number of unrelated objects that have
+    to be listed in order to find the keys.
+
+    :param keys: A collection of keys
+    :param max_groups: The maximum number of prefixes to return
+    :return: A list of (prefix, sorted keys) tuples
+    """
+    keys = sorted(keys)
+    if not keys:
+        return []
+    # a heap of the groups that may still be split, largest first, and the groups that can't be split further
+    heap = [(-len(keys), 0, posixpath.commonprefix([keys[0], keys[-1]]), keys)]
+    groups = []
+    counter = 1
+    while heap and len(heap) + len(groups) < max_groups:
+        _, _, prefix, members = heapq.heappop(heap)
+        children = _split_prefix_group(prefix, members) if len(members) > 1 else []
+        available = max_groups - len(heap) - len(groups)
+        if len(children) > available > 1:
+            children = _merge_prefix_groups(children, available)
+        if 1 < len(children) <= available:
+            for child_prefix, child_members in children:
+                heapq.heappush(heap, (-len(child_members), counter, child_prefix, child_members))
+                counter += 1
+        else:
+            groups.append((prefix, members))
+    groups.extend((prefix, members) for _, _, prefix, members in heap)
+    return sorted(groups, key=lambda group: group[1][0])
 
-    for value in values:
-        key = value[0] if isinstance(value, tuple) else value
-        while key[:len(prefix)] != prefix and len(prefix) > 0:
-            prefix = prefix[:-1]
-    return prefix
+
+def _find_keys_by_listing(bucket, prefix, keys):
+    """
+    Lists the objects under the prefix that fall within the range of the sorted keys, returning the keys found and
+    any keys that remain to be checked. After each page the number of pages still needed is estimated from the share
+    of the keys that the listing has passed, and the listing stops early when checking the remaining keys with a
+    HEAD request each would take no more requests.
+    """
+    first, last = keys[0], keys[-1]
+    wanted = set(keys)
+    found = set()
+    pages, token = 0, None
+    while True:
+        page, _, token = _list_page(bucket, prefix, start_after=first[:-1] or None, end=last, token=token)
+        pages += 1
+        found.update(objct['Key'] for objct in page if objct['Key'] in wanted)
+        if token is None or not page:
+            return found, []
+        passed = bisect.bisect_right(keys, page[-1]['Key'])
+        remaining = keys[passed:]
+        estimate = pages * len(remaining) / passed if passed else float('inf')
+        if len(remaining) <= estimate:
+            return found, remaining
+
+
+def _find_key_by_head(bucket, key):
+    try:
+        _get_resource().meta.client.head_object(Bucket=bucket, Key=key)
+        return {key}
+    except botocore.exceptions.ClientError as e:
+        if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+            return set()
+        raise ClientError.from_boto(e) from None
 
 
-def find_keys_not_present(bucket, keys=None, uris=None):
+def find_keys_not_present(bucket, keys=None, uris=None, max_prefixes=64, max_workers=DEFAULT_MAX_WORKERS):
     """
     Searches an S3 bucket for a list of keys and returns any that cannot be found.
 
+    The keys are grouped into a small number of distinct prefixes which are searched concurrently. Each group is
+    checked with whichever takes fewer requests: listing the objects under the prefix of the group, or a HEAD
+    request per key. Single keys are checked with HEAD requests, and larger groups are listed until the pages
+    already retrieved suggest that the rest of the listing would take more requests than the keys remaining.
+
     :param bucket: The S3 bucket to search
     :param keys: A list of keys to search for (strings or tuples containing a string in the first position)
     :param uris: A list of S3 URIs to search for (strings or tuples containing a string in the first position)
+    :param max_prefixes: The maximum number of prefixes to group the keys into
+    :param max_workers: The number of threads to use for listing and HEAD requests
     :return: A list of keys that were not found (strings or tuples based on the input values)
     """
 
@@ -1148,22 +4222,24 @@ def find_keys_not_present(bucket, keys=None, uris=None):
                 b, key = split_uri(value)
                 keys.append(key)
 
-    # Find the longest common prefix to use as the search term
-    prefix = _find_largest_common_prefix(keys)
-
-    # Get a list of all keys in the bucket that match the prefix
-    bucket_obj = Bucket(bucket=bucket)
-    all_keys = []
-    for objct in bucket_obj.objects.filter(Prefix=prefix):
-        all_keys.append(objct.key)
+    wanted = {value[0] if isinstance(value, tuple) else value for value in keys}
+    found = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listings, heads = [], []
+        for prefix, members in _group_prefixes(wanted, max_prefixes):
+            if len(members) == 1:
+                heads.append(executor.submit(_find_key_by_head, bucket, members[0]))
+            else:
+                listings.append(executor.submit(_find_keys_by_listing, bucket, prefix, members))
+        for future in listings:
+            listed, remaining = future.result()
+            found.update(listed)
+            heads.extend(executor.submit(_find_key_by_head, bucket, key) for key in remaining)
+        for future in heads:
+            found.update(future.result())
 
     # Search for any keys that can't be found
-    not_found = []
-    for value in keys:
-        key = value[0] if isinstance(value, tuple) else value
-        if key not in all_keys:
-            not_found.append(value)
-    return not_found
+    return [value for value in keys if (value[0] if isinstance(value, tuple) else value) not in found]
 
 
 def fetch(url, *location, bucket=None, key=None, uri=None, content_type=None, content_encoding=None,
@@ -1217,6 +4293,16 @@ def download(file, *location, bucket=None, key=None, uri=None, use_threads=True)
     :return: Path of the local file
     """
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
+    if _read_cache is not None:
+        with _read_cache.get(bucket, key, opener=_open_binary) as fp:
+            if isinstance(file, str):
+                if os.path.isdir(file):
+                    file = os.path.join(file, key.split('/')[-1])
+                with io.open(file, 'wb') as out:
+                    shutil.copyfileobj(fp, out, DEFAULT_CHUNK_SIZE)
+                return file
+            shutil.copyfileobj(fp, file, DEFAULT_CHUNK_SIZE)
+        return file.name
     config = TransferConfig(use_threads=use_threads)
     objct = Object(bucket=bucket, key=key)
     if isinstance(file, str):
@@ -1230,6 +4316,176 @@ def download(file, *location, bucket=None, key=None, uri=None, use_threads=True)
         return file.name
 
 
+def _file_e_tag(path, part_size=None, part_count=None):
+    """
+    Computes the ETag S3 would assign to a local file. Files uploaded in a single part have the MD5 of their
+    contents as the ETag, while multipart uploads have the MD5 of the concatenated part digests and the part count.
+    """
+    with io.open(path, 'rb') as fp:
+        if not part_count:
+            md5 = hashlib.md5()
+            for chunk in iter(lambda: fp.read(DEFAULT_CHUNK_SIZE), b''):
+                md5.update(chunk)
+            return f'"{md5.hexdigest()}"'
+        digests = []
+        for _ in range(part_count):
+            md5 = hashlib.md5()
+            remaining = part_size
+            while remaining > 0:
+                chunk = fp.read(min(remaining, DEFAULT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                md5.update(chunk)
+                remaining -= len(chunk)
+            digests.append(md5.digest())
+        return f'"{hashlib.md5(b"".join(digests)).hexdigest()}-{part_count}"'
+
+
+def _is_unchanged(path, summary, config, check_md5=True, upload=False):
+    """
+    Compares a local file with a listed object using the size and either the ETag or the modification time. When
+    comparing modification times, a file being uploaded is unchanged if it's no newer than the object, and an object
+    being downloaded is unchanged if it's no newer than the file (the last modified time of the object is the time
+    it was uploaded, and downloaded files are given the last modified time of their object).
+    """
+    if os.path.getsize(path) != summary.size:
+        return False
+    if not check_md5:
+        # S3 records the last modified time to the second
+        if upload:
+            return os.path.getmtime(path) < summary.last_modified.timestamp() + 1
+        return summary.last_modified.timestamp() < os.path.getmtime(path) + 1
+    if '-' not in summary.e_tag:
+        return _file_e_tag(path) == summary.e_tag
+    part_count = int(summary.e_tag.strip('"').split('-')[1])
+    # the part size isn't recorded in the ETag so try the configured size and the size implied by the part count
+    mb = 1024 * 1024
+    candidates = {config.multipart_chunksize, -(-summary.size // part_count // mb) * mb}
+    return any(_file_e_tag(path, part_size, part_count) == summary.e_tag for part_size in candidates
+               if -(-summary.size // part_size) == part_count)
+
+
+def _matches(path, include=None, exclude=None):
+    include = [include] if isinstance(include, str) else include
+    exclude = [exclude] if isinstance(exclude, str) else exclude
+    if include and not any(fnmatch.fnmatch(path, pattern) for pattern in include):
+        return False
+    return not (exclude and any(fnmatch.fnmatch(path, pattern) for pattern in exclude))
+
+
+def _transfer_files(transfers, max_workers):
+    summary = {'files': 0, 'bytes': 0, 'skipped': 0}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *args) for func, *args in transfers]
+        for future in futures:
+            transferred = future.result()
+            if transferred is None:
+                summary['skipped'] += 1
+            else:
+                summary['files'] += 1
+                summary['bytes'] += transferred
+    return summary
+
+
+def upload_dir(directory, *location, bucket=None, prefix=None, uri=None, include=None, exclude=None, acl=None,
+               check_md5=True, max_workers=DEFAULT_MAX_WORKERS, config=None):
+    """
+    Uploads the files in a local directory (and its subdirectories) to a prefix in S3, skipping files that are
+    unchanged from the objects already in S3. Files are compared using their size and either their MD5 (including
+    the ETag calculation used for multipart uploads) or, if `check_md5` is False, their modification time, in which
+    case files that are no newer than their object are skipped.
+
+    .. code-block:: python
+
+        import larry as lry
+        summary = lry.s3.upload_dir('site/', 's3://my-bucket/www/', exclude=['*.map', '.git/*'])
+        print(summary['files'], summary['bytes'], summary['skipped'])
+
+    :param directory: The local directory to upload
+    :param location: Positional values for bucket, prefix, and/or uri
+    :param bucket: The S3 bucket to upload to
+    :param prefix: The key prefix to upload the files under
+    :param uri: An s3:// path containing the bucket and prefix
+    :param include: A glob pattern or list of patterns for the relative paths of the files to include
+    :param exclude: A glob pattern or list of patterns for the relative paths of the files to exclude
+    :param acl: The canned ACL to apply to the objects
+    :param check_md5: True to compare file contents with the object ETags, False to compare modification times
+    :param max_workers: The number of files to transfer concurrently
+    :param config: The TransferConfig to use for all of the transfers
+    :return: A dict containing the number of files and bytes transferred and the number of files skipped
+    """
+    bucket, prefix, uri = normalize_location(*location, bucket=bucket, key=prefix, uri=uri, require_key=False)
+    prefix = prefix or ''
+    config = config if config else TransferConfig()
+    existing = {content['Key']: ObjectSummary.from_listing(bucket, content)
+                for content in _list_contents(bucket, prefix)}
+    client = _get_resource().meta.client
+
+    def upload_file(path, key):
+        summary = existing.get(key)
+        if summary is not None and _is_unchanged(path, summary, config, check_md5, upload=True):
+            return None
+        extra = larry.core.copy_non_null_keys({'ACL': acl, 'ContentType': _recommend_content_type(None, key)})
+        _forget_snapshots(bucket, [key])
+        client.upload_file(path, bucket, key, ExtraArgs=extra, Config=config)
+        return os.path.getsize(path)
+
+    transfers = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, directory).replace(os.sep, '/')
+            if _matches(relative, include, exclude):
+                transfers.append((upload_file, path, prefix + relative))
+    return _transfer_files(transfers, max_workers)
+
+
+def download_dir(directory, *location, bucket=None, prefix=None, uri=None, include=None, exclude=None,
+                 check_md5=True, max_workers=DEFAULT_MAX_WORKERS, config=None):
+    """
+    Downloads the objects under a prefix in S3 to a local directory, skipping objects that are unchanged from the
+    files already in the directory. Objects are compared as in `upload_dir`, and the modification time of each
+    downloaded file is set to the last modified time of the object.
+
+    :param directory: The local directory to download to
+    :param location: Positional values for bucket, prefix, and/or uri
+    :param bucket: The S3 bucket to download from
+    :param prefix: The key prefix of the objects to download
+    :param uri: An s3:// path containing the bucket and prefix
+    :param include: A glob pattern or list of patterns for the paths (relative to the prefix) to include
+    :param exclude: A glob pattern or list of patterns for the paths (relative to the prefix) to exclude
+    :param check_md5: True to compare file contents with the object ETags, False to compare modification times
+    :param max_workers: The number of files to transfer concurrently
+    :param config: The TransferConfig to use for all of the transfers
+    :return: A dict containing the number of files and bytes transferred and the number of files skipped
+    """
+    bucket, prefix, uri = normalize_location(*location, bucket=bucket, key=prefix, uri=uri, require_key=False)
+    prefix = prefix or ''
+    config = config if config else TransferConfig()
+    client = _get_resource().meta.client
+
+    def download_file(summary, path):
+        if os.path.exists(path) and _is_unchanged(path, summary, config, check_md5):
+            return None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        client.download_file(bucket, summary.key, path, Config=config)
+        timestamp = summary.last_modified.timestamp()
+        os.utime(path, (timestamp, timestamp))
+        return summary.size
+
+    root = os.path.realpath(directory)
+    transfers = []
+    for summary in (ObjectSummary.from_listing(bucket, content) for content in _list_contents(bucket, prefix)):
+        relative = summary.key[len(prefix):]
+        if relative and not relative.endswith('/') and _matches(relative, include, exclude):
+            path = os.path.realpath(os.path.join(root, *relative.split('/')))
+            # keys containing '..' segments could otherwise be written outside of the directory
+            if os.path.commonpath([root, path]) != root:
+                raise ValueError(f'The key {summary.key} would be written outside of {directory}')
+            transfers.append((download_file, summary, path))
+    return _transfer_files(transfers, max_workers)
+
+
 def download_to_temp(*location, bucket=None, key=None, uri=None):
     """
     Downloads the an S3 object to a temp directory on the local file system.
@@ -1257,7 +4513,7 @@ def generate_presigned_get(*location, bucket=None, key=None, uri=None, expires_i
         params["ExpiresIn"] = expires_in
     if http_method:
         params["HttpMethod"] = http_method
-    return __resource.meta.client.generate_presigned_url(**params)
+    return _get_resource().meta.client.generate_presigned_url(**params)
 
 
 def upload(file, *location, bucket=None, key=None, uri=None, acl=None, content_type=None, content_encoding=None,
@@ -1297,6 +4553,7 @@ def upload(file, *location, bucket=None, key=None, uri=None, acl=None, content_t
     if tags:
         extra['Tagging'] = parse.urlencode(tags) if isinstance(tags, Mapping) else tags
     params = {} if len(extra.keys()) == 0 else {'ExtraArgs': extra}
+    _forget_snapshots(bucket, [key])
     objct = Object(bucket=bucket, key=key)
     # TODO: Assign content type?
     if isinstance(file, str):
@@ -1348,7 +4605,7 @@ def create_bucket(bucket, acl=ACL_PRIVATE, region=None):
     :param region: The region to location the S3 bucket, defaults to the region of the current session
     """
     if region is None:
-        region = __session.region_name
+        region = _get_session().region_name
     bucket_obj = Bucket(bucket=bucket)
     if region is None or region == 'us-east-1':
         bucket_obj.create(ACL=acl)
@@ -1381,7 +4638,7 @@ def temp_bucket(region=None, bucket_identifier=None):
     :return: The name of the created bucket
     """
     if region is None:
-        region = __session.region_name
+        region = _get_session().region_name
     if bucket_identifier is None:
         bucket_identifier = sts.account_id()
     bucket = '{}-larry-{}'.format(bucket_identifier, region)
@@ -1389,21 +4646,74 @@ def temp_bucket(region=None, bucket_identifier=None):
     return bucket
 
 
-def download_to_zip(file, bucket, prefix=None, prefixes=None):
+def download_to_zip(file, bucket, prefix=None, prefixes=None, max_workers=DEFAULT_MAX_WORKERS,
+                    max_bytes_in_flight=256 * 1024 * 1024, compression=ZIP_STORED):
     """
     Retrieves a list of objects contained in the bucket and downloads them to a zip file.
 
-    :param file: The file location to write a zip file to.
+    Objects are retrieved concurrently while the zip is written, limited to `max_bytes_in_flight` bytes held in
+    memory at once. Objects larger than the part size are streamed directly into the zip rather than being read
+    into memory. The zip can be written to S3 by passing an s3:// URI, in which case it's uploaded in parts as
+    it's written.
+
+    .. code-block:: python
+
+        import larry as lry
+        lry.s3.download_to_zip('s3://my-bucket/exports/images.zip', 'my-bucket', prefix='images/')
+
+    :param file: The file location, file-like object, or s3:// URI to write a zip file to.
     :param bucket: The name of the S3 bucket
     :param prefix: A prefix to filter objects for
     :param prefixes: A list of prefixes to filter for
+    :param max_workers: The number of objects to retrieve concurrently
+    :param max_bytes_in_flight: The maximum number of bytes of retrieved objects to hold in memory at once
+    :param compression: The ZIP compression method to use
     """
     if prefix:
         prefixes = [prefix]
-    with ZipFile(file, 'w') as zf:
+    if is_uri(file):
+        with ObjectWriter(file, content_type='application/zip') as fp:
+            _write_zip(fp, bucket, prefixes, max_workers, max_bytes_in_flight, compression)
+    else:
+        _write_zip(file, bucket, prefixes, max_workers, max_bytes_in_flight, compression)
+
+
+def _write_zip(file, bucket, prefixes, max_workers, max_bytes_in_flight, compression):
+    # the objects are written to the zip in listing order while the retrievals ahead of them run concurrently
+    queue = deque()
+    in_flight = 0
+
+    def write_next():
+        nonlocal in_flight
+        summary, future = queue.popleft()
+        name = parse.quote(summary.key)
+        if future is None:
+            body = _get_object(bucket, summary.key)['Body']
+            try:
+                with zf.open(name, 'w', force_zip64=True) as member:
+                    for chunk in body.iter_chunks(DEFAULT_CHUNK_SIZE):
+                        member.write(chunk)
+            finally:
+                body.close()
+        else:
+            zf.writestr(name, data=future.result())
+            in_flight -= summary.size
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            ZipFile(file, 'w', compression=compression) as zf:
         for prefix in prefixes:
-            for obj in list_objects(bucket, prefix):
-                zf.writestr(parse.quote(obj.key), data=read(obj))
+            for summary in list_objects(bucket, prefix, detail=True):
+                stream = summary.size > DEFAULT_PART_SIZE or summary.size > max_bytes_in_flight
+                size = 0 if stream else summary.size
+                while queue and (in_flight + size > max_bytes_in_flight or len(queue) >= max_workers * 2):
+                    write_next()
+                if stream:
+                    queue.append((summary, None))
+                else:
+                    queue.append((summary, executor.submit(read, bucket, summary.key)))
+                    in_flight += size
+        while queue:
+            write_next()
 
 
 def split_uri(uri):
@@ -1534,9 +4844,9 @@ def read_list_as(o_type, *location, bucket=None, key=None, uri=None, encoding='u
 
 
 def read_iter_as(o_type, *location, bucket=None, key=None, uri=None, encoding='utf-8', newline='\n'):
-    warnings.warn("Use read_as([<type>], ...)", DeprecationWarning)
+    warnings.warn("Use read_as(iter([<type>]), ...)", DeprecationWarning)
     bucket, key, uri = normalize_location(*location, bucket=bucket, key=key, uri=uri)
-    return iter(read_as(bucket=bucket, key=key, encoding=encoding, newline=newline))
+    return read_as(iter([o_type]), bucket=bucket, key=key, encoding=encoding, newline=newline)
 
 
 def read_dict(*location, bucket=None, key=None, uri=None, encoding='utf-8', use_decoder=False):
@@ -1,5 +1,7 @@
 import json
 import boto3
+import botocore.exceptions
+import larry
 import posixpath
 import base64
 
@@ -11,9 +13,10 @@ from larry.types import ClientError
 from larry.utils.image import scale_image_to_size
 from collections.abc import Mapping
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-__client = __session.client('sagemaker')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local client, created on first use
+__client = None
 
 
 def set_session(aws_access_key_id=None,
@@ -34,23 +37,33 @@ def set_session(aws_access_key_id=None,
     """
     global __session, __client
     __session = boto_session if boto_session is not None else boto3.session.Session(**copy_non_null_keys(locals()))
-    __client = __session.client('sagemaker')
+    __client = None
 
 
 def __getattr__(name):
     if name == 'session':
-        return __session
+        return _get_session()
     elif name == 'client':
-        return __client
+        return _get_client()
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
 def _get_client():
+    global __client
+    if __client is None:
+        __client = _get_session().client('sagemaker')
     return __client
 
 
 def _resolve_region(region):
-    return __session.region_name if region is None else region
+    return _get_session().region_name if region is None else region
 
 
 class notebook:
@@ -438,14 +451,13 @@ class labeling:
     @staticmethod
     def reverse_scaling_of_annotation(manifest, label_attribute_name, delete_scaled_images=True):
         new_manifest = []
+        scaled_images = []
         for item in manifest:
             new_item = item.copy()
             if 'scalar' in new_item:
                 source_image = new_item.pop('old-source-ref')
                 scalar = new_item.pop('scalar')
-                scaled_image = new_item['source-ref']
-                if delete_scaled_images:
-                    s3.delete(uri=scaled_image)
+                scaled_images.append(new_item['source-ref'])
                 new_item['source-ref'] = source_image
                 for annotation in new_item[label_attribute_name]['annotations']:
                     annotation['width'] = int(annotation['width'] / scalar)
@@ -453,4 +465,11 @@ class labeling:
                     annotation['top'] = int(annotation['top'] / scalar)
                     annotation['left'] = int(annotation['left'] / scalar)
             new_manifest.append(new_item)
+        if delete_scaled_images and scaled_images:
+            errors = s3.delete_many(scaled_images)['errors']
+            if errors:
+                uris = ', '.join(s3.join_uri(error['bucket'], error['key']) for error in errors)
+                raise ClientError(botocore.exceptions.ClientError(
+                    {'Error': {'Code': errors[0]['code'], 'Message': f'Unable to delete scaled images: {uris}'}},
+                    'DeleteObjects'))
         return new_manifest
@@ -5,9 +5,32 @@ import larry.core
 import boto3
 from collections.abc import Mapping
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-client = __session.client('stepfunctions')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local client, created on first use
+__client = None
+
+
+def __getattr__(name):
+    if name == 'session':
+        return _get_session()
+    elif name == 'client':
+        return _get_client()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_client():
+    global __client
+    if __client is None:
+        __client = _get_session().client('stepfunctions')
+    return __client
 
 
 def set_session(aws_access_key_id=None,
@@ -26,10 +49,10 @@ def set_session(aws_access_key_id=None,
     :param boto_session: An existing session to use
     :return: None
     """
-    global __session, client
+    global __session, __client
     __session = boto_session if boto_session is not None else boto3.session.Session(
         **larry.core.copy_non_null_keys(locals()))
-    client = __session.client('stepfunctions')
+    __client = None
 
 
 def start_execution(state_machine_arn, input_=None, name=None, trace_header=None, sync=False, **kwargs):
@@ -43,7 +66,7 @@ def start_execution(state_machine_arn, input_=None, name=None, trace_header=None
     elif kwargs:
         params["input"] = json.dumps(kwargs)
     if sync:
-        response = client.start_sync_execution(**params)
+        response = _get_client().start_sync_execution(**params)
         output = response.get("output")
         if "error" in response:
             raise Exception(f"{response['error']}: {response['cause']}")
@@ -55,7 +78,7 @@ def start_execution(state_machine_arn, input_=None, name=None, trace_header=None
         else:
             return output
     else:
-        return client.start_execution(**params).get('executionArn')
+        return _get_client().start_execution(**params).get('executionArn')
 
 
 def as_function(arn, sync=False):
@@ -92,7 +115,7 @@ def execution_history(execution_arn, reverse=False, include_execution_data=True)
     results_to_retrieve = True
     previous_events = {}
     while results_to_retrieve:
-        response = client.get_execution_history(**params)
+        response = _get_client().get_execution_history(**params)
         if response.get('nextToken'):
             params['nextToken'] = response.get('nextToken')
         else:
@@ -132,7 +155,7 @@ def executions(state_machine_arn, status_filter=None):
     })
     results_to_retrieve = True
     while results_to_retrieve:
-        response = client.list_executions(**params)
+        response = _get_client().list_executions(**params)
         if response.get('nextToken'):
             params['nextToken'] = response.get('nextToken')
         else:
@@ -145,7 +168,7 @@ def state_machines():
     params = {}
     results_to_retrieve = True
     while results_to_retrieve:
-        response = client.list_state_machines(**params)
+        response = _get_client().list_state_machines(**params)
         if response.get('nextToken'):
             params['nextToken'] = response.get('nextToken')
         else:
@@ -155,13 +178,13 @@ def state_machines():
 
 
 def describe_execution(execution_arn):
-    response = client.describe_execution(executionArn=execution_arn)
+    response = _get_client().describe_execution(executionArn=execution_arn)
     return {k: json.loads(v) if k in ['input', 'output'] else v
             for k, v in response.items() if k not in ['ResponseMetadata', 'inputDetails', 'outputDetails']}
 
 
 def describe_state_machine(state_machine_arn):
-    response = client.describe_execution(stateMachineArn=state_machine_arn)
+    response = _get_client().describe_execution(stateMachineArn=state_machine_arn)
     return {k: json.loads(v) if k in ['definition'] else v
             for k, v in response.items() if k not in ['ResponseMetadata']}
 
@@ -172,15 +195,15 @@ def stop_execution(execution_arn, error=None, cause=None):
         'error': 'error',
         'cause': 'cause'
     })
-    return client.stop_execution_execution(**params).get('stopDate')
+    return _get_client().stop_execution_execution(**params).get('stopDate')
 
 
 def send_task_success(task_token, output):
-    client.send_task_success(taskToken=task_token, output=output)
+    _get_client().send_task_success(taskToken=task_token, output=output)
 
 
 def send_task_heartbeat(task_token):
-    client.send_task_heartbeat(taskToken=task_token)
+    _get_client().send_task_heartbeat(taskToken=task_token)
 
 
 def send_task_failure(task_token, error=None, cause=None):
@@ -189,7 +212,7 @@ def send_task_failure(task_token, error=None, cause=None):
         'error': 'error',
         'cause': 'cause'
     })
-    client.send_task_failure(**params)
+    _get_client().send_task_failure(**params)
 
 
 class StateMachine:
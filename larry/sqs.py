@@ -3,9 +3,32 @@ from larry import utils
 import boto3
 
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-client = __session.client('sqs')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local client, created on first use
+__client = None
+
+
+def __getattr__(name):
+    if name == 'session':
+        return _get_session()
+    elif name == 'client':
+        return _get_client()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_client():
+    global __client
+    if __client is None:
+        __client = _get_session().client('sqs')
+    return __client
 
 
 def set_session(aws_access_key_id=None,
@@ -24,9 +47,9 @@ def set_session(aws_access_key_id=None,
     :param boto_session: An existing session to use
     :return: None
     """
-    global __session, client
+    global __session, __client
     __session = boto_session if boto_session is not None else boto3.session.Session(**larry.core.copy_non_null_keys(locals()))
-    client = __session.client('sqs')
+    __client = None
 
 
 def send_message(message, destination):
@@ -38,4 +61,4 @@ def send_message(message, destination):
     """
     if type(message) == dict:
         message = utils.json_dumps(message)
-    return client.send_message(QueueUrl=destination, MessageBody=message)['MessageId']
+    return _get_client().send_message(QueueUrl=destination, MessageBody=message)['MessageId']
@@ -2,9 +2,32 @@ import larry.core
 import boto3
 
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-client = __session.client('sts')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local client, created on first use
+__client = None
+
+
+def __getattr__(name):
+    if name == 'session':
+        return _get_session()
+    elif name == 'client':
+        return _get_client()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_client():
+    global __client
+    if __client is None:
+        __client = _get_session().client('sts')
+    return __client
 
 
 def set_session(aws_access_key_id=None,
@@ -23,9 +46,9 @@ def set_session(aws_access_key_id=None,
     :param boto_session: An existing session to use
     :return: None
     """
-    global __session, client
+    global __session, __client
     __session = boto_session if boto_session is not None else boto3.session.Session(**larry.core.copy_non_null_keys(locals()))
-    client = __session.client('sts')
+    __client = None
 
 
 def account_id():
@@ -33,4 +56,4 @@ def account_id():
     Returns the account id of the AWS account associated with the current session.
     :return: The account id
     """
-    return client.get_caller_identity()['Account']
+    return _get_client().get_caller_identity()['Account']
@@ -2,11 +2,13 @@ from larry.core import copy_non_null_keys
 from larry import s3
 from larry.types import Box
 import boto3
+import larry
 import io
 
-# A local instance of the boto3 session to use
-__session = boto3.session.Session()
-__client = __session.client('textract')
+# A local instance of the boto3 session to use, resolved from the package session on first use
+__session = None
+# Local client, created on first use
+__client = None
 
 
 def set_session(aws_access_key_id=None,
@@ -27,18 +29,28 @@ def set_session(aws_access_key_id=None,
     """
     global __session, __client
     __session = boto_session if boto_session is not None else boto3.session.Session(**copy_non_null_keys(locals()))
-    __client = __session.client('textract')
+    __client = None
 
 
 def __getattr__(name):
     if name == 'session':
-        return __session
+        return _get_session()
     elif name == 'client':
-        return __client
+        return _get_client()
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-def __get_client():
+def _get_session():
+    global __session
+    if __session is None:
+        __session = larry.session()
+    return __session
+
+
+def _get_client():
+    global __client
+    if __client is None:
+        __client = _get_session().client('textract')
     return __client
 
 
@@ -67,7 +79,7 @@ def detect_text(*location, bucket=None, key=None, uri=None):
             document['S3Object'] = {'Bucket': bucket, 'Name': key}
         else:
             raise TypeError("Invalid s3 location")
-    response = __client.detect_document_text(**params)
+    response = _get_client().detect_document_text(**params)
     return response
 
 
@@ -119,11 +131,11 @@ def start_text_detection(*location, bucket=None, key=None, uri=None, sns_topic_a
             'SNSTopicArn': sns_topic_arn,
             'RoleArn': sns_role_arn
         }
-    return __client.start_document_text_detection(**params).get('JobId')
+    return _get_client().start_document_text_detection(**params).get('JobId')
 
 
 def get_detected_text_detail(job_id):
-    response = __client.get_document_text_detection(JobId=job_id)
+    response = _get_client().get_document_text_detection(JobId=job_id)
     pages = response.get('DocumentMetadata', {}).get('Pages')
     status = response['JobStatus']
     warnings = response.get('Warnings')
@@ -147,7 +159,7 @@ def _block_iterator(job_id, first_response):
         for block in response['Blocks']:
             yield block
         if 'NextToken' in response:
-            response = __client.get_document_text_detection(JobId=job_id, NextToken=response['NextToken'])
+            response = _get_client().get_document_text_detection(JobId=job_id, NextToken=response['NextToken'])
         else:
             blocks_to_retrieve = False
 
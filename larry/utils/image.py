@@ -13,17 +13,22 @@ def scale_image_to_size(image=None, bucket=None, key=None, uri=None, max_pixels=
 
         if image:
             src_bytes = _image_byte_count(image)
+            x, y = image.size
         else:
-            src_bytes = s3.size(bucket, key, uri)
-            image = s3.read_as(Image, bucket, key, uri)
-        x, y = image.size
+            # The dimensions are read from the header so that images that don't need scaling aren't downloaded
+            info = s3.image_info(bucket=bucket, key=key, uri=uri)
+            src_bytes = info['content_length']
+            x, y = info['width'], info['height']
         src_pixels = x * y
         bytes_scalar = math.sqrt(max_bytes/src_bytes) if max_bytes else 1
         pixels_scalar = math.sqrt(max_pixels/src_pixels) if max_pixels else 1
         scalar = min(bytes_scalar, pixels_scalar)
         if scalar >= 1:
-            return image, None
+            # images read from S3 are loaded lazily, the caller owns the image and is responsible for closing it
+            return (image if image else s3.read_as(Image, bucket=bucket, key=key, uri=uri, lazy=True)), None
         else:
+            if not image:
+                image = s3.read_as(Image, bucket=bucket, key=key, uri=uri)
             new_x = int(scalar * x)
             new_y = int(scalar * y)
             new_image, scalar = image.resize((new_x, new_y), Image.BICUBIC), scalar
@@ -0,0 +1,76 @@
+import json
+import subprocess
+import sys
+import unittest
+
+# Executed in a fresh interpreter so that the measurements aren't affected by modules already loaded by the test run
+BENCHMARK = """
+import json
+import sys
+import time
+import boto3
+from moto import mock_s3
+
+services = []
+_client = boto3.session.Session.client
+_resource = boto3.session.Session.resource
+
+
+def client(self, service_name, *args, **kwargs):
+    services.append(service_name)
+    return _client(self, service_name, *args, **kwargs)
+
+
+def resource(self, service_name, *args, **kwargs):
+    services.append(service_name)
+    return _resource(self, service_name, *args, **kwargs)
+
+
+boto3.session.Session.client = client
+boto3.session.Session.resource = resource
+
+with mock_s3():
+    start = time.perf_counter()
+    import larry
+    import_time = time.perf_counter() - start
+    import_services = list(services)
+
+    start = time.perf_counter()
+    larry.s3.create_bucket('larry-testing')
+    larry.s3.write('foobar', 'larry-testing', 'imports.txt')
+    larry.s3.read('larry-testing', 'imports.txt')
+    read_time = time.perf_counter() - start
+
+print(json.dumps({
+    'import_time': import_time,
+    'read_time': read_time,
+    'import_services': import_services,
+    'services': services,
+    'modules': sorted(m for m in sys.modules if m.startswith('larry.'))
+}))
+"""
+
+
+def run_benchmark():
+    result = subprocess.run([sys.executable, '-c', BENCHMARK], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class ImportTests(unittest.TestCase):
+
+    def test_lazy_import(self):
+        result = run_benchmark()
+        self.assertEqual(result['import_services'], [])
+        self.assertEqual(set(result['services']), {'s3'})
+        for module in ['larry.sqs', 'larry.sfn', 'larry.sagemaker', 'larry.lmbda', 'larry.iam', 'larry.textract',
+                       'larry.dynamo']:
+            self.assertNotIn(module, result['modules'])
+
+
+if __name__ == '__main__':
+    if '--benchmark' in sys.argv:
+        result = run_benchmark()
+        print(f"import larry: {result['import_time'] * 1000:.1f}ms, "
+              f"first s3 read: {result['read_time'] * 1000:.1f}ms")
+    else:
+        unittest.main()
@@ -1,13 +1,38 @@
+import csv
 import pickle
 import unittest
+from unittest import mock
 import larry as lry
 from larry.types import Box
 from larry.utils import json_dumps
 import datetime
+import os
+import tempfile
+import io
+import zipfile
+from urllib import parse
+import time
+import threading
 import numpy as np
 from moto import mock_s3
 import json
+import gzip
+import bz2
+import lzma
 from PIL import Image
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 
 # S3 testing objects
@@ -84,6 +109,33 @@ class S3Tests(unittest.TestCase):
                 o.load()
             self.assertEqual('Not Found', context.exception.response['Error']['Message'])
 
+    def test_delete_many(self):
+        keys = [PATH_PREFIX + f'delete/{i}.txt' for i in range(2500)]
+        for key in keys:
+            lry.s3.client.put_object(Bucket=BUCKET, Key=key, Body=b'x')
+        summary = lry.s3.delete_many([lry.s3.join_uri(BUCKET, key) for key in keys[:10]])
+        self.assertEqual(summary, {'deleted': 10, 'errors': []})
+        self.assertFalse(lry.s3.exists(BUCKET, keys[0]))
+        summary = lry.s3.delete_many(keys[10:20], bucket=BUCKET, max_workers=2)
+        self.assertEqual(summary['deleted'], 10)
+        summary = lry.s3.delete_prefix(BUCKET, PATH_PREFIX + 'delete/')
+        self.assertEqual(summary['deleted'], 2480)
+        self.assertEqual(list(lry.s3.list_objects(BUCKET, PATH_PREFIX + 'delete/')), [])
+        with self.assertRaises(TypeError):
+            lry.s3.delete_prefix(BUCKET, '')
+
+        # only keys that fail with throttling or internal errors are retried
+        responses = [{'Errors': [{'Key': 'a', 'Code': 'SlowDown'}, {'Key': 'b', 'Code': 'AccessDenied'}]}, {}]
+        with mock.patch.object(lry.s3.client, 'delete_objects', side_effect=responses) as delete_objects, \
+                mock.patch('time.sleep'):
+            summary = lry.s3.delete_many(['a', 'b', 'c'], bucket=BUCKET)
+        self.assertEqual(summary['deleted'], 2)
+        self.assertEqual([(e['key'], e['code']) for e in summary['errors']], [('b', 'AccessDenied')])
+        self.assertEqual(delete_objects.call_count, 2)
+        self.assertEqual(delete_objects.call_args.kwargs['Delete']['Objects'], [{'Key': 'a'}])
+        with self.assertRaises(lry.ClientError):
+            lry.s3.delete_many(['a'], bucket=BUCKET + '-missing')
+
     def test_get_size(self):
         for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=KEY):
             self.assertGreater(lry.s3.size(*args, **kw), 10000)
@@ -119,6 +171,20 @@ class S3Tests(unittest.TestCase):
             self.assertEqual(list_dump(lry.s3.read_as([json], *args, **kw)), list_dump(SIMPLE_LIST_OF_DICTS))
             o.delete()
 
+    def test_iter_lines(self):
+        records = [{'a': i, 'text': 'café 漢字 \U0001f600' * i} for i in range(50)]
+        key = PATH_PREFIX + 'iter.jsonl'
+        for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=key):
+            o = lry.s3.write_as(records, [dict], *args, **kw)
+            # small chunks force multi-byte characters and newlines to be split across reads
+            lines = list(lry.s3.iter_lines(*args, **kw, chunk_size=7))
+            self.assertEqual([json.loads(line) for line in lines], records)
+            iterator = lry.s3.read_as(iter([dict]), *args, **kw, chunk_size=5)
+            self.assertFalse(isinstance(iterator, list))
+            self.assertEqual(list(iterator), records)
+            self.assertEqual(list(lry.s3.read_as(iter([str]), *args, **kw)), lines)
+            o.delete()
+
     def test_list(self):
         key = PATH_PREFIX + 'list.txt'
         for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=key):
@@ -129,6 +195,24 @@ class S3Tests(unittest.TestCase):
             self.assertEqual(lry.s3.read_as([str], *args, **kw), SIMPLE_LIST)
             o.delete()
 
+    def test_csv(self):
+        rows = [['id', 'name', 'note']] + [[str(i), f'naïve-{i}', 'line one\nline two'] for i in range(100)]
+        key = PATH_PREFIX + 'rows.csv'
+        for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=key):
+            o = lry.s3.write_as(rows, csv, *args, **kw)
+            self.assertEqual(list(lry.s3.read_as(csv, *args, **kw)), rows)
+            self.assertEqual(list(lry.s3.read_as(csv.reader, *args, **kw)), rows)
+            reader = lry.s3.read_as(csv.DictReader, *args, **kw)
+            self.assertEqual([[r['id'], r['name'], r['note']] for r in reader], rows[1:])
+            o.delete()
+
+        # the deprecated write_delimited passes options that the csv formatter doesn't accept
+        with self.assertWarns(DeprecationWarning):
+            lry.s3.write_delimited(rows[:2], BUCKET, key)
+        self.assertEqual(list(lry.s3.read_as(csv, BUCKET, key)), rows[:2])
+        lry.s3.write_as(SIMPLE_DICT, pickle, BUCKET, key, newline='\n')
+        self.assertEqual(json_dumps(lry.s3.read_as(pickle, BUCKET, key)), json_dumps(SIMPLE_DICT))
+
     def test_string(self):
         key = PATH_PREFIX + 'list.txt'
         for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=key):
@@ -168,6 +252,105 @@ class S3Tests(unittest.TestCase):
         lry.s3.delete(uri2)
         lry.s3.delete(uri1)
 
+    def test_copy_prefix(self):
+        src = PATH_PREFIX + 'copy-src/'
+        keys = [f'{d}/{i}.txt' for d in 'ab' for i in range(10)]
+        for key in keys:
+            lry.s3.write(key, BUCKET, src + key)
+        large = np.random.bytes(6 * 1024 * 1024)
+        lry.s3.write(large, BUCKET, src + 'large.bin', metadata={'foo': 'bar'}, tags={'a': 'b'})
+
+        summary = lry.s3.copy_prefix(BUCKET, src, new_uri=lry.s3.join_uri(BUCKET, PATH_PREFIX + 'copy-dest/'),
+                                     part_size=5 * 1024 * 1024, max_workers=4)
+        self.assertEqual((summary['copied'], summary['errors']), (21, []))
+        self.assertEqual(lry.s3.read_as(str, BUCKET, PATH_PREFIX + 'copy-dest/b/3.txt'), 'b/3.txt')
+        copied = lry.s3.Object(BUCKET, PATH_PREFIX + 'copy-dest/large.bin')
+        self.assertEqual(lry.s3.read(copied), large)
+        self.assertEqual(copied.metadata, {'foo': 'bar'})
+        self.assertEqual(copied.tags, {'a': 'b'})
+
+        with tempfile.TemporaryDirectory() as d:
+            checkpoint = os.path.join(d, 'checkpoint.jsonl')
+            pairs = [(lry.s3.join_uri(BUCKET, src + key), (BUCKET, PATH_PREFIX + 'copy-pairs/' + key))
+                     for key in keys[:5]]
+            self.assertEqual(lry.s3.copy_many(pairs, checkpoint=checkpoint)['copied'], 5)
+            self.assertEqual(lry.s3.copy_many(pairs, checkpoint=checkpoint)['skipped'], 5)
+
+            summary = lry.s3.move_prefix(src_uri=lry.s3.join_uri(BUCKET, src),
+                                         new_uri=lry.s3.join_uri(BUCKET, PATH_PREFIX + 'move-dest/'),
+                                         checkpoint=checkpoint)
+            self.assertEqual((summary['copied'], summary['deleted']), (21, 21))
+        self.assertEqual(list(lry.s3.list_objects(BUCKET, src)), [])
+        self.assertEqual(len(list(lry.s3.list_objects(BUCKET, PATH_PREFIX + 'move-dest/'))), 21)
+
+        summary = lry.s3.move_many([((BUCKET, PATH_PREFIX + 'move-dest/a/1.txt'), (BUCKET, src + 'a/1.txt'))])
+        self.assertEqual((summary['copied'], summary['deleted']), (1, 1))
+        self.assertTrue(lry.s3.exists(BUCKET, src + 'a/1.txt'))
+
+        # without prefixes the whole bucket is copied
+        lry.s3.create_bucket(BUCKET + '-copy')
+        summary = lry.s3.copy_prefix(BUCKET, new_bucket=BUCKET + '-copy')
+        self.assertEqual(summary['errors'], [])
+        self.assertEqual([c['Key'] for c in lry.s3.client.list_objects_v2(Bucket=BUCKET + '-copy')['Contents']],
+                         [c['Key'] for c in lry.s3.client.list_objects_v2(Bucket=BUCKET)['Contents']])
+
+    def test_download_to_zip(self):
+        prefix = PATH_PREFIX + 'zip/'
+        for i in range(10):
+            lry.s3.write(f'value {i}', BUCKET, prefix + f'{i}.txt')
+        large = np.random.bytes(9 * 1024 * 1024)
+        lry.s3.write(large, BUCKET, prefix + 'large.bin')
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'objects.zip')
+            lry.s3.download_to_zip(path, BUCKET, prefix, max_workers=2, max_bytes_in_flight=20)
+            with zipfile.ZipFile(path) as zf:
+                self.assertEqual(len(zf.namelist()), 11)
+                self.assertEqual(zf.read(parse.quote(prefix + '3.txt')), b'value 3')
+                self.assertEqual(zf.read(parse.quote(prefix + 'large.bin')), large)
+
+        uri = lry.s3.join_uri(BUCKET, PATH_PREFIX + 'objects.zip')
+        lry.s3.download_to_zip(uri, BUCKET, prefixes=[prefix + '1', prefix + '2'])
+        with zipfile.ZipFile(io.BytesIO(lry.s3.read(uri))) as zf:
+            self.assertEqual(sorted(zf.namelist()), [parse.quote(prefix + '1.txt'), parse.quote(prefix + '2.txt')])
+
+    def test_sync_dir(self):
+        prefix = PATH_PREFIX + 'sync/'
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dest:
+            os.makedirs(os.path.join(src, 'css'))
+            files = {'index.html': b'<html></html>', 'css/site.css': b'body {}', 'notes.tmp': b'x',
+                     'large.bin': np.random.bytes(9 * 1024 * 1024)}
+            for name, data in files.items():
+                with open(os.path.join(src, name), 'wb') as fp:
+                    fp.write(data)
+
+            summary = lry.s3.upload_dir(src, BUCKET, prefix, exclude='*.tmp')
+            self.assertEqual((summary['files'], summary['skipped']), (3, 0))
+            self.assertEqual(lry.s3.Object(BUCKET, prefix + 'index.html').content_type, 'text/html')
+            self.assertTrue(lry.s3.Object(BUCKET, prefix + 'large.bin').e_tag.endswith('-2"'))
+            self.assertEqual(lry.s3.upload_dir(src, BUCKET, prefix, exclude='*.tmp')['skipped'], 3)
+            # files older than their upload are unchanged when comparing modification times
+            os.utime(os.path.join(src, 'index.html'), (0, 0))
+            self.assertEqual(lry.s3.upload_dir(src, BUCKET, prefix, exclude='*.tmp', check_md5=False)['skipped'], 3)
+            with open(os.path.join(src, 'index.html'), 'wb') as fp:
+                fp.write(b'<html>changed</html>')
+            summary = lry.s3.upload_dir(src, lry.s3.join_uri(BUCKET, prefix), include=['*.html', 'css/*'])
+            self.assertEqual((summary['files'], summary['bytes'], summary['skipped']), (1, 20, 1))
+
+            summary = lry.s3.download_dir(dest, BUCKET, prefix)
+            self.assertEqual(summary['files'], 3)
+            with open(os.path.join(dest, 'css', 'site.css'), 'rb') as fp:
+                self.assertEqual(fp.read(), b'body {}')
+            self.assertEqual(lry.s3.download_dir(dest, BUCKET, prefix)['skipped'], 3)
+            self.assertEqual(lry.s3.download_dir(dest, BUCKET, prefix, check_md5=False)['skipped'], 3)
+
+            # keys that would escape the target directory are rejected before anything is written
+            lry.s3.write('x', BUCKET, prefix + 'nested/../../escape.txt')
+            with tempfile.TemporaryDirectory() as parent:
+                target = os.path.join(parent, 'target')
+                with self.assertRaises(ValueError):
+                    lry.s3.download_dir(target, BUCKET, prefix)
+                self.assertFalse(os.path.exists(os.path.join(parent, 'escape.txt')))
+
     def test_exists(self):
         for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=KEY):
             self.assertTrue(lry.s3.exists(*args, **kw))
@@ -192,6 +375,37 @@ class S3Tests(unittest.TestCase):
                                           lry.s3.read_as(np.ndarray, *args, **kw).reshape(NUMPY_SHAPE))
             o.delete()
 
+    def test_numpy_buffers(self):
+        key = PATH_PREFIX + 'buffers.npy'
+        for value in [np.asfortranarray(np.arange(12, dtype='int16').reshape(3, 4)), np.arange(10)[::2],
+                      np.array([(1, 2.5)], dtype=[('a', 'i4'), ('b', 'f8')]),
+                      np.array([{'a': 1}, None], dtype=object)]:
+            lry.s3.write(value, BUCKET, key, allow_pickle=True)
+            np.testing.assert_array_equal(lry.s3.read_as(np.ndarray, BUCKET, key, allow_pickle=True), value)
+
+        # small arrays are read from an immutable bytes buffer and are still writable
+        obj = lry.s3.write(NUMPY_ARRAY, BUCKET, key)
+        self.assertEqual(obj.records_written, NUMPY_ARRAY.size)
+        result = lry.s3.read_as(np.ndarray, BUCKET, key)
+        self.assertTrue(result.flags.writeable)
+        result += 1
+        np.testing.assert_array_equal(result, NUMPY_ARRAY + 1)
+
+        large = np.random.rand(1536, 1024)
+        obj = lry.s3.write(large, BUCKET, key)
+        self.assertGreater(obj.content_length, lry.s3.DEFAULT_PART_SIZE)
+        result = lry.s3.read_as(np.ndarray, BUCKET, key)
+        np.testing.assert_array_equal(result, large)
+        self.assertTrue(result.flags.writeable)
+
+        with tempfile.TemporaryDirectory() as d:
+            with lry.s3.ReadCache(d):
+                result = lry.s3.read_as(np.ndarray, BUCKET, key, mmap_mode='r')
+                self.assertIsInstance(result, np.memmap)
+                np.testing.assert_array_equal(result, large)
+                del result
+                self.assertTrue(lry.s3.read_as(np.ndarray, BUCKET, key).flags.writeable)
+
     def test_pillow(self):
         for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=PATH_PREFIX + "image.jpg"):
             with Image.open(IMAGE_PATH) as img:
@@ -206,6 +420,83 @@ class S3Tests(unittest.TestCase):
                 self.assertEqual(oi.format, img.format)
                 o.delete()
 
+    @unittest.skipUnless(cv2, 'requires opencv')
+    def test_cv2(self):
+        expected = cv2.imread(IMAGE_PATH)
+        np.testing.assert_array_equal(lry.s3.read_as(cv2, BUCKET, KEY), expected)
+        np.testing.assert_array_equal(lry.s3.read_as(cv2.imread, BUCKET, KEY), expected)
+        gray = lry.s3.read_as(cv2, BUCKET, KEY, flags=cv2.IMREAD_GRAYSCALE)
+        self.assertEqual(gray.shape, expected.shape[:2])
+
+        # png is lossless so the decoded image matches the one encoded
+        key = PATH_PREFIX + 'cv2.png'
+        for _type in [cv2, cv2.imwrite]:
+            obj = lry.s3.write_as(expected, _type, BUCKET, key)
+            self.assertEqual(obj.content_type, 'image/png')
+            self.assertEqual(lry.s3.read(BUCKET, key)[:4], b'\x89PNG')
+            np.testing.assert_array_equal(lry.s3.read_as(cv2, BUCKET, key), expected)
+        images = lry.s3.read_as_many(cv2, [(BUCKET, KEY), (BUCKET, key)], ordered=True)
+        self.assertEqual([image.shape for _, image in images], [expected.shape] * 2)
+
+    @unittest.skipUnless(pa, 'requires pyarrow')
+    def test_parquet(self):
+        key = PATH_PREFIX + 'table.parquet'
+        rows = 12000
+        rng = np.random.default_rng(0)
+        table = pa.table({'id': pa.array(range(rows), pa.int32()),
+                          'a': [rng.bytes(16).hex() for _ in range(rows)],
+                          'b': [rng.bytes(16).hex() for _ in range(rows)]})
+        obj = lry.s3.write_as(table, pa.Table, BUCKET, key, row_group_size=rows // 2)
+        self.assertEqual(obj.content_type, 'application/vnd.apache.parquet')
+        self.assertEqual(obj.records_written, rows)
+        self.assertTrue(lry.s3.read_as(pa.Table, BUCKET, key).equals(table))
+
+        # each row group is written separately
+        with lry.s3.ObjectReader(BUCKET, key) as fp:
+            self.assertEqual(pq.ParquetFile(fp).num_row_groups, 2)
+        subset = lry.s3.read_as(pq, BUCKET, key, row_groups=[1], columns=['id'])
+        self.assertEqual(subset.column_names, ['id'])
+        self.assertEqual(subset.column('id').to_pylist(), list(range(rows // 2, rows)))
+
+        # only the footer and the chunks of the selected column are retrieved
+        with lry.s3.ObjectReader(BUCKET, key) as fp:
+            self.assertTrue(pq.ParquetFile(fp).read(columns=['id']).equals(table.select(['id'])))
+            self.assertLess(fp.bytes_requested, fp.size / 4)
+
+        if pd is not None:
+            frame = table.to_pandas()
+            lry.s3.write_as(frame, pd.DataFrame, BUCKET, key)
+            self.assertTrue(lry.s3.read_as(pd.DataFrame, BUCKET, key).equals(frame))
+            self.assertTrue(lry.s3.read_as(pd, BUCKET, key, columns=['a']).equals(frame[['a']]))
+
+    def test_image_info(self):
+        key = PATH_PREFIX + 'info.jpg'
+        with Image.open(IMAGE_PATH) as img:
+            lry.s3.write_as(img, Image, BUCKET, key)
+            info = lry.s3.image_info(BUCKET, key)
+            self.assertEqual(info['format'], 'JPEG')
+            self.assertEqual((info['width'], info['height']), img.size)
+            self.assertEqual(info['mode'], img.mode)
+            self.assertEqual(info['content_length'], lry.s3.size(BUCKET, key))
+
+            # only the header is retrieved to identify the image
+            with lry.s3.ObjectReader(BUCKET, key, block_size=lry.s3.IMAGE_HEADER_SIZE) as fp:
+                with Image.open(fp) as header:
+                    self.assertEqual(header.size, img.size)
+                self.assertLessEqual(fp.bytes_requested, lry.s3.IMAGE_HEADER_SIZE)
+                self.assertLess(fp.bytes_requested, info['content_length'] / 4)
+
+            lazy = lry.s3.read_as(Image, BUCKET, key, lazy=True)
+            self.assertEqual(lazy.size, img.size)
+            lazy.load()
+            self.assertEqual(lazy.size, img.size)
+            lazy.close()
+
+        uris = [f's3://{BUCKET}/{key}', f's3://{BUCKET}/{PATH_PREFIX}missing.jpg']
+        results = list(lry.s3.image_info_many(uris, ordered=True))
+        self.assertEqual(results[0], (uris[0], info))
+        self.assertIsInstance(results[1][1], lry.ClientError)
+
     def test_pickle(self):
         for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=PATH_PREFIX + '.pkl'):
             o = lry.s3.write_as(SIMPLE_DICT, pickle, *args, **kw)
@@ -213,6 +504,95 @@ class S3Tests(unittest.TestCase):
             self.assertEqual(o.content_type, "application/octet-stream")
             o.delete()
 
+    def test_read_ranges(self):
+        data = np.random.bytes(3 * 1024 * 1024 + 11)
+        key = PATH_PREFIX + 'large.bin'
+        for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=key):
+            o = lry.s3.write(data, *args, **kw)
+            self.assertEqual(lry.s3.read(*args, **kw, part_size=256 * 1024 + 3, max_concurrency=4), data)
+            self.assertEqual(lry.s3.read(*args, **kw), data)
+            self.assertEqual(lry.s3.read(*args, **kw, byte_count=10), data[:10])
+            o.delete()
+        o = lry.s3.write(b'', BUCKET, key)
+        self.assertEqual(lry.s3.read(BUCKET, key, part_size=1024), b'')
+        o.delete()
+
+    def test_read_many(self):
+        uris = [lry.s3.join_uri(BUCKET, PATH_PREFIX + f'many/{i}.json') for i in range(20)]
+        for i, uri in enumerate(uris):
+            lry.s3.write({'i': i}, uri)
+        missing = lry.s3.join_uri(BUCKET, PATH_PREFIX + 'many/missing.json')
+
+        results = list(lry.s3.read_many(uris + [missing], ordered=True))
+        self.assertEqual([uri for uri, _ in results], uris + [missing])
+        self.assertEqual(json.loads(results[3][1]), {'i': 3})
+        self.assertIsInstance(results[-1][1], lry.ClientError)
+        with self.assertRaises(lry.ClientError):
+            list(lry.s3.read_many([missing], return_exceptions=False))
+
+        pairs = [lry.s3.split_uri(uri) for uri in uris]
+        results = dict(lry.s3.read_as_many(dict, pairs, max_workers=4))
+        self.assertEqual(results, {pair: {'i': i} for i, pair in enumerate(pairs)})
+
+        keys = [lry.s3.uri_key(uri) for uri in uris]
+        results = dict(lry.s3.read_as_many(dict, keys, bucket=BUCKET))
+        self.assertEqual(results[keys[5]], {'i': 5})
+
+        objects = list(lry.s3.list_objects(BUCKET, PATH_PREFIX + 'many/'))
+        results = list(lry.s3.read_as_many(dict, objects, ordered=True))
+        self.assertEqual([r[1] for r in results], [lry.s3.read_as(dict, obj) for obj in objects])
+
+    def test_open(self):
+        uri = lry.s3.join_uri(BUCKET, PATH_PREFIX + 'open.bin')
+        data = np.random.bytes(11 * 1024 * 1024)
+        with lry.s3.open(uri, 'wb', part_size=5 * 1024 * 1024, metadata={'foo': 'bar'}) as fp:
+            for i in range(0, len(data), 1024 * 1024):
+                fp.write(data[i:i + 1024 * 1024])
+        self.assertEqual(fp.bytes_written, len(data))
+        self.assertEqual(lry.s3.read(uri), data)
+        self.assertEqual(lry.s3.Object(uri).metadata, {'foo': 'bar'})
+        with lry.s3.open(uri, 'rb') as fp:
+            self.assertEqual(fp.read(10), data[:10])
+
+        key = PATH_PREFIX + 'open.txt'
+        with lry.s3.open(BUCKET, key, mode='w') as fp:
+            for v in SIMPLE_LIST:
+                fp.write(v + '\n')
+        self.assertEqual(lry.s3.read_as([str], BUCKET, key), SIMPLE_LIST)
+        self.assertEqual(lry.s3.Object(BUCKET, key).content_type, 'text/plain')
+        with lry.s3.open(BUCKET, key, 'r') as fp:
+            self.assertEqual(fp.readline(), SIMPLE_LIST[0] + '\n')
+
+        aborted = lry.s3.join_uri(BUCKET, PATH_PREFIX + 'aborted.bin')
+        with self.assertRaises(RuntimeError):
+            with lry.s3.open(aborted, 'wb', part_size=5 * 1024 * 1024) as fp:
+                fp.write(data)
+                raise RuntimeError()
+        self.assertFalse(lry.s3.exists(aborted))
+        self.assertEqual(lry.s3.client.list_multipart_uploads(Bucket=BUCKET).get('Uploads', []), [])
+
+        lry.s3.write_as(({'i': i} for i in range(5)), [dict], BUCKET, PATH_PREFIX + 'open.jsonl')
+        self.assertEqual(lry.s3.read_as([dict], BUCKET, PATH_PREFIX + 'open.jsonl'), [{'i': i} for i in range(5)])
+
+    def test_write_generator(self):
+        key = PATH_PREFIX + 'generator.jsonl'
+        records = ({'i': i, 'value': 'x' * 100} for i in range(60000))
+        obj = lry.s3.write_as(records, [dict], BUCKET, key, part_size=5 * 1024 * 1024)
+        self.assertEqual(obj.records_written, 60000)
+        self.assertEqual(obj.bytes_written, obj.content_length)
+        self.assertGreater(obj.content_length, 5 * 1024 * 1024)
+        result = lry.s3.read_as([dict], BUCKET, key)
+        self.assertEqual(len(result), 60000)
+        self.assertEqual(result[-1], {'i': 59999, 'value': 'x' * 100})
+
+        obj = lry.s3.write((v for v in SIMPLE_LIST), BUCKET, PATH_PREFIX + 'generator.txt')
+        self.assertEqual(obj.records_written, len(SIMPLE_LIST))
+        self.assertEqual(lry.s3.read_as([str], BUCKET, PATH_PREFIX + 'generator.txt'), SIMPLE_LIST)
+
+        obj = lry.s3.write_as(([i, i * 2] for i in range(3)), csv, BUCKET, PATH_PREFIX + 'generator.csv')
+        self.assertEqual(obj.records_written, 3)
+        self.assertEqual(list(lry.s3.read_as(csv, BUCKET, PATH_PREFIX + 'generator.csv')), [['0', '0'], ['1', '2'], ['2', '4']])
+
     def test_append(self):
         for args, kw in S3Tests._parameter_permutations(bucket=BUCKET, key=PATH_PREFIX + "append.txt"):
             o = lry.s3.write("Header", *args, **kw)
@@ -226,6 +606,408 @@ class S3Tests(unittest.TestCase):
             self.assertTrue(lry.s3.read_as(str, *args, **kw), "\n".join(["Header"]+SIMPLE_LIST))
             o.delete()
 
+    def test_append_large(self):
+        key = PATH_PREFIX + 'append-large.txt'
+        body = b'x' * (6 * 1024 * 1024)
+        lry.s3.write(body, BUCKET, key, metadata={'foo': 'bar'}, tags={'a': 'b'}, content_type='text/plain')
+        lry.s3.append('tail', BUCKET, key, prefix='\n')
+        obj = lry.s3.Object(BUCKET, key)
+        self.assertEqual(lry.s3.read(BUCKET, key), body + b'\ntail')
+        self.assertEqual(obj.metadata, {'foo': 'bar'})
+        self.assertEqual(obj.tags, {'a': 'b'})
+        self.assertEqual(obj.content_type, 'text/plain')
+        self.assertEqual(lry.s3.client.list_multipart_uploads(Bucket=BUCKET).get('Uploads', []), [])
+
+    def test_appender(self):
+        key = PATH_PREFIX + 'appender.jsonl'
+        with lry.s3.Appender(BUCKET, key, max_records=10, max_age=None) as appender:
+            for i in range(25):
+                appender.append({'i': i})
+            self.assertEqual(len(lry.s3.read_as([dict], BUCKET, key)), 20)
+        self.assertEqual(lry.s3.read_as([dict], BUCKET, key), [{'i': i} for i in range(25)])
+        self.assertEqual(appender.records_flushed, 25)
+        with self.assertRaises(ValueError):
+            appender.append({'i': 25})
+
+        with lry.s3.Appender(BUCKET, PATH_PREFIX + 'segments/log.txt', max_records=2, rolling='sequence') as appender:
+            for v in SIMPLE_LIST:
+                appender.append(v)
+        keys = [obj.key for obj in lry.s3.list_objects(BUCKET, PATH_PREFIX + 'segments/')]
+        self.assertEqual(keys[0], PATH_PREFIX + 'segments/log-000000.txt')
+        self.assertEqual(len(keys), -(-len(SIMPLE_LIST) // 2))
+        self.assertEqual([v for k in keys for v in lry.s3.read_as([str], BUCKET, k)], SIMPLE_LIST)
+
+        # a new appender continues after the existing segments and formats values the way append does
+        with lry.s3.Appender(BUCKET, PATH_PREFIX + 'segments/log.txt', rolling='sequence', max_age=None) as appender:
+            appender.append(1)
+            appender.append(2.5)
+        next_key = PATH_PREFIX + 'segments/log-{:06d}.txt'.format(len(keys))
+        self.assertEqual(lry.s3.read_as([str], BUCKET, next_key), ['1', '2.5'])
+
+        key = PATH_PREFIX + 'appender-age.txt'
+        appender = lry.s3.Appender(BUCKET, key, max_age=0.5)
+        appender.append('foo')
+        time.sleep(2)
+        self.assertEqual(lry.s3.read_as(str, BUCKET, key), 'foo\n')
+        appender.close()
+
+    def test_object_snapshot(self):
+        key = PATH_PREFIX + 'snapshot.txt'
+        lry.s3.write('foo', BUCKET, key, metadata={'foo': 'bar'}, tags={'a': 'b'})
+        snapshot = lry.s3.Object(BUCKET, key).snapshot()
+        self.assertTrue(snapshot.exists)
+        self.assertEqual(snapshot.content_length, 3)
+        self.assertEqual(snapshot.content_type, 'text/plain')
+        self.assertEqual(dict(snapshot.metadata), {'foo': 'bar'})
+        self.assertEqual(dict(snapshot.tags), {'a': 'b'})
+        self.assertEqual(len(snapshot.grants), 1)
+        self.assertLess(snapshot.age, 60)
+        with self.assertRaises(AttributeError):
+            snapshot.content_length = 4
+
+        requests = []
+
+        def record(model, **kwargs):
+            requests.append(model.name)
+        lry.s3.client.meta.events.register('before-call.s3', record)
+        self.addCleanup(lry.s3.client.meta.events.unregister, 'before-call.s3', record)
+        self.assertEqual(lry.s3.size(BUCKET, key, max_age=60), 3)
+        self.assertEqual(lry.s3.get_content_type(BUCKET, key, max_age=60), 'text/plain')
+        self.assertTrue(lry.s3.exists(BUCKET, key, max_age=60))
+        self.assertIs(lry.s3.Object(BUCKET, key).snapshot(max_age=60), snapshot)
+        self.assertEqual(requests, [])
+
+        # appends update the snapshot so that the following appends don't retrieve it again
+        lry.s3.append('bar', BUCKET, key, max_age=60)
+        self.assertEqual(requests, ['GetObject', 'PutObject', 'PutObjectAcl'])
+        self.assertEqual(lry.s3.size(BUCKET, key, max_age=60), 6)
+
+        # an out of date snapshot is replaced when an append fails
+        lry.s3.client.put_object(Bucket=BUCKET, Key=key, Body=b'baz')
+        lry.s3.append('!', BUCKET, key, max_age=60)
+        self.assertEqual(lry.s3.read_as(str, BUCKET, key), 'baz!')
+        self.assertEqual(lry.s3.size(BUCKET, key), 4)
+
+        lry.s3.write('foobar', BUCKET, key)
+        self.assertEqual(lry.s3.size(BUCKET, key, max_age=60), 6)
+        # uploads and copies discard the snapshot of the object they replace
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'snapshot.txt'), 'wb') as fp:
+                fp.write(b'uploaded')
+            lry.s3.upload_dir(directory, BUCKET, PATH_PREFIX)
+        self.assertEqual(lry.s3.size(BUCKET, key, max_age=60), 8)
+        lry.s3.write('copied!!!', BUCKET, PATH_PREFIX + 'snapshot-source.txt')
+        lry.s3.copy(src_bucket=BUCKET, src_key=PATH_PREFIX + 'snapshot-source.txt', new_bucket=BUCKET, new_key=key)
+        self.assertEqual(lry.s3.size(BUCKET, key, max_age=60), 9)
+        lry.s3.delete(BUCKET, key)
+        self.assertFalse(lry.s3.exists(BUCKET, key, max_age=60))
+        self.assertFalse(lry.s3.Object(BUCKET, key).snapshot().exists)
+
+    def test_find_keys_not_present(self):
+        keys = [PATH_PREFIX + f'find/{d}/{i}.txt' for d in 'abc' for i in range(15)]
+        for key in keys[::2]:
+            lry.s3.write('x', BUCKET, key)
+        lry.s3.write('x', BUCKET, PATH_PREFIX + 'find/a/extra.txt')
+        missing = keys[1::2] + [PATH_PREFIX + 'other/missing.txt']
+        for max_prefixes in [1, 2, 64]:
+            self.assertEqual(lry.s3.find_keys_not_present(BUCKET, keys + missing[-1:], max_prefixes=max_prefixes),
+                             missing)
+            self.assertEqual(lry.s3.find_keys_not_present(BUCKET, keys, max_prefixes=max_prefixes), missing[:-1])
+        uris = [(lry.s3.join_uri(BUCKET, key), i) for i, key in enumerate(keys)]
+        self.assertEqual(lry.s3.find_keys_not_present(BUCKET, uris=uris), [(key, i) for i, key in enumerate(keys) if i % 2])
+
+        # keys spread through a large listing are checked with HEAD requests once the listing looks more expensive
+        for i in range(1500):
+            if i != 1410:
+                lry.s3.client.put_object(Bucket=BUCKET, Key=PATH_PREFIX + f'dense/{i:04d}.txt', Body=b'x')
+        keys = [PATH_PREFIX + f'dense/{i:04d}.txt' for i in [0] + list(range(1400, 1420))]
+        requests = []
+
+        def record(model, **kwargs):
+            requests.append(model.name)
+        lry.s3.client.meta.events.register('before-call.s3', record)
+        self.addCleanup(lry.s3.client.meta.events.unregister, 'before-call.s3', record)
+        self.assertEqual(lry.s3.find_keys_not_present(BUCKET, keys, max_prefixes=1), [PATH_PREFIX + 'dense/1410.txt'])
+        self.assertEqual(requests.count('ListObjectsV2'), 1)
+        self.assertEqual(requests.count('HeadObject'), 20)
+
+    def test_list_objects_detail(self):
+        for i in range(5):
+            lry.s3.write('x' * i, BUCKET, PATH_PREFIX + f'detail/{i}.txt')
+        summaries = list(lry.s3.list_objects(BUCKET, PATH_PREFIX + 'detail/', detail=True))
+        self.assertEqual([s.key for s in summaries], [PATH_PREFIX + f'detail/{i}.txt' for i in range(1, 5)])
+        self.assertEqual([s.size for s in summaries], [1, 2, 3, 4])
+        summary = summaries[2]
+        obj = summary.to_object()
+        self.assertEqual(summary.e_tag, obj.e_tag)
+        self.assertEqual(summary.last_modified, obj.last_modified)
+        self.assertEqual(summary.storage_class, 'STANDARD')
+        self.assertEqual(lry.s3.read_as(str, summary), 'xxx')
+        self.assertEqual(summary.uri, obj.uri)
+        self.assertEqual(len(list(lry.s3.list_objects(BUCKET, PATH_PREFIX + 'detail/', detail=True,
+                                                      include_empty_objects=True))), 5)
+
+    def test_list_objects_sharded(self):
+        flat = [PATH_PREFIX + f'sharded/flat/{i:x}.txt' for i in range(1100)]
+        nested = [PATH_PREFIX + f'sharded/nested/{d}/{i}.txt' for d in 'abc' for i in range(5)]
+        for key in flat + nested + [PATH_PREFIX + 'sharded/nested/top.txt']:
+            lry.s3.client.put_object(Bucket=BUCKET, Key=key, Body=b'x')
+        for prefix in ['sharded/flat/', 'sharded/nested/', 'sharded/']:
+            expected = [obj.key for obj in lry.s3.list_objects(BUCKET, PATH_PREFIX + prefix)]
+            result = [obj.key for obj in lry.s3.list_objects(BUCKET, PATH_PREFIX + prefix, max_workers=8)]
+            self.assertEqual(result, expected)
+            result = [obj.key for obj in lry.s3.list_objects(BUCKET, PATH_PREFIX + prefix, max_workers=8,
+                                                             ordered=False, detail=True)]
+            self.assertEqual(sorted(result), expected)
+
+        # numbered keys are split across shards and the pages of an ordered listing are fetched concurrently
+        numbered = [PATH_PREFIX + f'sharded/numbered/{i:05d}.txt' for i in range(2500)]
+        for key in numbered:
+            lry.s3.client.put_object(Bucket=BUCKET, Key=key, Body=b'x')
+        state = {'in_flight': 0, 'max_in_flight': 0}
+        lock = threading.Lock()
+
+        def before(params, context, **kwargs):
+            # single-key listings sample the shard boundaries, only the pages of the listing are counted
+            if 'MaxKeys' not in params:
+                context['page'] = True
+                with lock:
+                    state['in_flight'] += 1
+                    state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+
+        def after(context, **kwargs):
+            if context.get('page'):
+                time.sleep(0.05)
+                with lock:
+                    state['in_flight'] -= 1
+        events = lry.s3.client.meta.events
+        events.register('before-parameter-build.s3.ListObjectsV2', before)
+        events.register('after-call.s3.ListObjectsV2', after)
+        self.addCleanup(events.unregister, 'before-parameter-build.s3.ListObjectsV2', before)
+        self.addCleanup(events.unregister, 'after-call.s3.ListObjectsV2', after)
+        result = [obj.key for obj in lry.s3.list_objects(BUCKET, PATH_PREFIX + 'sharded/numbered/', max_workers=8)]
+        self.assertEqual(result, numbered)
+        self.assertGreater(state['max_in_flight'], 1)
+
+    def test_list_new_objects(self):
+        prefix = PATH_PREFIX + 'new/'
+        for i in range(5):
+            lry.s3.write(str(i), BUCKET, prefix + f'{i:03d}.txt')
+        with tempfile.TemporaryDirectory() as d:
+            index = lry.s3.ListingIndex(os.path.join(d, 'listings.db'))
+            self.assertEqual(len(list(lry.s3.list_objects(BUCKET, prefix, index=index))), 5)
+            self.assertEqual(index.last_key(BUCKET, prefix), prefix + '004.txt')
+            self.assertEqual(list(lry.s3.list_new_objects(BUCKET, prefix, since=index)), [])
+
+            lry.s3.write('changed', BUCKET, prefix + '001.txt')
+            lry.s3.write('5', BUCKET, prefix + '005.txt')
+            result = [obj.key for obj in lry.s3.list_new_objects(BUCKET, prefix, since=index, detail=True)]
+            self.assertEqual(result, [prefix + '001.txt', prefix + '005.txt'])
+            self.assertEqual(list(lry.s3.list_new_objects(BUCKET, prefix, since=index)), [])
+
+            lry.s3.write('6', BUCKET, prefix + '006.txt')
+            lry.s3.write('7', BUCKET, prefix + '007.txt')
+            result = [obj.key for obj in lry.s3.list_new_objects(BUCKET, prefix, since=index, append_only=True)]
+            self.assertEqual(result, [prefix + '006.txt', prefix + '007.txt'])
+            self.assertEqual(index.last_key(BUCKET, prefix), prefix + '007.txt')
+            self.assertEqual(list(lry.s3.list_new_objects(BUCKET, prefix, since=index, append_only=True)), [])
+            index.close()
+
+            # indexes opened from a path are closed when the listing finishes
+            path = os.path.join(d, 'path.db')
+            close = lry.s3.ListingIndex.close
+            with mock.patch.object(lry.s3.ListingIndex, 'close', autospec=True, side_effect=close) as closed:
+                self.assertEqual(len(list(lry.s3.list_new_objects(BUCKET, prefix, since=path))), 8)
+                self.assertEqual(len(list(lry.s3.list_objects(BUCKET, prefix, index=path))), 8)
+                self.assertEqual(closed.call_count, 2)
+
+    def test_read_cache(self):
+        key = PATH_PREFIX + 'cached.json'
+        lry.s3.write({'a': 1}, BUCKET, key)
+        with tempfile.TemporaryDirectory() as d:
+            with lry.s3.ReadCache(d) as cache:
+                self.assertEqual(lry.s3.read_as(dict, BUCKET, key), {'a': 1})
+                self.assertEqual(lry.s3.read_as(dict, BUCKET, key), {'a': 1})
+                self.assertEqual(list(lry.s3.iter_lines(BUCKET, key)), ['{"a": 1}'])
+                self.assertEqual((cache.misses, cache.hits), (1, 2))
+                self.assertEqual(cache.bytes_saved, 16)
+                lry.s3.write({'a': 2}, BUCKET, key)
+                self.assertEqual(lry.s3.read_as(dict, BUCKET, key), {'a': 2})
+                self.assertEqual(cache.misses, 2)
+            self.assertIsNone(lry.s3._read_cache)
+
+            # a new cache over the same directory picks up the existing entries
+            with lry.s3.ReadCache(d, ttl=60) as cache:
+                lry.s3.write({'a': 3}, BUCKET, key)
+                self.assertEqual(lry.s3.read_as(dict, BUCKET, key), {'a': 2})
+                self.assertEqual(cache.hits, 1)
+
+            cache = lry.s3.ReadCache(d, max_bytes=20)
+            with cache:
+                for i in range(3):
+                    lry.s3.write('x' * 8, BUCKET, PATH_PREFIX + f'cached{i}.txt')
+                    lry.s3.read(BUCKET, PATH_PREFIX + f'cached{i}.txt')
+            self.assertEqual(cache.size, 16)
+
+            # files opened from the cache remain readable after their entry is evicted
+            with cache.get(BUCKET, PATH_PREFIX + 'cached1.txt', opener=io.open) as fp:
+                misses = cache.misses
+                with cache:
+                    lry.s3.read(BUCKET, PATH_PREFIX + 'cached0.txt')
+                    lry.s3.read(BUCKET, PATH_PREFIX + 'cached2.txt')
+                    lry.s3.read(BUCKET, PATH_PREFIX + 'cached1.txt')
+                self.assertEqual(cache.misses, misses + 3)
+                self.assertEqual(fp.read(), 'x' * 8)
+            cache.clear()
+            self.assertEqual(os.listdir(d), [])
+
+        # misses are retrieved with concurrent ranged requests
+        data = os.urandom(300 * 1024)
+        lry.s3.write(data, BUCKET, PATH_PREFIX + 'cached.bin')
+        ranges = []
+
+        def record(params, **kwargs):
+            ranges.append(params.get('Range'))
+        lry.s3.client.meta.events.register('before-parameter-build.s3.GetObject', record)
+        self.addCleanup(lry.s3.client.meta.events.unregister, 'before-parameter-build.s3.GetObject', record)
+        with tempfile.TemporaryDirectory() as d, mock.patch.object(lry.s3, 'DEFAULT_PART_SIZE', 64 * 1024):
+            with lry.s3.ReadCache(d):
+                self.assertEqual(lry.s3.read(BUCKET, PATH_PREFIX + 'cached.bin'), data)
+        self.assertEqual(len(ranges), 5)
+        self.assertTrue(all(ranges))
+
+    def test_result_cache(self):
+        key = PATH_PREFIX + 'result.json'
+        lry.s3.write({'a': [1]}, BUCKET, key)
+        with lry.s3.ResultCache() as cache:
+            value = lry.s3.read_as(dict, BUCKET, key)
+            self.assertIs(lry.s3.read_as(dict, lry.s3.join_uri(BUCKET, key)), value)
+            self.assertEqual(lry.s3.read_as(str, BUCKET, key), '{"a": [1]}')
+            self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 2, 2))
+            lry.s3.write({'a': [2]}, BUCKET, key)
+            self.assertEqual(lry.s3.read_as(dict, BUCKET, key), {'a': [2]})
+            self.assertEqual(len(cache), 2)
+
+            # streaming results aren't cached, so their reads don't check the ETag
+            requests = []
+
+            def record(model, **kwargs):
+                requests.append(model.name)
+            lry.s3.client.meta.events.register('before-call.s3', record)
+            self.addCleanup(lry.s3.client.meta.events.unregister, 'before-call.s3', record)
+            self.assertEqual(len(list(lry.s3.read_as(csv, BUCKET, key))), 1)
+            self.assertEqual(list(lry.s3.read_as(iter([str]), BUCKET, key)), ['{"a": [2]}'])
+            self.assertEqual(requests, ['GetObject', 'GetObject'])
+            self.assertEqual(len(cache), 2)
+
+            # lazy images hold a reader of the object that's closed with the image, so they aren't shared
+            images = [lry.s3.read_as(Image, BUCKET, KEY, lazy=True) for _ in range(2)]
+            self.assertIsNot(images[0], images[1])
+            for image in images:
+                reader = image.fp
+                image.close()
+                self.assertTrue(reader.closed)
+            self.assertEqual(len(cache), 2)
+        self.assertIsNone(lry.s3._result_cache)
+
+        with lry.s3.ResultCache(copy=True) as cache:
+            value = lry.s3.read_as(dict, BUCKET, key)
+            value['a'].append(3)
+            self.assertEqual(lry.s3.read_as(dict, BUCKET, key), {'a': [2]})
+            self.assertEqual(cache.hits, 1)
+
+        with lry.s3.ResultCache(max_bytes=20) as cache:
+            for i in range(3):
+                lry.s3.write({'i': i}, BUCKET, PATH_PREFIX + f'result{i}.json')
+                lry.s3.read_as(dict, BUCKET, PATH_PREFIX + f'result{i}.json')
+            self.assertEqual(len(cache), 2)
+
+    def test_object_reader(self):
+        data = os.urandom(300000)
+        key = PATH_PREFIX + 'ranges.bin'
+        lry.s3.write(data, BUCKET, key)
+        with lry.s3.ObjectReader(BUCKET, key, part_size=50000) as fp:
+            self.assertEqual(fp.size, len(data))
+            fp.seek(-8, io.SEEK_END)
+            self.assertEqual(fp.read(8), data[-8:])
+            fp.seek(100)
+            self.assertEqual(fp.read(10), data[100:110])
+            self.assertEqual(fp.read(10), data[110:120])
+            self.assertEqual(fp.bytes_requested, 8 + 64 * 1024)
+            fp.seek(1000)
+            self.assertEqual(fp.read(200000), data[1000:201000])
+            fp.seek(0)
+            self.assertEqual(fp.read(), data)
+            self.assertEqual(fp.read(5), b'')
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('large.txt', os.urandom(100000))
+            zf.writestr('small.txt', SIMPLE_STRING)
+        lry.s3.write(buffer.getvalue(), BUCKET, PATH_PREFIX + 'ranges.zip')
+        with lry.s3.ObjectReader(BUCKET, PATH_PREFIX + 'ranges.zip', block_size=1024) as fp:
+            self.assertEqual(zipfile.ZipFile(fp).read('small.txt').decode(), SIMPLE_STRING)
+            self.assertLess(fp.bytes_requested, 10000)
+
+    def test_compression(self):
+        records = [{'a': i, 'b': 'value'} for i in range(1000)]
+        key = PATH_PREFIX + 'compressed.jsonl.gz'
+        obj = lry.s3.write_as(records, [dict], BUCKET, key)
+        self.assertEqual(obj.records_written, len(records))
+        self.assertEqual(obj.content_type, 'application/gzip')
+        self.assertEqual(gzip.decompress(lry.s3.read(BUCKET, key)).decode().splitlines()[0], '{"a": 0, "b": "value"}')
+        self.assertEqual(lry.s3.read_as([dict], BUCKET, key), records)
+
+        # blocks compressed concurrently are read as a single stream
+        for suffix, module in [('.gz', gzip), ('.bz2', bz2), ('.xz', lzma)]:
+            key = PATH_PREFIX + 'parallel.jsonl' + suffix
+            lry.s3.write_as(iter(records), [dict], BUCKET, key, compression_workers=4, part_size=4096)
+            self.assertEqual(len(module.decompress(lry.s3.read(BUCKET, key)).splitlines()), len(records))
+            self.assertEqual(list(lry.s3.read_as(iter([dict]), BUCKET, key)), records)
+
+        key = PATH_PREFIX + 'encoded.json'
+        lry.s3.write_as(SIMPLE_LIST_OF_DICTS, dict, BUCKET, key, content_encoding='gzip', compression_level=9)
+        self.assertEqual(lry.s3.get_content_type(BUCKET, key), 'application/json')
+        self.assertEqual(lry.s3.read(BUCKET, key)[:2], b'\x1f\x8b')
+        self.assertEqual(lry.s3.read_as(dict, BUCKET, key), SIMPLE_LIST_OF_DICTS)
+
+        key = PATH_PREFIX + 'open.txt.gz'
+        with lry.s3.open(BUCKET, key, 'w') as fp:
+            for line in SIMPLE_LIST:
+                fp.write(line + '\n')
+        with lry.s3.open(BUCKET, key, 'r') as fp:
+            self.assertEqual(fp.read().splitlines(), SIMPLE_LIST)
+        self.assertEqual(list(lry.s3.iter_lines(BUCKET, key)), SIMPLE_LIST)
+
+        # appends to compressed objects add a compressed stream
+        lry.s3.append('extra\n', BUCKET, key)
+        self.assertEqual(list(lry.s3.iter_lines(BUCKET, key)), SIMPLE_LIST + ['extra'])
+        key = PATH_PREFIX + 'appended.jsonl.gz'
+        with lry.s3.Appender(BUCKET, key, max_records=2, max_age=None) as appender:
+            for record in SIMPLE_LIST_OF_DICTS:
+                appender.append(record)
+        self.assertEqual(lry.s3.read_as([dict], BUCKET, key), SIMPLE_LIST_OF_DICTS)
+        with lry.s3.Appender(BUCKET, key, rolling='sequence', max_age=None) as appender:
+            appender.append(SIMPLE_LIST_OF_DICTS[0])
+        key = PATH_PREFIX + 'appended-000000.jsonl.gz'
+        self.assertEqual(lry.s3.get_content_type(BUCKET, key), 'application/gzip')
+        self.assertEqual(lry.s3.read_as([dict], BUCKET, key), SIMPLE_LIST_OF_DICTS[:1])
+
+        # data that is already compressed is written as is unless compression is requested
+        key = PATH_PREFIX + 'precompressed.txt.gz'
+        data = gzip.compress(b'hello\n')
+        lry.s3.write_as(data, bytes, BUCKET, key)
+        self.assertEqual(lry.s3.read(BUCKET, key), data)
+        self.assertEqual(lry.s3.read_as(str, BUCKET, key), 'hello\n')
+        with lry.s3.open(BUCKET, key, 'wb') as fp:
+            fp.write(data[:1])
+            fp.write(data[1:])
+        self.assertEqual(lry.s3.read(BUCKET, key), data)
+        lry.s3.append(gzip.compress(b'world\n'), BUCKET, key)
+        self.assertEqual(lry.s3.read_as(str, BUCKET, key), 'hello\nworld\n')
+        lry.s3.write_as(data, bytes, BUCKET, key, compression='gzip')
+        self.assertEqual(gzip.decompress(lry.s3.read(BUCKET, key)), data)
+
     def test_bucket(self):
         bucket1 = 'larry-testing-create1'
         bucket2 = 'larry-testing-create2'